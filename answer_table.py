@@ -0,0 +1,213 @@
+"""
+Answer Table
+Tabel jawaban yang dihitung di muka untuk seluruh kombinasi input kuesioner
+(industri x tujuan karier x prioritas), sehingga aplikasi dapat menyajikan
+hasil hybrid tanpa menjalankan model ML pada setiap request
+"""
+
+import hashlib
+import json
+import os
+
+from hybrid_recommender import RecommendationResult
+
+
+ANSWER_TABLE_VERSION = 2
+
+
+def file_digest(filepath):
+    """
+    SHA-256 isi file, atau None jika file tidak ada
+    Untuk direktori (mis. dataset kolom), nama dan isi setiap file ikut di-hash
+    """
+    if not os.path.exists(filepath):
+        return None
+
+    if os.path.isdir(filepath):
+        names = sorted(os.listdir(filepath))
+        paths = [os.path.join(filepath, name) for name in names]
+    else:
+        names = [None]
+        paths = [filepath]
+
+    digest = hashlib.sha256()
+    for name, path in zip(names, paths):
+        if name is not None:
+            digest.update(name.encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def artifact_stamp(*paths):
+    """
+    Stempel murah (mtime, size) untuk sekumpulan file
+    Dipakai sebagai kunci cache agar perubahan file terdeteksi tanpa hashing
+    """
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamp.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamp.append((path, None, None))
+    return tuple(stamp)
+
+
+def compute_fingerprint(recommender, dataset_path, model_path, model_digest=None):
+    """
+    Sidik jari semua input yang menentukan isi tabel jawaban
+
+    Args:
+        model_digest: (Opsional) hash model yang sedang dimuat; jika kosong,
+                      file di model_path di-hash
+
+    Returns:
+        Dictionary {rules, weights, dataset, model}
+    """
+    return {
+        'rules': recommender.expert.rules_version,
+        'weights': [recommender.rule_weight, recommender.ml_weight],
+        'dataset': file_digest(dataset_path),
+        'model': model_digest or file_digest(model_path)
+    }
+
+
+class AnswerTable:
+    def __init__(self, fingerprint, entries):
+        self.fingerprint = fingerprint
+        self.entries = entries
+
+    @classmethod
+    def build(cls, recommender, fingerprint):
+        """
+        Menjalankan pipeline hybrid lengkap untuk setiap kombinasi input
+
+        Args:
+            recommender: Instance HybridRecommender
+            fingerprint: Hasil compute_fingerprint()
+
+        Returns:
+            Instance AnswerTable
+        """
+        entries = {}
+        for industry, career_goal, priority in recommender.input_space():
+            result = recommender.recommend(industry, career_goal, priority)
+            entries.setdefault(industry, {}).setdefault(career_goal, {})[priority] = result
+
+        return cls(fingerprint, entries)
+
+    def lookup(self, industry, career_goal, priority):
+        """
+        Mengambil hasil untuk satu kombinasi input
+
+        Returns:
+            RecommendationResult, atau None jika kombinasi tidak ada di tabel
+        """
+        try:
+            return self.entries[industry][career_goal][priority]
+        except KeyError:
+            return None
+
+    def save(self, filepath):
+        """
+        Menyimpan tabel ke file JSON (ditulis ke file sementara lalu di-rename)
+
+        Args:
+            filepath: Path file tabel jawaban
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        entries = {
+            industry: {
+                career_goal: {
+                    priority: {
+                        'ranked': result.ranked,
+                        'rule_scores': result.rule_scores,
+                        'ml_scores': result.ml_scores,
+                        'explanations': result.explanations
+                    }
+                    for priority, result in by_priority.items()
+                }
+                for career_goal, by_priority in by_goal.items()
+            }
+            for industry, by_goal in self.entries.items()
+        }
+        data = {
+            'version': ANSWER_TABLE_VERSION,
+            'fingerprint': self.fingerprint,
+            'entries': entries
+        }
+
+        tmp_path = f"{filepath}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath, fingerprint):
+        """
+        Memuat tabel jawaban jika masih valid
+
+        Args:
+            filepath: Path file tabel jawaban
+            fingerprint: Sidik jari saat ini dari compute_fingerprint()
+
+        Returns:
+            Instance AnswerTable, atau None jika file tidak ada, versinya
+            berbeda, atau dataset/model/rule set/bobot sudah berubah
+        """
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('version') != ANSWER_TABLE_VERSION:
+            return None
+        if data.get('fingerprint') != fingerprint:
+            return None
+
+        entries = {}
+        for industry, by_goal in data['entries'].items():
+            for career_goal, by_priority in by_goal.items():
+                for priority, entry in by_priority.items():
+                    entries.setdefault(industry, {}).setdefault(career_goal, {})[priority] = RecommendationResult(
+                        industry=industry,
+                        career_goal=career_goal,
+                        priority=priority,
+                        candidates=frozenset(entry['rule_scores']),
+                        ranked=[tuple(item) for item in entry['ranked']],
+                        rule_scores=entry['rule_scores'],
+                        ml_scores=entry['ml_scores'],
+                        explanations=entry['explanations']
+                    )
+
+        return cls(data['fingerprint'], entries)
+
+
+def build_and_save_answer_table(dataset_path='data/industry_data.csv',
+                                model_path='models/trained_model.npz',
+                                table_path='models/answer_table.json'):
+    """
+    Utility function untuk membangun tabel jawaban dari model tersimpan
+    Bisa dijalankan terpisah sebelum aplikasi melayani traffic
+    """
+    from hybrid_recommender import HybridRecommender
+
+    recommender = HybridRecommender(model_path=model_path, dataset_path=dataset_path)
+    recommender.load_ml_model()
+
+    fingerprint = compute_fingerprint(recommender, dataset_path, model_path)
+    table = AnswerTable.build(recommender, fingerprint)
+    table.save(table_path)
+
+    print(f"Answer table saved to {table_path}")
+    return table
+
+
+if __name__ == "__main__":
+    build_and_save_answer_table()
@@ -0,0 +1,391 @@
+"""
+API Server
+Endpoint HTTP JSON untuk rekomendasi hybrid, berjalan berdampingan dengan UI Streamlit
+
+Aplikasi ASGI tanpa dependency tambahan. Jalankan dengan uvicorn untuk
+throughput tinggi, atau dengan server bawaan (stdlib) untuk uji lokal.
+Pipeline rekomendasi bersifat sinkron dan dijalankan di thread pool default
+event loop, sehingga request yang lambat (mis. memuat ulang model) tidak
+memblokir request lain pada worker yang sama:
+
+    uvicorn api_server:app --workers 4
+    python api_server.py --port 8000
+
+Endpoint:
+    GET  /health
+    GET  /metrics   (format teks Prometheus)
+    GET  /recommend?industry=...&career_goal=...&priority=...
+    POST /recommend   body JSON {"industry": ..., "career_goal": ..., "priority": ...}
+    POST /feedback    body JSON {"industry": ..., "career_goal": ..., "priority": ...,
+                                 "language": ..., "accepted": true}
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import parse_qs
+
+from answer_table import AnswerTable, compute_fingerprint
+from expert_system import ExpertSystem
+from feedback import FeedbackLog
+from hybrid_recommender import HybridRecommender
+from knowledge_base import KNOWLEDGE_BASE_PATH
+from metrics import CACHE_LOOKUPS, CONTENT_TYPE as METRICS_CONTENT_TYPE, record_recommendation, registry
+from ml_model import load_or_train_model
+from model_registry import ModelRegistry
+from result_cache import ResultCache
+from tracing import span
+
+
+DATASET_PATH = 'data/industry_data.csv'
+MODEL_PATH = 'models/trained_model.npz'
+ANSWER_TABLE_PATH = 'models/answer_table.json'
+
+INPUT_FIELDS = ('industry', 'career_goal', 'priority')
+
+
+class RecommendationService:
+    def __init__(self, recommender=None, table=None, cache=None, feedback_log=None, rules_registry=None,
+                 model_registry=None):
+        """
+        Args:
+            recommender: Instance HybridRecommender (default: model dari MODEL_PATH)
+            table: Instance AnswerTable (opsional); kombinasi yang ada di tabel
+                   dilayani tanpa menjalankan model
+            cache: Instance ResultCache untuk kombinasi di luar tabel
+            feedback_log: Instance FeedbackLog untuk POST /feedback
+            rules_registry: (Opsional) ModelRegistry knowledge base; jika
+                   diisi, rule set baru dipakai tanpa restart saat file berubah
+            model_registry: (Opsional) ModelRegistry model ML; jika diisi,
+                   model baru (retrain atau update feedback) dipakai tanpa restart
+        """
+        self.recommender = recommender if recommender is not None else HybridRecommender(
+            model_path=MODEL_PATH, dataset_path=DATASET_PATH
+        )
+        self.table = table
+        self.cache = cache if cache is not None else ResultCache()
+        self.feedback_log = feedback_log if feedback_log is not None else FeedbackLog()
+        self.rules_registry = rules_registry
+        self.model_registry = model_registry
+
+    @classmethod
+    def from_artifacts(cls):
+        """
+        Membuat service dari artefak di disk (sekali per proses)
+
+        Knowledge base dan model ML dipantau registry sehingga versi baru
+        dipakai tanpa restart; tabel jawaban dipakai jika masih valid,
+        jika tidak dibangun ulang dan disimpan.
+        """
+        rules_registry = ModelRegistry(KNOWLEDGE_BASE_PATH, loader=ExpertSystem)
+        model_registry = ModelRegistry(MODEL_PATH, loader=load_ml_model)
+        active = model_registry.current()
+        recommender = HybridRecommender(
+            expert=rules_registry.current().model, ml_model=active.model,
+            model_path=MODEL_PATH, dataset_path=DATASET_PATH
+        )
+
+        fingerprint = compute_fingerprint(recommender, DATASET_PATH, MODEL_PATH, model_digest=active.digest)
+        table = AnswerTable.load(ANSWER_TABLE_PATH, fingerprint)
+        if table is None:
+            table = AnswerTable.build(recommender, fingerprint)
+            table.save(ANSWER_TABLE_PATH)
+
+        return cls(recommender, table, rules_registry=rules_registry, model_registry=model_registry)
+
+    def refresh(self):
+        """
+        Memakai versi knowledge base dan model ML terbaru dari registry
+
+        Tabel jawaban dan cache dibuat untuk versi lama, sehingga keduanya
+        dikosongkan; kombinasi input dihitung ulang saat diminta.
+        """
+        current = self.recommender
+        expert = current.expert
+        if self.rules_registry is not None:
+            expert = self.rules_registry.current().model
+        ml_model = None
+        if self.model_registry is not None:
+            ml_model = self.model_registry.current().model
+
+        if expert is current.expert and (ml_model is None or ml_model is current.load_ml_model()):
+            return
+
+        self.recommender = HybridRecommender(
+            expert=expert, ml_model=ml_model if ml_model is not None else current.load_ml_model(),
+            rule_weight=current.rule_weight, ml_weight=current.ml_weight,
+            model_path=current.model_path, dataset_path=current.dataset_path
+        )
+        self.table = None
+        self.cache.clear()
+
+    def validate(self, params):
+        """
+        Memeriksa input terhadap kategori yang dikenal rule base
+
+        Returns:
+            Pesan error, atau None jika input valid
+        """
+        expert = self.recommender.expert
+        allowed = {
+            'industry': expert.rules_industry,
+            'career_goal': expert.rules_career_goal,
+            'priority': expert.rules_beginner_priority
+        }
+        for field in INPUT_FIELDS:
+            value = params.get(field)
+            if not value:
+                return f"Parameter '{field}' wajib diisi"
+            if not isinstance(value, str):
+                return f"Parameter '{field}' harus berupa teks"
+            if value not in allowed[field]:
+                return f"Nilai '{value}' tidak dikenal untuk '{field}'. Pilihan: {', '.join(allowed[field])}"
+        return None
+
+    def recommend(self, industry, career_goal, priority):
+        """Hasil rekomendasi dari tabel jawaban, cache, atau recommender"""
+        if self.table is not None:
+            result = self.table.lookup(industry, career_goal, priority)
+            if result is not None:
+                CACHE_LOOKUPS.inc(source='api', result='table')
+                return result
+
+        key = (industry, career_goal, priority)
+        result = self.cache.get(key)
+        if result is not None:
+            CACHE_LOOKUPS.inc(source='api', result='hit')
+            return result
+
+        CACHE_LOOKUPS.inc(source='api', result='miss')
+        result = self.recommender.recommend(industry, career_goal, priority)
+        self.cache.put(key, result)
+        return result
+
+    def feedback(self, params):
+        """Mencatat feedback ke log; model diperbarui oleh feedback.py secara berkala"""
+        language = params.get('language')
+        if not language:
+            return 400, {'error': "Parameter 'language' wajib diisi"}
+        if language not in self.recommender.expert.languages:
+            return 400, {'error': f"Bahasa '{language}' tidak dikenal"}
+
+        accepted = params.get('accepted', True)
+        if not isinstance(accepted, bool):
+            return 400, {'error': "Parameter 'accepted' harus berupa boolean (true/false)"}
+
+        self.feedback_log.append(
+            params['industry'], params['career_goal'], params['priority'],
+            language, accepted=accepted
+        )
+        return 202, {'status': 'accepted'}
+
+    def handle(self, method, path, query_string=b'', body=b''):
+        """
+        Memproses satu request HTTP (tidak bergantung pada server)
+
+        Returns:
+            (status_code, payload) - payload berupa dictionary (JSON) atau
+            string (teks Prometheus untuk /metrics)
+        """
+        self.refresh()
+
+        if path == '/health':
+            return 200, {'status': 'ok', 'rules_version': self.recommender.expert.rules_version}
+
+        if path == '/metrics':
+            return 200, registry.render()
+
+        if path not in ('/recommend', '/feedback'):
+            return 404, {'error': 'Not found'}
+
+        if path == '/feedback' and method != 'POST':
+            return 405, {'error': 'Method not allowed'}
+
+        if method == 'GET':
+            try:
+                query = parse_qs(query_string.decode('utf-8'))
+            except UnicodeDecodeError:
+                return 400, {'error': 'Query string harus berupa UTF-8'}
+            params = {field: query.get(field, [None])[0] for field in INPUT_FIELDS}
+        elif method == 'POST':
+            try:
+                params = json.loads(body or b'{}')
+            except ValueError:
+                return 400, {'error': 'Body harus berupa JSON'}
+            if not isinstance(params, dict):
+                return 400, {'error': 'Body harus berupa objek JSON'}
+        else:
+            return 405, {'error': 'Method not allowed'}
+
+        error = self.validate(params)
+        if error:
+            return 400, {'error': error}
+
+        if path == '/feedback':
+            return self.feedback(params)
+
+        start = time.perf_counter()
+        with span('api.recommend'):
+            result = self.recommend(params['industry'], params['career_goal'], params['priority'])
+        record_recommendation('api', result, time.perf_counter() - start)
+        return 200, result_to_json(result)
+
+
+def load_ml_model(model_path):
+    """Loader model ML untuk registry: dimuat dari file, atau dilatih jika belum ada"""
+    return load_or_train_model(model_path, DATASET_PATH)
+
+
+def encode_payload(payload):
+    """
+    Serialisasi payload respons
+
+    Returns:
+        (content_type, body_bytes)
+    """
+    if isinstance(payload, str):
+        return METRICS_CONTENT_TYPE, payload.encode('utf-8')
+    content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    return 'application/json; charset=utf-8', content
+
+
+def result_to_json(result):
+    """Konversi RecommendationResult ke payload JSON"""
+    return {
+        'input': {
+            'industry': result.industry,
+            'career_goal': result.career_goal,
+            'priority': result.priority
+        },
+        'recommendations': [
+            {
+                'rank': rank,
+                'language': lang,
+                'score': score,
+                'rule_score': result.rule_scores.get(lang, 0),
+                'ml_score': result.ml_scores.get(lang, 0)
+            }
+            for rank, (lang, score) in enumerate(result.ranked, 1)
+        ],
+        'explanations': result.explanations
+    }
+
+
+def create_app(service_factory=RecommendationService.from_artifacts):
+    """
+    Membuat aplikasi ASGI
+
+    Args:
+        service_factory: Callable yang membuat RecommendationService;
+                         dipanggil sekali saat request pertama
+
+    Returns:
+        ASGI callable
+    """
+    state = {'service': None}
+    lock = threading.Lock()
+
+    def get_service():
+        if state['service'] is None:
+            with lock:
+                if state['service'] is None:
+                    state['service'] = service_factory()
+        return state['service']
+
+    async def asgi_app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await asyncio.get_running_loop().run_in_executor(None, get_service)
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+
+        if scope['type'] != 'http':
+            return
+
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        # Pipeline sinkron (rebuild model/tabel, stat file knowledge base,
+        # append log feedback) dijalankan di thread pool agar event loop
+        # worker tetap melayani request lain
+        def handle():
+            return get_service().handle(scope['method'], scope['path'], scope.get('query_string', b''), body)
+
+        status, payload = await asyncio.get_running_loop().run_in_executor(None, handle)
+        content_type, content = encode_payload(payload)
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', content_type.encode('ascii')),
+                (b'content-length', str(len(content)).encode('ascii'))
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': content})
+
+    asgi_app.get_service = get_service
+    return asgi_app
+
+
+# Aplikasi ASGI default: model dimuat sekali per proses worker
+app = create_app()
+
+
+def serve_stdlib(host, port, service):
+    """Menjalankan service dengan ThreadingHTTPServer bawaan Python"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            path, _, query = self.path.partition('?')
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+
+            status, payload = service.handle(self.command, path, query.encode('utf-8'), body)
+            content_type, content = encode_payload(payload)
+
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = _respond
+        do_POST = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"Serving on http://{host}:{port}")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API JSON rekomendasi bahasa pemrograman")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1, help='Jumlah proses worker (uvicorn)')
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        serve_stdlib(args.host, args.port, app.get_service())
+    else:
+        uvicorn.run('api_server:app', host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,24 @@ Sistem Hybrid: Rule-Based Expert System + Machine Learning
 """
 
 import streamlit as st
-import pandas as pd
 import os
+import time
 from expert_system import ExpertSystem
-from ml_model import MLRecommender
+from knowledge_base import KNOWLEDGE_BASE_PATH
+from answer_table import AnswerTable, artifact_stamp, compute_fingerprint
+from hybrid_recommender import HybridRecommender
+from metrics import CACHE_LOOKUPS, ML_FALLBACKS, record_recommendation, registry as metrics_registry
+from model_registry import ModelRegistry
+from tracing import span, tracer
+from result_cache import ResultCache
 from utils.helpers import (
     display_language_card, 
     display_comparison_table,
     display_learning_roadmap,
     display_resources,
     export_to_text,
-    create_score_dataframe
+    create_score_dataframe,
+    get_language_emoji
 )
 
 # Page configuration
@@ -55,34 +62,123 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+DATASET_PATH = 'data/industry_data.csv'
+MODEL_PATH = 'models/trained_model.npz'
+ANSWER_TABLE_PATH = 'models/answer_table.json'
+FEEDBACK_LOG_PATH = 'data/feedback.jsonl'
+
+# Konfigurasi cache hasil (bisa diatur lewat environment variable)
+RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 128))
+RESULT_CACHE_TTL = float(os.environ.get('RESULT_CACHE_TTL', 3600))
+
+# File metrik Prometheus (opsional, untuk textfile collector node_exporter)
+METRICS_FILE = os.environ.get('METRICS_FILE')
+METRICS_FILE_INTERVAL = float(os.environ.get('METRICS_FILE_INTERVAL', 15))
+
+
 @st.cache_resource
+def load_rules_registry():
+    """
+    Registry knowledge base (cached, dibagi bersama oleh semua session)
+    
+    Jika data/knowledge_base.json diubah, rule set baru divalidasi dan
+    dikompilasi di background lalu dipasang tanpa restart; file yang tidak
+    valid ditolak dan rule set lama tetap aktif
+    """
+    return ModelRegistry(KNOWLEDGE_BASE_PATH, loader=ExpertSystem)
+
+
 def load_expert_system():
-    """Load expert system (cached)"""
-    return ExpertSystem()
+    """Expert system dari versi knowledge base yang aktif"""
+    return load_rules_registry().current().model
 
 
-@st.cache_resource
-def load_ml_model():
-    """Load ML model (cached)"""
-    ml = MLRecommender()
+def load_ml_model(model_path=MODEL_PATH):
+    """
+    Load ML model dari file, melatihnya jika belum ada
+    Dipanggil oleh registry model (tidak di-cache di sini)
+    
+    Jika beberapa worker start bersamaan tanpa model, hanya satu yang
+    melatih (file lock); worker lain menunggu lalu memuat hasilnya.
+    Jalankan `python warmup.py` sebelum melayani traffic agar training
+    tidak terjadi di dalam request.
+    """
+    # Import tertunda: stack ML (numpy/sklearn) baru dimuat saat dibutuhkan
+    from ml_model import MLRecommender, load_or_train_model
     
-    # Cek apakah model sudah ada
-    model_path = 'models/trained_model.pkl'
+    # Model sudah ada (file selalu lengkap karena ditulis via rename)
     if os.path.exists(model_path):
-        ml.load_model(model_path)
-    else:
-        # Train model jika belum ada
-        st.info("Training model untuk pertama kali...")
-        result = ml.train('data/industry_data.csv')
-        if result['success']:
-            ml.save_model(model_path)
-            st.success("Model berhasil dilatih!")
-        else:
-            st.error("Gagal melatih model!")
+        ml = MLRecommender()
+        if not ml.load_model(model_path):
+            raise RuntimeError(f"Gagal memuat model dari {model_path}")
+        return ml
+    
+    # Model belum ada: training
+    st.info("Training model untuk pertama kali...")
+    try:
+        ml = load_or_train_model(model_path, DATASET_PATH)
+    except RuntimeError:
+        st.error("Gagal melatih model!")
+        raise
+    st.success("Model berhasil dilatih!")
     
     return ml
 
 
+@st.cache_resource
+def load_model_registry():
+    """
+    Registry model ML (cached, dibagi bersama oleh semua session)
+    
+    Model dimuat saat pertama dibutuhkan; jika file model diganti (retrain),
+    versi baru dimuat di background dan dipasang tanpa restart server
+    """
+    return ModelRegistry(MODEL_PATH, loader=load_ml_model)
+
+
+def get_recommender(active, expert):
+    """Hybrid recommender untuk satu versi model dan rule set (murah: keduanya dibagi bersama)"""
+    return HybridRecommender(
+        expert=expert,
+        ml_model=active.model,
+        model_path=MODEL_PATH,
+        dataset_path=DATASET_PATH
+    )
+
+
+@st.cache_resource(max_entries=2)
+def load_answer_table(model_version, rules_version, dataset_stamp, _active, _expert):
+    """
+    Load tabel jawaban (cached per versi model, versi rule set & stempel dataset)
+    
+    Tabel dibangun ulang otomatis jika dataset, model, atau rule set berubah
+    """
+    recommender = get_recommender(_active, _expert)
+    fingerprint = compute_fingerprint(recommender, DATASET_PATH, MODEL_PATH, model_digest=_active.digest)
+    table = AnswerTable.load(ANSWER_TABLE_PATH, fingerprint)
+    
+    if table is None:
+        table = AnswerTable.build(recommender, fingerprint)
+        table.save(ANSWER_TABLE_PATH)
+    
+    return table
+
+
+@st.cache_resource
+def load_result_cache():
+    """Cache hasil rekomendasi, dibagi bersama oleh semua session"""
+    return ResultCache(max_size=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
+
+def record_feedback(industry, career_goal, priority, language):
+    """Callback tombol feedback: dicatat ke log, model diperbarui oleh feedback.py"""
+    # Import tertunda: feedback memuat ml_model/NumPy, tidak perlu saat cold start
+    from feedback import FeedbackLog
+    
+    FeedbackLog(FEEDBACK_LOG_PATH).append(industry, career_goal, priority, language)
+    st.toast(f"Terima kasih! Feedback untuk {language} dicatat.")
+
+
 def main():
     # Header
     st.markdown('<p class="main-header">🎓 Sistem Pakar Rekomendasi Bahasa Pemrograman</p>', 
@@ -90,8 +186,13 @@ def main():
     st.markdown('<p class="sub-header">Sistem Hybrid untuk Pemula Berdasarkan Kebutuhan Industri IT</p>', 
                 unsafe_allow_html=True)
     
-    # Tabs
-    tab1, tab2, tab3 = st.tabs(["🏠 Beranda", "🔍 Cari Rekomendasi", "ℹ️ Tentang Sistem"])
+    # Tabs (tab Admin tersembunyi, hanya muncul dengan ?admin=1)
+    tab_labels = ["🏠 Beranda", "🔍 Cari Rekomendasi", "ℹ️ Tentang Sistem"]
+    show_admin = st.query_params.get("admin") == "1"
+    if show_admin:
+        tab_labels.append("🛠️ Admin")
+    
+    tab1, tab2, tab3, *admin_tab = st.tabs(tab_labels)
     
     with tab1:
         show_home_page()
@@ -101,6 +202,10 @@ def main():
     
     with tab3:
         show_about_page()
+    
+    if show_admin:
+        with admin_tab[0]:
+            show_admin_page()
 
 
 def show_home_page():
@@ -163,23 +268,25 @@ def show_recommendation_page():
     st.sidebar.header("📋 Kuesioner")
     st.sidebar.markdown("Jawab pertanyaan di bawah untuk mendapatkan rekomendasi:")
     
+    # Pilihan diambil dari knowledge base aktif
+    expert = load_expert_system()
+    
     with st.sidebar.form("input_form"):
         industry = st.selectbox(
             "1️⃣ Bidang Industri yang Diminati:",
-            ["Web Development", "Data Science", "Mobile Development", 
-             "Backend Development", "Game Development"],
+            list(expert.rules_industry),
             help="Pilih bidang IT yang paling Anda minati"
         )
         
         career_goal = st.selectbox(
             "2️⃣ Tujuan Karier:",
-            ["Kerja cepat", "Magang", "Freelance", "Startup"],
+            list(expert.rules_career_goal),
             help="Apa tujuan karier Anda dalam waktu dekat?"
         )
         
         priority = st.selectbox(
             "3️⃣ Prioritas sebagai Pemula:",
-            ["Mudah dipelajari", "Banyak lowongan", "Gaji tinggi"],
+            list(expert.rules_beginner_priority),
             help="Apa yang paling penting bagi Anda?"
         )
         
@@ -187,7 +294,8 @@ def show_recommendation_page():
     
     # Main content area
     if submit_button:
-        process_recommendation(industry, career_goal, priority)
+        with span('app.request'):
+            process_recommendation(industry, career_goal, priority)
     else:
         # Default state - show instructions
         st.info("👈 Silakan isi kuesioner di sidebar untuk mendapatkan rekomendasi bahasa pemrograman!")
@@ -204,6 +312,7 @@ def show_recommendation_page():
             st.metric("Top 3", "PHP 🐘", "72/100")
         
         # Sample chart
+        import pandas as pd
         sample_data = pd.DataFrame({
             'Bahasa': ['Python', 'JavaScript', 'PHP', 'Java'],
             'Skor': [95, 87, 72, 65]
@@ -214,55 +323,97 @@ def show_recommendation_page():
 def process_recommendation(industry, career_goal, priority):
     """
     Memproses rekomendasi menggunakan hybrid system
+    
+    Hasil ditampilkan bertahap tanpa jeda buatan: skor sistem pakar
+    langsung tampil, lalu diganti hasil hybrid lengkap begitu skor ML siap.
+    Hasil per kombinasi input disimpan di cache LRU bersama.
     """
+    start = time.perf_counter()
     st.markdown("## 🎯 Hasil Rekomendasi")
+    results_area = st.empty()
     
-    # Progress bar
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Load systems
-    status_text.text("⚙️ Memuat sistem pakar...")
-    progress_bar.progress(20)
     expert = load_expert_system()
+    registry = load_model_registry()
+    cache = load_result_cache()
     
-    status_text.text("🤖 Memuat model machine learning...")
-    progress_bar.progress(40)
-    ml_model = load_ml_model()
+    def cache_key(active):
+        return (industry, career_goal, priority, active.version, expert.rules_version)
     
-    # TAHAP 1: Rule-Based Expert System
-    status_text.text("📊 Tahap 1: Menjalankan sistem pakar (Rule-Based)...")
-    progress_bar.progress(60)
-    
-    candidates, rule_scores, explanations = expert.infer(industry, career_goal, priority)
-    
-    # TAHAP 2: Machine Learning Scoring
-    status_text.text("🤖 Tahap 2: Menghitung skor ML (Naive Bayes)...")
-    progress_bar.progress(80)
+    # Versi model dipegang sepanjang request ini walaupun registry beralih versi
+    active = registry.current(load=False)
+    with span('app.cache_lookup'):
+        if active is not None:
+            result = cache.get(cache_key(active))
+        else:
+            # Model belum dimuat (cold start): pasti miss, tetap dicatat di statistik cache
+            cache.record_miss()
+            result = None
+    if result is None:
+        CACHE_LOOKUPS.inc(source='app', result='miss')
+        active, result = compute_recommendation(registry, expert, industry, career_goal, priority, results_area)
+        cache.put(cache_key(active), result)
+    else:
+        CACHE_LOOKUPS.inc(source='app', result='hit')
     
-    ml_scores = ml_model.predict_proba(industry, career_goal, priority, candidates)
+    # Tampilkan hasil hybrid lengkap (mengganti hasil sementara)
+    with results_area.container(), span('ui.display_results'):
+        display_results(result.ranked, industry, career_goal, priority, expert,
+                        result.ml_scores, result.rule_scores, result.explanations)
+        st.caption(f"🧠 Versi model: {active.version}")
+        
+        top_lang = result.ranked[0][0]
+        st.button(
+            f"👍 {top_lang} cocok untuk saya",
+            key=f"feedback_{industry}_{career_goal}_{priority}",
+            on_click=record_feedback,
+            args=(industry, career_goal, priority, top_lang)
+        )
     
-    # Gabungkan skor: 60% Rule-Based + 40% ML
-    final_scores = {}
-    for lang in candidates:
-        rule_score = rule_scores.get(lang, 0)
-        ml_score = ml_scores.get(lang, 0)
-        final_scores[lang] = (rule_score * 0.6) + (ml_score * 0.4)
+    record_recommendation('app', result, time.perf_counter() - start)
+    if METRICS_FILE:
+        metrics_registry.write_textfile_if_due(METRICS_FILE, METRICS_FILE_INTERVAL)
+
+
+def compute_recommendation(registry, expert, industry, career_goal, priority, results_area):
+    """
+    Menjalankan tahap expert + ML + gabungan untuk satu kombinasi input
     
-    # Ranking
-    ranked = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
+    Returns:
+        (ModelVersion, RecommendationResult) - versi model yang dipakai dan hasilnya
+    """
+    # TAHAP 1: Rule-Based Expert System (murah, tampil lebih dulu)
+    with span('app.rule_preview'):
+        _, rule_scores, _ = expert.infer(industry, career_goal, priority)
+        
+        with results_area.container():
+            display_rule_preview(rule_scores)
+    
+    # TAHAP 2: Skor ML + gabungan dari tabel jawaban (O(1)); kombinasi di
+    # luar tabel dihitung langsung oleh recommender
+    with span('app.model'):
+        active = registry.current()
+    with span('app.answer_table'):
+        table = load_answer_table(active.version, expert.rules_version, artifact_stamp(DATASET_PATH),
+                                  active, expert)
+        result = table.lookup(industry, career_goal, priority)
+    if result is None:
+        result = get_recommender(active, expert).recommend(industry, career_goal, priority)
+    
+    return active, result
+
+
+def display_rule_preview(rule_scores):
+    """Menampilkan hasil sementara sistem pakar selagi skor ML dihitung"""
+    ranked_rules = sorted(rule_scores.items(), key=lambda x: x[1], reverse=True)
     
-    progress_bar.progress(100)
-    status_text.text("✅ Rekomendasi siap!")
+    st.markdown(f"### 🏆 Ditemukan {len(ranked_rules)} kandidat bahasa pemrograman")
     
-    # Clear progress
-    import time
-    time.sleep(0.5)
-    progress_bar.empty()
-    status_text.empty()
+    cols = st.columns(3)
+    for i, (lang, score) in enumerate(ranked_rules[:3]):
+        with cols[i]:
+            st.metric(f"Top {i+1} (Rule-Based)", f"{lang} {get_language_emoji(lang)}", f"{score:.0f}/100")
     
-    # Display results
-    display_results(ranked, industry, career_goal, priority, expert, ml_scores, rule_scores, explanations)
+    st.caption("🤖 Menghitung skor Machine Learning...")
 
 
 def display_results(ranked, industry, career_goal, priority, expert, ml_scores, rule_scores, explanations):
@@ -286,11 +437,13 @@ def display_results(ranked, industry, career_goal, priority, expert, ml_scores,
     st.markdown("---")
     st.markdown("### 🥇 Top 3 Rekomendasi")
     
-    cols = st.columns(3)
-    for i, (lang, score) in enumerate(ranked[:3]):
-        with cols[i]:
-            info = expert.get_language_info(lang, industry)
-            display_language_card(lang, score, i+1, info, industry)
+    with span('ui.cards'):
+        cols = st.columns(3)
+        for i, (lang, score) in enumerate(ranked[:3]):
+            with cols[i]:
+                with span('ui.language_info'):
+                    info = expert.get_language_info(lang, industry)
+                display_language_card(lang, score, i+1, info, industry)
     
     # Detailed view for top recommendation
     st.markdown("---")
@@ -305,27 +458,30 @@ def display_results(ranked, industry, career_goal, priority, expert, ml_scores,
         "📚 Resources"
     ])
     
-    with detail_tab1:
+    with detail_tab1, span('ui.score_analysis'):
         show_score_analysis(top_lang, top_score, rule_scores, ml_scores, explanations, expert)
     
-    with detail_tab2:
+    with detail_tab2, span('ui.roadmap'):
         display_learning_roadmap(top_lang, industry)
     
-    with detail_tab3:
+    with detail_tab3, span('ui.resources'):
         display_resources(top_lang)
     
     # Comparison table
     st.markdown("---")
     st.markdown("### 📊 Tabel Perbandingan Semua Kandidat")
-    display_comparison_table(ranked, expert)
+    with span('ui.comparison_table'):
+        display_comparison_table(ranked, expert)
     
     # Chart visualization
     st.markdown("### 📈 Visualisasi Skor")
-    chart_data = pd.DataFrame({
-        'Bahasa': [lang for lang, _ in ranked],
-        'Skor': [score for _, score in ranked]
-    })
-    st.bar_chart(chart_data.set_index('Bahasa'), use_container_width=True)
+    with span('ui.chart'):
+        import pandas as pd
+        chart_data = pd.DataFrame({
+            'Bahasa': [lang for lang, _ in ranked],
+            'Skor': [score for _, score in ranked]
+        })
+        st.bar_chart(chart_data.set_index('Bahasa'), use_container_width=True)
     
     # Export option
     st.markdown("---")
@@ -333,7 +489,8 @@ def display_results(ranked, industry, career_goal, priority, expert, ml_scores,
     
     col1, col2 = st.columns(2)
     with col1:
-        text_output = export_to_text(ranked, industry, career_goal, priority, expert)
+        with span('ui.export_text'):
+            text_output = export_to_text(ranked, industry, career_goal, priority, expert)
         st.download_button(
             label="📄 Download sebagai TXT",
             data=text_output,
@@ -508,5 +665,135 @@ def show_about_page():
         """)
 
 
+def show_admin_page():
+    """Halaman admin: statistik cache hasil rekomendasi"""
+    st.markdown("### 🛠️ Admin")
+    
+    cache = load_result_cache()
+    stats = cache.stats()
+    
+    st.markdown("#### 🗄️ Cache Hasil Rekomendasi")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Hit", stats['hits'])
+    with col2:
+        st.metric("Miss", stats['misses'])
+    with col3:
+        st.metric("Eviction", stats['evictions'] + stats['expirations'])
+    with col4:
+        st.metric("Hit Rate", f"{stats['hit_rate']:.1%}")
+    
+    st.caption(
+        f"Ukuran: {stats['size']}/{stats['max_size']} entri · "
+        f"TTL: {stats['ttl']:.0f} detik · Expired: {stats['expirations']}"
+    )
+    
+    if st.button("🧹 Kosongkan Cache"):
+        cache.clear()
+        st.rerun()
+    
+    registry = load_model_registry()
+    registry.check()
+    status = registry.status()
+    
+    st.markdown("#### 🧠 Model ML")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Versi Aktif", status['version'] or "belum dimuat")
+    with col2:
+        st.metric("Reload", status['reloads'])
+    with col3:
+        st.metric("Status", "memuat versi baru..." if status['loading'] else "siap")
+    
+    if status['loaded_at'] is not None:
+        loaded_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(status['loaded_at']))
+        st.caption(f"File: {MODEL_PATH} · Dimuat: {loaded_at}")
+    if status['last_error']:
+        st.error(f"Reload terakhir gagal, versi lama tetap aktif: {status['last_error']}")
+    
+    show_knowledge_base_status()
+    show_tracing_stats()
+    show_metrics()
+
+
+def show_knowledge_base_status():
+    """Bagian admin: versi knowledge base aktif dan status reload"""
+    rules_registry = load_rules_registry()
+    rules_registry.check()
+    status = rules_registry.status()
+    expert = rules_registry.current(load=False)
+    
+    st.markdown("#### 📚 Knowledge Base")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Versi Rule Set", expert.model.rules_version if expert else "belum dimuat")
+    with col2:
+        st.metric("Reload", status['reloads'])
+    with col3:
+        st.metric("Status", "memuat versi baru..." if status['loading'] else "siap")
+    
+    if expert is not None:
+        loaded_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(status['loaded_at']))
+        st.caption(
+            f"File: {os.path.relpath(KNOWLEDGE_BASE_PATH)} · Dimuat: {loaded_at} · "
+            f"{len(expert.model.rules_industry)} industri, {len(expert.model.languages)} bahasa"
+        )
+    if status['last_error']:
+        st.error(f"Knowledge base baru ditolak, versi lama tetap aktif:\n\n{status['last_error']}")
+
+
+def show_metrics():
+    """Bagian admin: metrik Prometheus proses ini"""
+    st.markdown("#### 📈 Metrik")
+    
+    fallbacks = sum(value for *_, value in ML_FALLBACKS.samples())
+    if fallbacks:
+        st.warning(f"⚠️ {fallbacks:.0f} prediksi ML jatuh ke skor default 50.0 (lihat spk_ml_fallback_total)")
+    
+    text = metrics_registry.render()
+    with st.expander("Format teks Prometheus"):
+        st.code(text, language="text")
+    st.download_button(
+        label="📥 Download Metrik",
+        data=text,
+        file_name="metrics.prom",
+        mime="text/plain"
+    )
+
+
+def show_tracing_stats():
+    """Bagian admin: latensi per tahap pipeline (p50/p95/p99)"""
+    st.markdown("#### ⏱️ Latensi per Tahap")
+    
+    enabled = st.checkbox("Aktifkan tracing", value=tracer.enabled,
+                          help="Bisa juga diaktifkan saat start dengan TRACING=1")
+    if enabled != tracer.enabled:
+        tracer.enabled = enabled
+        st.rerun()
+    
+    stats = tracer.stats()
+    if not stats:
+        st.info("Belum ada data tracing. Aktifkan tracing lalu jalankan beberapa rekomendasi.")
+        return
+    
+    import pandas as pd
+    df = pd.DataFrame.from_dict(stats, orient='index')
+    df.index.name = 'Tahap'
+    st.dataframe(df.round(3), use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 Download JSON",
+            data=tracer.to_json(),
+            file_name="tracing_stats.json",
+            mime="application/json"
+        )
+    with col2:
+        if st.button("🧹 Reset Tracing"):
+            tracer.reset()
+            st.rerun()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
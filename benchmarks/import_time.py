@@ -0,0 +1,105 @@
+"""
+Import-Time Benchmark
+Mengukur biaya import (cold start) modul aplikasi menggunakan `python -X importtime`
+
+Contoh:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --root /path/ke/checkout-lain --repeat 5
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modul berat yang seharusnya tidak ikut termuat saat cold start
+HEAVY_MODULES = ['sklearn', 'pandas', 'scipy', 'numpy']
+
+
+def app_top_level_imports(root):
+    """Daftar modul yang diimpor di level teratas app.py"""
+    with open(os.path.join(root, 'app.py'), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return modules
+
+
+def measure(root, modules):
+    """
+    Menjalankan `python -X importtime` untuk sekumpulan modul
+
+    Returns:
+        (total_ms, per_module_ms, loaded_packages)
+    """
+    code = "; ".join(f"import {name}" for name in modules)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=root, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    per_module = {}
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        name = name.rstrip()
+        package = name.strip().split('.')[0]
+        loaded.add(package)
+        # Baris tanpa indentasi = import langsung dari kode yang diukur
+        if not name.startswith('  ') and name.strip() in modules:
+            per_module[name.strip()] = int(cumulative_us) / 1000
+
+    return sum(per_module.values()), per_module, loaded
+
+
+def run(root, repeat):
+    """Mengukur import app.py dan modul inti, mengambil median dari beberapa run"""
+    targets = [
+        ('app.py (top-level imports)', app_top_level_imports(root)),
+        ('expert_system', ['expert_system']),
+        ('ml_model', ['ml_model']),
+    ]
+
+    rows = []
+    for label, modules in targets:
+        totals = []
+        loaded = set()
+        for _ in range(repeat):
+            total, _, loaded = measure(root, modules)
+            totals.append(total)
+        heavy = [name for name in HEAVY_MODULES if name in loaded]
+        rows.append((label, statistics.median(totals), heavy))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--root', default=ROOT, help='Direktori project yang diukur')
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah pengulangan per target')
+    args = parser.parse_args()
+
+    rows = run(args.root, args.repeat)
+
+    print(f"Python {sys.version.split()[0]} - median dari {args.repeat} run\n")
+    print(f"| {'Target':<28} | {'Import (ms)':>11} | {'Modul berat termuat':<30} |")
+    print(f"|{'-' * 30}|{'-' * 13}|{'-' * 32}|")
+    for label, total_ms, heavy in rows:
+        print(f"| {label:<28} | {total_ms:>11.1f} | {', '.join(heavy) or '-':<30} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Large Knowledge Base Benchmark
+Mengukur waktu load/kompilasi, memori indeks, dan latensi infer() pada
+knowledge base sintetis berukuran besar (ratusan hingga ribuan industri,
+bahasa, dan key aturan)
+
+Knowledge base dibangun dari generator deterministik (seed tetap) dan
+divalidasi seperti data/knowledge_base.json. Latensi infer() seharusnya
+sebanding dengan jumlah kandidat per industri, bukan ukuran rule set.
+
+Contoh:
+    python benchmarks/large_kb.py
+    python benchmarks/large_kb.py --sizes 100 1000 5000 --candidates 10 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from expert_system import ExpertSystem
+from knowledge_base import KB_FORMAT, KB_FORMAT_VERSION
+
+
+def make_knowledge_base(n_languages, n_industries=None, n_career_goals=None, n_priorities=None,
+                        n_complexity=10, candidates=20, boost_size=30, seed=0):
+    """
+    Knowledge base sintetis yang valid
+
+    Args:
+        n_languages: Jumlah bahasa di katalog
+        n_industries: Jumlah industri (default: sama dengan n_languages)
+        n_career_goals: Jumlah tujuan karier (default: n_languages // 3)
+        n_priorities: Jumlah prioritas (default: n_languages // 3)
+        n_complexity: Jumlah level kompleksitas
+        candidates: Jumlah bahasa kandidat per industri
+        boost_size: Jumlah bahasa per aturan boost/kompleksitas
+        seed: Seed generator
+
+    Returns:
+        Dictionary knowledge base
+    """
+    rng = random.Random(seed)
+    n_industries = n_industries or n_languages
+    n_career_goals = n_career_goals or max(1, n_languages // 3)
+    n_priorities = n_priorities or max(1, n_languages // 3)
+    languages = [f"Lang{i:05d}" for i in range(n_languages)]
+
+    def pick(k):
+        return rng.sample(languages, min(k, n_languages))
+
+    industries = {
+        f"Industry {i:05d}": {"languages": pick(candidates), "reasoning": f"Industri sintetis {i}"}
+        for i in range(n_industries)
+    }
+    catalog = {
+        lang: {
+            "description": f"Bahasa sintetis {lang}",
+            "use_cases": {industry: f"Use case {lang}" for industry in rng.sample(list(industries), 2)},
+            "pros": ["Sintetis"],
+            "cons": ["Sintetis"],
+            "avg_salary": "-",
+            "learning_time": "-",
+            "resources": [f"{lang} Docs"]
+        }
+        for lang in languages
+    }
+
+    return {
+        "format": KB_FORMAT,
+        "version": KB_FORMAT_VERSION,
+        "base_score": 10,
+        "rules_industry": industries,
+        "rules_career_goal": {
+            f"Goal {i:05d}": {"boost": pick(boost_size), "score": 15, "reasoning": f"Tujuan sintetis {i}"}
+            for i in range(n_career_goals)
+        },
+        "rules_beginner_priority": {
+            f"Priority {i:05d}": {"preferred": pick(boost_size), "score": 20, "reasoning": f"Prioritas sintetis {i}"}
+            for i in range(n_priorities)
+        },
+        "beginner_complexity": {
+            f"Level {i:02d}": {"languages": pick(boost_size), "score": 5 * (i + 1), "reasoning": f"Level {i}"}
+            for i in range(n_complexity)
+        },
+        "languages": catalog
+    }
+
+
+def sample_inputs(expert, n, seed=0):
+    """Kombinasi input acak dari key rule set"""
+    rng = random.Random(seed)
+    industries = list(expert.rules_industry)
+    career_goals = list(expert.rules_career_goal)
+    priorities = list(expert.rules_beginner_priority)
+    return [
+        (rng.choice(industries), rng.choice(career_goals), rng.choice(priorities))
+        for _ in range(n)
+    ]
+
+
+def measure(knowledge_base, n_inputs=1_000, repeat=5):
+    """
+    Mengukur satu knowledge base
+
+    Returns:
+        Dictionary {load_ms, compile_ms, index_mb, infer_us}
+    """
+    start = time.perf_counter()
+    expert = ExpertSystem(knowledge_base=knowledge_base)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Kompilasi ulang saja (tanpa validasi) sambil mengukur memori indeks
+    start = time.perf_counter()
+    expert.compile_rules()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    expert.compile_rules()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    inputs = sample_inputs(expert, n_inputs)
+
+    def run():
+        for combo in inputs:
+            expert.infer(*combo)
+
+    samples = timeit.repeat(run, number=1, repeat=repeat)
+    return {
+        'load_ms': load_ms,
+        'compile_ms': compile_ms,
+        'index_mb': peak / 2**20,
+        'infer_us': statistics.median(samples) / n_inputs * 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 3_000],
+                        help='Jumlah bahasa (dan industri) knowledge base sintetis')
+    parser.add_argument('--candidates', type=int, nargs='+', default=[5, 20, 100],
+                        help='Jumlah kandidat per industri')
+    parser.add_argument('--inputs', type=int, default=1_000, help='Jumlah kombinasi input yang diukur')
+    args = parser.parse_args()
+
+    print(f"| {'Bahasa':>7} | {'Kandidat':>8} | {'Entri aturan':>12} | {'Load (ms)':>9} | "
+          f"{'Kompilasi (ms)':>14} | {'Indeks (MB)':>11} | {'infer (us)':>10} |")
+    print(f"|{'-' * 9}|{'-' * 10}|{'-' * 14}|{'-' * 11}|{'-' * 16}|{'-' * 13}|{'-' * 12}|")
+
+    for n_languages in args.sizes:
+        for candidates in args.candidates:
+            knowledge_base = make_knowledge_base(n_languages, candidates=candidates)
+            n_entries = sum(
+                len(rule.get('languages') or rule.get('boost') or rule.get('preferred'))
+                for rule_set in ('rules_industry', 'rules_career_goal',
+                                 'rules_beginner_priority', 'beginner_complexity')
+                for rule in knowledge_base[rule_set].values()
+            )
+            result = measure(knowledge_base, args.inputs)
+            print(f"| {n_languages:>7} | {min(candidates, n_languages):>8} | {n_entries:>12} | "
+                  f"{result['load_ms']:>9.1f} | {result['compile_ms']:>14.1f} | "
+                  f"{result['index_mb']:>11.1f} | {result['infer_us']:>10.2f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Benchmark Suite
+Mengukur hot path sistem (rule inference, scoring ML, blending, export, dan
+pipeline hybrid lengkap) secara reproducible, menyimpan hasil sebagai JSON,
+dan membandingkan dua hasil untuk mendeteksi regresi
+
+Contoh:
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --output after.json --compare baseline.json
+    python benchmarks/suite.py --compare baseline.json --current after.json --fail-on-regression
+    python benchmarks/suite.py --filter infer --list
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+SUITE_VERSION = 1
+
+DATASET_PATH = os.path.join(ROOT, 'data', 'industry_data.csv')
+MODEL_PATH = os.path.join(ROOT, 'models', 'trained_model.npz')
+
+# Registry benchmark: nama -> fungsi setup(context) yang mengembalikan (callable, ops)
+# ops = jumlah operasi per panggilan callable, hasil dilaporkan per operasi
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Decorator untuk mendaftarkan benchmark"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+class Context:
+    """Objek bersama yang dibuat sekali dan dipakai oleh semua benchmark"""
+
+    def __init__(self, train_sizes):
+        self.train_sizes = train_sizes
+        self._cache = {}
+
+    def get(self, key, factory):
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    @property
+    def expert(self):
+        from expert_system import ExpertSystem
+        return self.get('expert', ExpertSystem)
+
+    @property
+    def ml(self):
+        def load():
+            from ml_model import MLRecommender
+            ml = MLRecommender()
+            with contextlib.redirect_stdout(io.StringIO()):
+                if not ml.load_model(MODEL_PATH):
+                    ml.train(DATASET_PATH)
+            return ml
+        return self.get('ml', load)
+
+    @property
+    def recommender(self):
+        def build():
+            from hybrid_recommender import HybridRecommender
+            return HybridRecommender(expert=self.expert, ml_model=self.ml)
+        return self.get('recommender', build)
+
+    @property
+    def inputs(self):
+        """Seluruh kombinasi input kuesioner"""
+        expert = self.expert
+        return self.get('inputs', lambda: list(itertools.product(
+            expert.rules_industry, expert.rules_career_goal, expert.rules_beginner_priority
+        )))
+
+    @property
+    def tmpdir(self):
+        return self.get('tmpdir', tempfile.TemporaryDirectory).name
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+@benchmark('expert.infer')
+def bench_infer(ctx):
+    expert, inputs = ctx.expert, ctx.inputs
+
+    def run():
+        for combo in inputs:
+            expert.infer(*combo)
+    return run, len(inputs)
+
+
+@benchmark('expert.infer[large]')
+def bench_infer_large(ctx):
+    # Knowledge base sintetis 3000 bahasa/industri, 20 kandidat per industri
+    from expert_system import ExpertSystem
+    from large_kb import make_knowledge_base, sample_inputs
+    expert = ExpertSystem(knowledge_base=make_knowledge_base(3_000))
+    inputs = sample_inputs(expert, 1_000)
+
+    def run():
+        for combo in inputs:
+            expert.infer(*combo)
+    return run, len(inputs)
+
+
+@benchmark('expert.infer_all')
+def bench_infer_all(ctx):
+    return ctx.expert.infer_all, 1
+
+
+@benchmark('expert.get_language_info')
+def bench_language_info(ctx):
+    expert = ctx.expert
+    pairs = list(itertools.product(expert.languages, expert.rules_industry))
+
+    def run():
+        for lang, industry in pairs:
+            expert.get_language_info(lang, industry)
+    return run, len(pairs)
+
+
+@benchmark('ml.predict_proba')
+def bench_predict_proba(ctx):
+    expert, ml = ctx.expert, ctx.ml
+    cases = [(combo, expert.infer(*combo)[0]) for combo in ctx.inputs]
+
+    def run():
+        for combo, candidates in cases:
+            ml.predict_proba(*combo, candidates)
+    return run, len(cases)
+
+
+@benchmark('ml.predict_proba_batch')
+def bench_predict_proba_batch(ctx):
+    ml, inputs = ctx.ml, ctx.inputs
+    data = {
+        'industry': [combo[0] for combo in inputs],
+        'career_goal': [combo[1] for combo in inputs],
+        'priority': [combo[2] for combo in inputs]
+    }
+    return (lambda: ml.predict_proba_batch(data)), len(inputs)
+
+
+@benchmark('hybrid.blend')
+def bench_blend(ctx):
+    recommender = ctx.recommender
+    cases = []
+    for combo in ctx.inputs:
+        candidates, rule_scores, _ = recommender.infer_rules(*combo)
+        cases.append((candidates, rule_scores, recommender.score_ml(*combo, candidates)))
+
+    def run():
+        for candidates, rule_scores, ml_scores in cases:
+            recommender.blend(candidates, rule_scores, ml_scores)
+    return run, len(cases)
+
+
+@benchmark('hybrid.recommend')
+def bench_recommend(ctx):
+    recommender, inputs = ctx.recommender, ctx.inputs
+
+    def run():
+        for combo in inputs:
+            recommender.recommend(*combo)
+    return run, len(inputs)
+
+
+@benchmark('helpers.export_to_text')
+def bench_export_to_text(ctx):
+    from utils.helpers import export_to_text
+
+    expert = ctx.expert
+    cases = [(ctx.recommender.recommend(*combo).ranked, combo) for combo in ctx.inputs]
+
+    def run():
+        for ranked, combo in cases:
+            export_to_text(ranked, *combo, expert)
+    return run, len(cases)
+
+
+def _train_benchmark(n_rows):
+    def setup(ctx):
+        from ml_model import MLRecommender
+        from train_memory import make_dataset
+
+        path = os.path.join(ctx.tmpdir, f'industry_{n_rows}.csv')
+        make_dataset(path, n_rows)
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                MLRecommender().train(path)
+        return run, 1
+    return setup
+
+
+def register_train_benchmarks(sizes):
+    for n_rows in sizes:
+        benchmark(f'ml.train[{n_rows}]')(_train_benchmark(n_rows))
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def time_benchmark(func, ops, repeat):
+    """
+    Mengukur satu benchmark: jumlah loop dikalibrasi seperti timeit
+    (autorange, minimal 0.2 detik per sampel), lalu diulang `repeat` kali
+
+    Returns:
+        Dictionary statistik waktu per operasi (detik)
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [t / (number * ops) for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'loops': number,
+        'ops': ops,
+        'repeat': repeat
+    }
+
+
+def environment():
+    """Informasi lingkungan yang memengaruhi hasil benchmark"""
+    versions = {}
+    for name in ('numpy', 'pandas', 'sklearn', 'streamlit'):
+        try:
+            versions[name] = __import__(name).__version__
+        except ImportError:
+            versions[name] = None
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions
+    }
+
+
+def run_suite(names, train_sizes, repeat):
+    """
+    Menjalankan benchmark terpilih
+
+    Returns:
+        Dictionary hasil {suite_version, environment, results}
+    """
+    ctx = Context(train_sizes)
+    results = {}
+    for name in names:
+        func, ops = BENCHMARKS[name](ctx)
+        results[name] = time_benchmark(func, ops, repeat)
+        print(f"  {name:<32} {format_time(results[name]['median']):>12}")
+
+    return {
+        'suite_version': SUITE_VERSION,
+        'environment': environment(),
+        'results': results
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Membandingkan median dua hasil benchmark
+
+    Args:
+        threshold: Perubahan relatif minimum yang dianggap bermakna (0.1 = 10%)
+
+    Returns:
+        (rows, regressions) - baris tabel (name, base, current, ratio, status)
+        dan daftar nama benchmark yang melambat di atas threshold
+    """
+    rows = []
+    regressions = []
+    base_results = baseline['results']
+    for name, result in current['results'].items():
+        if name not in base_results:
+            rows.append((name, None, result['median'], None, 'baru'))
+            continue
+        base = base_results[name]['median']
+        ratio = result['median'] / base
+        if ratio > 1 + threshold:
+            status = 'LEBIH LAMBAT'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = 'lebih cepat'
+        else:
+            status = '~'
+        rows.append((name, base, result['median'], ratio, status))
+    return rows, regressions
+
+
+def format_time(seconds):
+    """Format waktu per operasi dengan satuan yang sesuai"""
+    if seconds is None:
+        return '-'
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def print_comparison(rows, baseline, current):
+    base_env, cur_env = baseline['environment'], current['environment']
+    print(f"\nBaseline: {base_env.get('commit')} ({base_env.get('created')})")
+    print(f"Current:  {cur_env.get('commit')} ({cur_env.get('created')})\n")
+    print(f"| {'Benchmark':<32} | {'Baseline':>12} | {'Current':>12} | {'Rasio':>6} | {'Status':<12} |")
+    print(f"|{'-' * 34}|{'-' * 14}|{'-' * 14}|{'-' * 8}|{'-' * 14}|")
+    for name, base, cur, ratio, status in rows:
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else '-'
+        print(f"| {name:<32} | {format_time(base):>12} | {format_time(cur):>12} | {ratio_text:>6} | {status:<12} |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    parser.add_argument('--compare', metavar='BASELINE', help='Bandingkan dengan hasil JSON sebelumnya')
+    parser.add_argument('--current', metavar='RESULT',
+                        help='Hasil JSON yang dibandingkan (default: jalankan suite sekarang)')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Ambang perubahan relatif median (default: 0.10)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit code 1 jika ada benchmark yang melambat di atas ambang')
+    parser.add_argument('--filter', default='', help='Hanya jalankan benchmark yang namanya mengandung teks ini')
+    parser.add_argument('--train-sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Ukuran dataset sintetis untuk benchmark ml.train')
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah sampel per benchmark')
+    parser.add_argument('--list', action='store_true', help='Tampilkan daftar benchmark lalu keluar')
+    args = parser.parse_args()
+
+    register_train_benchmarks(args.train_sizes)
+    names = [name for name in BENCHMARKS if args.filter in name]
+
+    if args.list:
+        print("\n".join(names))
+        return
+
+    if args.current:
+        with open(args.current, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        print(f"Menjalankan {len(names)} benchmark (median per operasi):")
+        current = run_suite(names, args.train_sizes, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nHasil disimpan di {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows, regressions = compare(baseline, current, args.threshold)
+        print_comparison(rows, baseline, current)
+
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} benchmark melambat > {args.threshold:.0%}: {', '.join(regressions)}")
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Time-to-First-Result Benchmark
+Membandingkan waktu sampai hasil tampil antara alur lama (progress bar
+bertahap + time.sleep(0.5)) dan alur streaming (skor sistem pakar tampil
+dulu, hasil hybrid menyusul)
+
+Dua pengukuran:
+- End-to-end (opsional, --before-root): app.py asli dijalankan dengan
+  Streamlit AppTest, lalu diukur durasi satu rerun setelah tombol
+  rekomendasi diklik. Dengan --before-root berisi checkout commit lama,
+  kedua alur diukur dari kode aplikasi yang sebenarnya.
+- Tahap komputasi (simulasi): alur lama direkonstruksi sebagai inference +
+  scoring + time.sleep(0.5) tanpa Streamlit. Angka "sebelum" pada tabel ini
+  sebagian besar adalah jeda yang dihapus, bukan hasil menjalankan kode lama.
+
+Contoh:
+    python benchmarks/time_to_first_result.py --iterations 3
+    git worktree add /tmp/before 7e72fa0^
+    python benchmarks/time_to_first_result.py --before-root /tmp/before
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from expert_system import ExpertSystem
+from ml_model import MLRecommender
+from answer_table import AnswerTable
+from hybrid_recommender import HybridRecommender, blend_scores
+
+
+# Jeda buatan pada alur lama sebelum hasil ditampilkan
+LEGACY_SLEEP = 0.5
+
+
+def staged_request(expert, ml_model, industry, career_goal, priority):
+    """
+    Alur lama: semua tahap selesai, lalu jeda 0.5 detik sebelum render
+
+    Returns:
+        (time_to_first_result, time_to_full_result) dalam detik
+    """
+    start = time.perf_counter()
+    candidates, rule_scores, _ = expert.infer(industry, career_goal, priority)
+    ml_scores = ml_model.predict_proba(industry, career_goal, priority, candidates)
+    blend_scores(candidates, rule_scores, ml_scores)
+    time.sleep(LEGACY_SLEEP)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+def streaming_request(expert, table, industry, career_goal, priority):
+    """
+    Alur streaming: skor sistem pakar tampil segera, hasil hybrid dari tabel jawaban
+
+    Returns:
+        (time_to_first_result, time_to_full_result) dalam detik
+    """
+    start = time.perf_counter()
+    expert.infer(industry, career_goal, priority)
+    first = time.perf_counter() - start
+    table.lookup(industry, career_goal, priority)
+    full = time.perf_counter() - start
+    return first, full
+
+
+def apptest_runs(root, clicks):
+    """
+    Durasi rerun app.py (detik) setelah tombol rekomendasi diklik
+
+    Dijalankan di subprocess dengan cwd=root agar modul dari checkout
+    tersebut yang diimpor. Klik pertama (memuat model) tidak dihitung.
+    """
+    code = (
+        "import json, sys, time\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        "at = AppTest.from_file('app.py', default_timeout=300)\n"
+        "at.run()\n"
+        "samples = []\n"
+        f"for i in range({clicks + 1}):\n"
+        "    at.sidebar.button[0].click()\n"
+        "    start = time.perf_counter()\n"
+        "    at.run()\n"
+        "    if at.exception:\n"
+        "        raise SystemExit(str(at.exception))\n"
+        "    if i:\n"
+        "        samples.append(time.perf_counter() - start)\n"
+        "print(json.dumps(samples))\n"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"AppTest gagal di {root}: {proc.stderr.strip().splitlines()[-1]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    """p50/p95 dalam milidetik"""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(ordered) * 1000, p95 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=1,
+                        help='Jumlah putaran atas seluruh kombinasi input')
+    parser.add_argument('--model', default=os.path.join(ROOT, 'models', 'trained_model.npz'))
+    parser.add_argument('--before-root', help='Checkout commit lama untuk pengukuran end-to-end dengan AppTest')
+    parser.add_argument('--clicks', type=int, default=10, help='Jumlah klik per alur pada pengukuran AppTest')
+    args = parser.parse_args()
+
+    if args.before_root:
+        print(f"End-to-end app.py (Streamlit AppTest, {args.clicks} klik per alur)\n")
+        print(f"| {'Alur':<26} | {'Rerun p50 (ms)':>14} | {'Rerun p95 (ms)':>14} |")
+        print(f"|{'-' * 28}|{'-' * 16}|{'-' * 16}|")
+        for label, root in (('sebelum', args.before_root), ('sesudah', ROOT)):
+            p50, p95 = summarize(apptest_runs(root, args.clicks))
+            print(f"| {label + ' (' + os.path.basename(os.path.abspath(root)) + ')':<26} | "
+                  f"{p50:>14.1f} | {p95:>14.1f} |")
+        print()
+
+    expert = ExpertSystem()
+    ml_model = MLRecommender()
+    if not ml_model.load_model(args.model):
+        ml_model.train(os.path.join(ROOT, 'data', 'industry_data.csv'))
+    recommender = HybridRecommender(expert=expert, ml_model=ml_model)
+    table = AnswerTable.build(recommender, fingerprint=None)
+
+    inputs = recommender.input_space()
+
+    before_label = 'simulasi staged + sleep'
+    results = {before_label: ([], []), 'sesudah (streaming)': ([], [])}
+    for _ in range(args.iterations):
+        for combo in inputs:
+            first, full = staged_request(expert, ml_model, *combo)
+            results[before_label][0].append(first)
+            results[before_label][1].append(full)
+
+            first, full = streaming_request(expert, table, *combo)
+            results['sesudah (streaming)'][0].append(first)
+            results['sesudah (streaming)'][1].append(full)
+
+    print(f"Tahap komputasi saja (simulasi alur lama, tanpa Streamlit): "
+          f"{len(inputs) * args.iterations} request per alur\n")
+    print(f"| {'Alur':<26} | {'TTFR p50 (ms)':>13} | {'TTFR p95 (ms)':>13} | {'Full p50 (ms)':>13} |")
+    print(f"|{'-' * 28}|{'-' * 15}|{'-' * 15}|{'-' * 15}|")
+    for label, (first, full) in results.items():
+        first_p50, first_p95 = summarize(first)
+        full_p50, _ = summarize(full)
+        print(f"| {label:<26} | {first_p50:>13.3f} | {first_p95:>13.3f} | {full_p50:>13.3f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Training Memory/Throughput Benchmark
+Membandingkan training penuh (pd.read_csv seluruh file), training
+streaming per chunk (partial_fit), dan training dari dataset kolom biner
+(memory-mapped) pada dataset sintetis berbagai ukuran
+
+Memori puncak diukur dengan tracemalloc (alokasi Python + NumPy/pandas).
+
+Contoh:
+    python benchmarks/train_memory.py --sizes 100000 1000000 --chunksize 100000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataset_store import convert_csv
+from ml_model import MLRecommender
+
+
+def make_dataset(path, n_rows, seed=0):
+    """Dataset sintetis: baris data/industry_data.csv di-sampling ulang hingga n_rows"""
+    import pandas as pd
+
+    base = pd.read_csv(os.path.join(ROOT, 'data', 'industry_data.csv'))
+    base.sample(n_rows, replace=True, random_state=seed).to_csv(path, index=False)
+
+
+def measure(dataset_path, chunksize):
+    """
+    Melatih satu model sambil mengukur waktu dan memori puncak
+
+    Returns:
+        (seconds, peak_mb, accuracy)
+    """
+    ml = MLRecommender()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = ml.train(dataset_path, chunksize=chunksize)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if not result['success']:
+        raise RuntimeError(result['error'])
+    return elapsed, peak / 2**20, result['accuracy']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 500_000, 1_000_000],
+                        help='Jumlah baris dataset sintetis')
+    parser.add_argument('--chunksize', type=int, default=100_000, help='Baris per chunk untuk mode streaming')
+    args = parser.parse_args()
+
+    # Import pandas/sklearn di luar pengukuran
+    import pandas  # noqa: F401
+    import sklearn.naive_bayes  # noqa: F401
+
+    print(f"| {'Baris':>10} | {'Mode':<10} | {'Waktu (s)':>9} | {'Baris/s':>10} | {'Peak (MB)':>9} |")
+    print(f"|{'-' * 12}|{'-' * 12}|{'-' * 11}|{'-' * 12}|{'-' * 11}|")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.sizes:
+            path = os.path.join(tmp, f'industry_{n_rows}.csv')
+            make_dataset(path, n_rows)
+            cols_path = os.path.join(tmp, f'industry_{n_rows}.cols')
+            convert_csv(path, cols_path, args.chunksize)
+
+            runs = [
+                ('penuh', path, None),
+                ('chunked', path, args.chunksize),
+                ('kolom', cols_path, None)
+            ]
+            for label, dataset_path, chunksize in runs:
+                elapsed, peak_mb, _ = measure(dataset_path, chunksize)
+                print(f"| {n_rows:>10} | {label:<10} | {elapsed:>9.2f} | {n_rows / elapsed:>10.0f} | {peak_mb:>9.1f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Script untuk rekomendasi massal (offline) dari file CSV jawaban kuesioner
+Setiap baris input diproses dengan pipeline hybrid yang sama dengan aplikasi
+Streamlit, dibagi ke beberapa proses worker dan ditulis bertahap per chunk
+
+Contoh:
+    python bulk_recommend.py students.csv recommendations.csv --workers 8 --chunk-size 200000
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from hybrid_recommender import HybridRecommender
+
+
+INPUT_COLUMNS = ['industry', 'career_goal', 'priority']
+
+# Recommender per proses worker (dimuat sekali oleh initializer)
+_recommender = None
+_memo = {}
+
+
+def _init_worker(model_path, dataset_path):
+    """Initializer worker: memuat model sekali per proses"""
+    global _recommender, _memo
+    _recommender = HybridRecommender(model_path=model_path, dataset_path=dataset_path)
+    _recommender.load_ml_model()
+    _memo = {}
+
+
+def _recommend_row(industry, career_goal, priority):
+    """Hasil terformat untuk satu baris, di-memo per kombinasi input"""
+    key = (industry, career_goal, priority)
+    row = _memo.get(key)
+    if row is None:
+        result = _recommender.recommend(industry, career_goal, priority)
+        row = (
+            result.top_language or '',
+            ';'.join(lang for lang, _ in result.ranked),
+            ';'.join(f"{score:.4f}" for _, score in result.ranked)
+        )
+        _memo[key] = row
+    return row
+
+
+def process_chunk(chunk):
+    """
+    Menambahkan kolom rekomendasi ke satu chunk DataFrame
+
+    Kolom baru:
+        top_language: Bahasa dengan skor hybrid tertinggi
+        ranking: Semua kandidat terurut, dipisah ';'
+        scores: Skor hybrid sesuai urutan ranking, dipisah ';'
+    """
+    rows = [
+        _recommend_row(industry, career_goal, priority)
+        for industry, career_goal, priority in zip(
+            chunk['industry'], chunk['career_goal'], chunk['priority']
+        )
+    ]
+    chunk = chunk.copy()
+    chunk['top_language'] = [row[0] for row in rows]
+    chunk['ranking'] = [row[1] for row in rows]
+    chunk['scores'] = [row[2] for row in rows]
+    return chunk
+
+
+def bulk_recommend(input_path, output_path, workers=None, chunk_size=100_000,
+                   model_path='models/trained_model.npz', dataset_path='data/industry_data.csv'):
+    """
+    Memproses file CSV besar secara streaming
+
+    Memori terbatas: paling banyak 2 x workers chunk yang sedang diproses,
+    dan hasil ditulis ke output sesuai urutan input.
+
+    Args:
+        input_path: CSV dengan kolom industry, career_goal, priority
+        output_path: Path CSV hasil
+        workers: Jumlah proses worker (default: jumlah CPU; 1 = tanpa pool)
+        chunk_size: Jumlah baris per chunk
+
+    Returns:
+        Jumlah baris yang diproses
+    """
+    import pandas as pd
+
+    workers = workers or os.cpu_count() or 1
+    reader = pd.read_csv(input_path, dtype=str, keep_default_na=False, chunksize=chunk_size)
+
+    n_rows = 0
+    header = True
+
+    def write(chunk):
+        nonlocal n_rows, header
+        chunk.to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        n_rows += len(chunk)
+
+    if workers == 1:
+        _init_worker(model_path, dataset_path)
+        for chunk in reader:
+            _check_columns(chunk)
+            write(process_chunk(chunk))
+        return n_rows
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_path, dataset_path)) as pool:
+        pending = deque()
+        for chunk in reader:
+            _check_columns(chunk)
+            pending.append(pool.submit(process_chunk, chunk))
+            if len(pending) >= workers * 2:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+
+    return n_rows
+
+
+def _check_columns(chunk):
+    missing = [col for col in INPUT_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan di input: {', '.join(missing)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rekomendasi massal dari CSV jawaban kuesioner")
+    parser.add_argument('input', help='CSV input (kolom industry, career_goal, priority)')
+    parser.add_argument('output', help='CSV output')
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='Jumlah baris per chunk')
+    parser.add_argument('--model', default='models/trained_model.npz', help='Path model')
+    parser.add_argument('--dataset', default='data/industry_data.csv', help='Dataset jika model perlu dilatih')
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("BULK RECOMMENDATION")
+    print("="*60 + "\n")
+
+    start = time.perf_counter()
+    n_rows = bulk_recommend(args.input, args.output, args.workers, args.chunk_size,
+                            args.model, args.dataset)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {n_rows} baris diproses dalam {elapsed:.1f} detik")
+    print(f"📁 Hasil: {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Dataset Store
+Format kolom biner untuk dataset training: setiap kolom disimpan sebagai
+kode integer (.npy) dengan vocabulary terpisah (vocab.json), sehingga
+training cukup me-memory-map array tanpa parsing CSV
+
+Layout direktori:
+    <dataset>/vocab.json     {"version", "n_rows", "columns": {kolom: [kategori terurut]}}
+    <dataset>/<kolom>.npy    kode integer per baris (int8/int16/int32)
+
+Contoh:
+    python dataset_store.py data/industry_data.csv data/industry_data.cols
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+
+DATASET_STORE_VERSION = 1
+VOCAB_FILE = 'vocab.json'
+
+
+def is_columnar(path):
+    """True jika path adalah direktori dataset kolom"""
+    return os.path.isfile(os.path.join(path, VOCAB_FILE))
+
+
+def _code_dtype(n_categories):
+    """Tipe integer terkecil yang memuat semua kode kategori"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class ColumnarDataset:
+    def __init__(self, path, vocab, n_rows, mmap=True):
+        """
+        Args:
+            path: Direktori dataset kolom
+            vocab: Dictionary {kolom: array kategori terurut}
+            n_rows: Jumlah baris
+            mmap: Jika True, kolom di-memory-map (read-only) saat diakses
+        """
+        self.path = path
+        self.vocab = vocab
+        self.n_rows = n_rows
+        self.mmap = mmap
+
+    @property
+    def columns(self):
+        return list(self.vocab)
+
+    @classmethod
+    def open(cls, path, mmap=True):
+        """
+        Membuka dataset kolom dari direktori
+
+        Returns:
+            Instance ColumnarDataset
+        """
+        with open(os.path.join(path, VOCAB_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        if meta.get('version') != DATASET_STORE_VERSION:
+            raise ValueError(f"Versi dataset kolom tidak didukung: {meta.get('version')}")
+
+        vocab = {col: np.array(values, dtype=object) for col, values in meta['columns'].items()}
+        return cls(path, vocab, meta['n_rows'], mmap)
+
+    def codes(self, col):
+        """Kode integer satu kolom (memory-mapped jika mmap=True)"""
+        if col not in self.vocab:
+            raise ValueError(f"Column {col} not found in dataset")
+        return np.load(os.path.join(self.path, f'{col}.npy'),
+                       mmap_mode='r' if self.mmap else None)
+
+    def decode(self, col):
+        """Nilai kategori asli satu kolom (untuk inspeksi/debug)"""
+        return self.vocab[col][self.codes(col)]
+
+
+def convert_csv(csv_path, output_dir, chunksize=100_000):
+    """
+    Mengonversi CSV ke dataset kolom
+
+    CSV dibaca dua kali per chunk: pass 1 mengumpulkan vocabulary (diurutkan
+    seperti LabelEncoder), pass 2 menulis kode ke file .npy yang sudah
+    dialokasikan penuh, sehingga memori tidak bergantung ukuran file.
+
+    Args:
+        csv_path: Path CSV sumber
+        output_dir: Direktori tujuan (dibuat jika belum ada)
+        chunksize: Jumlah baris per chunk
+
+    Returns:
+        Instance ColumnarDataset hasil konversi
+    """
+    import pandas as pd
+
+    def read_chunks(dtype):
+        return pd.read_csv(csv_path, dtype=dtype, keep_default_na=False, chunksize=chunksize)
+
+    # Pass 1: vocabulary dan jumlah baris
+    vocab = None
+    n_rows = 0
+    for chunk in read_chunks(dtype=str):
+        if vocab is None:
+            vocab = {col: set() for col in chunk.columns}
+        for col in chunk.columns:
+            vocab[col].update(chunk[col].unique())
+        n_rows += len(chunk)
+
+    if vocab is None:
+        raise ValueError(f"Dataset kosong: {csv_path}")
+    vocab = {col: sorted(values) for col, values in vocab.items()}
+
+    # Pass 2: kode integer langsung dari parser (dtype kategori tetap)
+    os.makedirs(output_dir, exist_ok=True)
+    vocab_path = os.path.join(output_dir, VOCAB_FILE)
+    if os.path.exists(vocab_path):
+        os.remove(vocab_path)
+    arrays = {
+        col: np.lib.format.open_memmap(
+            os.path.join(output_dir, f'{col}.npy'), mode='w+',
+            dtype=_code_dtype(len(values)), shape=(n_rows,)
+        )
+        for col, values in vocab.items()
+    }
+    dtypes = {col: pd.CategoricalDtype(values) for col, values in vocab.items()}
+
+    start = 0
+    for chunk in read_chunks(dtype=dtypes):
+        stop = start + len(chunk)
+        for col, array in arrays.items():
+            array[start:stop] = chunk[col].cat.codes.to_numpy()
+        start = stop
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    # vocab.json ditulis terakhir: direktori baru dianggap valid setelah semua kolom lengkap
+    meta = {'version': DATASET_STORE_VERSION, 'n_rows': n_rows, 'columns': vocab}
+    tmp_path = os.path.join(output_dir, f"{VOCAB_FILE}.tmp.{os.getpid()}")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, vocab_path)
+
+    return ColumnarDataset.open(output_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Konversi dataset CSV ke format kolom biner")
+    parser.add_argument('input', help='CSV sumber')
+    parser.add_argument('output', help='Direktori dataset kolom')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='Jumlah baris per chunk')
+    args = parser.parse_args()
+
+    dataset = convert_csv(args.input, args.output, args.chunk_size)
+    print(f"✅ {dataset.n_rows} baris, {len(dataset.columns)} kolom disimpan di {args.output}")
+
+
+if __name__ == "__main__":
+    main()
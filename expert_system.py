@@ -1,101 +1,235 @@
 """
 Rule-Based Expert System
 Sistem pakar berbasis aturan IF-THEN untuk filtering bahasa pemrograman
+
+Rule set dan katalog bahasa dimuat dari data/knowledge_base.json (lihat
+knowledge_base.py), divalidasi, lalu dikompilasi menjadi indeks saat load.
 """
 
+import hashlib
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+from knowledge_base import KNOWLEDGE_BASE_PATH, KnowledgeBaseError, load_knowledge_base, validate
+
+
+class LanguageRecord(NamedTuple):
+    """Record immutable informasi satu bahasa pemrograman"""
+    description: str
+    use_cases: Mapping
+    pros: tuple
+    cons: tuple
+    avg_salary: str
+    learning_time: str
+    resources: tuple
+
+
+class LanguageInfo(Mapping):
+    """
+    View read-only atas LanguageRecord untuk industri tertentu
+    
+    Menambahkan key "industry_specific" tanpa menyalin atau mengubah
+    record yang dibagi bersama antar session.
+    """
+    __slots__ = ("record", "industry_specific")
+    
+    def __init__(self, record, industry_specific=None):
+        self.record = record
+        self.industry_specific = industry_specific
+    
+    def __getitem__(self, key):
+        if key == "industry_specific" and self.industry_specific is not None:
+            return self.industry_specific
+        if key in LanguageRecord._fields:
+            return getattr(self.record, key)
+        raise KeyError(key)
+    
+    def __iter__(self):
+        yield from LanguageRecord._fields
+        if self.industry_specific is not None:
+            yield "industry_specific"
+    
+    def __len__(self):
+        return len(LanguageRecord._fields) + (self.industry_specific is not None)
+    
+    def __repr__(self):
+        return f"LanguageInfo({dict(self)!r})"
+
+
+@lru_cache(maxsize=8)
+def _compile_catalog(payload):
+    """
+    Mengompilasi katalog bahasa (JSON kanonik) menjadi record immutable dan view
+    
+    Di-cache per isi katalog: setiap ExpertSystem dari knowledge base yang
+    sama memakai record dan view yang sama, sehingga get_language_info()
+    hanya melakukan lookup dan tidak menyalin data per session.
+    
+    Returns:
+        (catalog, base_views, industry_views)
+    """
+    catalog = MappingProxyType({
+        name: LanguageRecord(
+            description=data["description"],
+            use_cases=MappingProxyType(dict(data["use_cases"])),
+            pros=tuple(data["pros"]),
+            cons=tuple(data["cons"]),
+            avg_salary=data["avg_salary"],
+            learning_time=data["learning_time"],
+            resources=tuple(data["resources"])
+        )
+        for name, data in json.loads(payload).items()
+    })
+    
+    base_views = {name: LanguageInfo(record) for name, record in catalog.items()}
+    industry_views = {
+        name: {
+            industry: LanguageInfo(record, use_case)
+            for industry, use_case in record.use_cases.items()
+        }
+        for name, record in catalog.items()
+    }
+    return catalog, base_views, industry_views
+
+
+_EMPTY_INFO = MappingProxyType({})
+
+
 class ExpertSystem:
-    def __init__(self):
+    def __init__(self, knowledge_base_path=KNOWLEDGE_BASE_PATH, knowledge_base=None):
+        """
+        Args:
+            knowledge_base_path: Path file knowledge base JSON
+                                 (rule set dan katalog bahasa)
+            knowledge_base: (Opsional) dictionary knowledge base yang sudah
+                            dimuat; jika diisi, file tidak dibaca
+        
+        Raises:
+            KnowledgeBaseError: Knowledge base tidak valid
+        """
+        if knowledge_base is None:
+            knowledge_base = load_knowledge_base(knowledge_base_path)
+        else:
+            errors = validate(knowledge_base)
+            if errors:
+                raise KnowledgeBaseError('<dictionary>', errors)
+        self.knowledge_base_path = knowledge_base_path
+        
+        # Skor dasar untuk setiap kandidat yang lolos filter industri
+        self.base_score = knowledge_base["base_score"]
+        
         # KNOWLEDGE BASE - Rule Set 1: Bidang Industri
-        self.rules_industry = {
-            "Web Development": {
-                "languages": ["JavaScript", "Python", "PHP"],
-                "reasoning": "Bahasa dengan framework web populer dan banyak lowongan"
-            },
-            "Data Science": {
-                "languages": ["Python"],
-                "reasoning": "Standar industri untuk data analysis, ML, dan AI"
-            },
-            "Mobile Development": {
-                "languages": ["JavaScript", "Kotlin", "Java"],
-                "reasoning": "React Native (JS), Flutter (JS), dan Android native"
-            },
-            "Backend Development": {
-                "languages": ["Python", "JavaScript", "Java", "Golang", "PHP"],
-                "reasoning": "Bahasa server-side yang banyak digunakan di industri"
-            },
-            "Game Development": {
-                "languages": ["C#", "JavaScript"],
-                "reasoning": "Unity (C#) dan HTML5 games (JavaScript)"
-            }
-        }
+        self.rules_industry = knowledge_base["rules_industry"]
         
         # Rule Set 2: Tujuan Karier
-        self.rules_career_goal = {
-            "Kerja cepat": {
-                "boost": ["JavaScript", "Python", "PHP", "Java"],
-                "score": 15,
-                "reasoning": "Banyak lowongan entry-level di job portal"
-            },
-            "Magang": {
-                "boost": ["Python", "JavaScript", "Java", "Kotlin"],
-                "score": 15,
-                "reasoning": "Populer di program magang tech companies"
-            },
-            "Freelance": {
-                "boost": ["JavaScript", "PHP", "Python"],
-                "score": 15,
-                "reasoning": "Banyak project web development dan automation"
-            },
-            "Startup": {
-                "boost": ["JavaScript", "Python", "Golang"],
-                "score": 15,
-                "reasoning": "Tech stack modern yang digunakan startup"
-            }
-        }
+        self.rules_career_goal = knowledge_base["rules_career_goal"]
         
         # Rule Set 3: Prioritas Pemula
-        self.rules_beginner_priority = {
-            "Mudah dipelajari": {
-                "preferred": ["Python", "JavaScript"],
-                "score": 20,
-                "avoid": ["Java", "C#", "Golang"],
-                "reasoning": "Syntax sederhana, banyak tutorial pemula"
-            },
-            "Banyak lowongan": {
-                "preferred": ["JavaScript", "Python", "Java", "PHP"],
-                "score": 20,
-                "reasoning": "Permintaan industri tinggi di Indonesia"
-            },
-            "Gaji tinggi": {
-                "preferred": ["Python", "JavaScript", "Golang"],
-                "score": 20,
-                "reasoning": "Tren gaji entry-level 2024-2025"
-            }
-        }
+        self.rules_beginner_priority = knowledge_base["rules_beginner_priority"]
         
         # Rule Set 4: Tingkat Kompleksitas untuk Pemula
-        self.beginner_complexity = {
-            "Sangat Cocok": {
-                "languages": ["Python", "JavaScript"],
-                "score": 25,
-                "reasoning": "Syntax intuitif, curve belajar landai"
-            },
-            "Cocok": {
-                "languages": ["PHP", "Kotlin"],
-                "score": 15,
-                "reasoning": "Cukup mudah dengan dokumentasi baik"
-            },
-            "Menengah": {
-                "languages": ["Java", "C#"],
-                "score": 10,
-                "reasoning": "Butuh pemahaman OOP yang solid"
-            },
-            "Perlu Dedikasi": {
-                "languages": ["Golang"],
-                "score": 5,
-                "reasoning": "Konsep concurrent programming perlu waktu"
-            }
+        self.beginner_complexity = knowledge_base["beginner_complexity"]
+        
+        # Katalog bahasa - informasi detail setiap bahasa pemrograman
+        self.language_data = knowledge_base["languages"]
+        
+        # Kompilasi knowledge base menjadi indeks bahasa dan vektor skor
+        self.compile_rules()
+    
+    def compile_rules(self):
+        """
+        Mengompilasi knowledge base menjadi struktur terindeks
+        
+        Setiap bahasa mendapat ID integer, lalu dibangun indeks terbalik
+        bahasa -> aturan yang menyebutnya (rule_index). Skor boost disimpan
+        sparse per key (ID bahasa -> skor) dan kompleksitas dijumlahkan ke
+        base score per bahasa, sehingga infer() cukup mengakumulasi skor
+        untuk setiap kandidat industri. Biaya infer
+        sebanding dengan jumlah kandidat, dan ukuran indeks sebanding dengan
+        jumlah entri aturan, bukan jumlah key x jumlah bahasa. Katalog
+        bahasa dikompilasi menjadi record dan view read-only. Dipanggil
+        sekali di __init__; panggil ulang jika rule set diubah setelah
+        inisialisasi.
+        """
+        languages = []
+        language_ids = {}
+        postings = []
+        
+        # Rule Set 2 & 3: key -> {ID bahasa: skor boost} (hanya bahasa yang disebut)
+        # Rule Set 4: seluruh level kompleksitas selalu berlaku -> satu skor per bahasa
+        career_boost = {goal: {} for goal in self.rules_career_goal}
+        priority_boost = {priority: {} for priority in self.rules_beginner_priority}
+        complexity_scores = []
+        
+        def lang_id(lang):
+            i = language_ids.get(lang)
+            if i is None:
+                i = language_ids[lang] = len(languages)
+                languages.append(lang)
+                postings.append([])
+                complexity_scores.append(0)
+            return i
+        
+        # Setiap entri aturan dicatat pada bahasa yang disebutnya (bahasa
+        # duplikat dalam satu aturan sudah ditolak oleh validate())
+        for industry, data in self.rules_industry.items():
+            entry = ("rules_industry", industry, self.base_score)
+            for lang in data["languages"]:
+                postings[lang_id(lang)].append(entry)
+        
+        for goal, data in self.rules_career_goal.items():
+            entry = ("rules_career_goal", goal, data["score"])
+            for lang in data["boost"]:
+                i = lang_id(lang)
+                postings[i].append(entry)
+                career_boost[goal][i] = data["score"]
+        
+        for priority, data in self.rules_beginner_priority.items():
+            entry = ("rules_beginner_priority", priority, data["score"])
+            for lang in data["preferred"]:
+                i = lang_id(lang)
+                postings[i].append(entry)
+                priority_boost[priority][i] = data["score"]
+        
+        for level, data in self.beginner_complexity.items():
+            entry = ("beginner_complexity", level, data["score"])
+            for lang in data["languages"]:
+                i = lang_id(lang)
+                postings[i].append(entry)
+                complexity_scores[i] += data["score"]
+        
+        self.languages = tuple(languages)
+        self.language_ids = language_ids
+        self._career_boost = career_boost
+        self._priority_boost = priority_boost
+        self._empty_boost = {}
+        # base score + kompleksitas per bahasa, sama untuk semua input
+        self._base_scores = [self.base_score + score for score in complexity_scores]
+        
+        # Indeks terbalik: ID bahasa -> tuple (rule set, key, skor) setiap
+        # aturan yang menyebut bahasa tersebut
+        self.rule_index = tuple(tuple(entries) for entries in postings)
+        
+        # Rule Set 1: industri -> tuple ID kandidat (urutan sesuai rule)
+        self._industry_candidates = {
+            industry: tuple(dict.fromkeys(language_ids[lang] for lang in data["languages"]))
+            for industry, data in self.rules_industry.items()
         }
+        
+        # Versi rule set: berubah jika isi salah satu rule set berubah
+        payload = json.dumps(
+            [self.base_score, self.rules_industry, self.rules_career_goal,
+             self.rules_beginner_priority, self.beginner_complexity],
+            sort_keys=True, ensure_ascii=False
+        )
+        self.rules_version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        
+        self.language_catalog, self._base_views, self._industry_views = _compile_catalog(
+            json.dumps(self.language_data, sort_keys=True, ensure_ascii=False)
+        )
     
     def infer(self, industry, career_goal, priority):
         """
@@ -115,52 +249,116 @@ class ExpertSystem:
         explanations = {}
         
         # RULE 1: Filter berdasarkan INDUSTRI (Primary Filter)
+        candidate_ids = self._industry_candidates.get(industry, ())
         if industry in self.rules_industry:
-            langs = self.rules_industry[industry]["languages"]
-            candidate_languages.update(langs)
             explanations["industry"] = self.rules_industry[industry]["reasoning"]
-            
-            # Inisialisasi skor dasar
-            for lang in langs:
-                scores[lang] = 10  # Base score
         
         # RULE 2: Boost berdasarkan TUJUAN KARIER
         if career_goal in self.rules_career_goal:
-            boost_langs = self.rules_career_goal[career_goal]["boost"]
-            boost_score = self.rules_career_goal[career_goal]["score"]
-            
-            for lang in boost_langs:
-                if lang in candidate_languages:
-                    scores[lang] = scores.get(lang, 0) + boost_score
-            
             explanations["career_goal"] = self.rules_career_goal[career_goal]["reasoning"]
         
         # RULE 3: Boost berdasarkan PRIORITAS PEMULA
         if priority in self.rules_beginner_priority:
-            preferred = self.rules_beginner_priority[priority]["preferred"]
-            pref_score = self.rules_beginner_priority[priority]["score"]
-            
-            for lang in preferred:
-                if lang in candidate_languages:
-                    scores[lang] = scores.get(lang, 0) + pref_score
-            
             explanations["priority"] = self.rules_beginner_priority[priority]["reasoning"]
         
-        # RULE 4: Adjustment berdasarkan KOMPLEKSITAS PEMULA
-        for complexity_level, data in self.beginner_complexity.items():
-            for lang in data["languages"]:
-                if lang in candidate_languages:
-                    scores[lang] = scores.get(lang, 0) + data["score"]
+        # RULE 4: Adjustment berdasarkan KOMPLEKSITAS PEMULA (sudah dijumlahkan
+        # ke base score per bahasa saat kompilasi)
+        
+        # Akumulasi skor per kandidat: (base score + kompleksitas) + boost
+        # karier + boost prioritas; bahasa tanpa boost mendapat 0
+        base_scores = self._base_scores
+        career_boost = self._career_boost.get(career_goal, self._empty_boost).get
+        priority_boost = self._priority_boost.get(priority, self._empty_boost).get
+        raw_scores = [
+            base_scores[i] + career_boost(i, 0) + priority_boost(i, 0)
+            for i in candidate_ids
+        ]
+        for i, score in zip(candidate_ids, raw_scores):
+            lang = self.languages[i]
+            candidate_languages.add(lang)
+            scores[lang] = score
         
         # Normalisasi skor ke range 0-100
         if scores:
-            max_score = max(scores.values())
+            max_score = max(raw_scores)
             if max_score > 0:
                 for lang in scores:
                     scores[lang] = (scores[lang] / max_score) * 100
         
         return candidate_languages, scores, explanations
     
+    def infer_all(self):
+        """
+        Mengevaluasi seluruh kombinasi input sekaligus sebagai tensor NumPy
+        
+        Hasilnya sama dengan memanggil infer() untuk setiap kombinasi:
+        vektor skor dijumlahkan lewat broadcasting, lalu dinormalisasi
+        terhadap skor maksimum kandidat pada setiap kombinasi.
+        
+        Returns:
+            (scores, axes)
+            - scores: array float64 (industry, career_goal, priority, language)
+              skor 0-100; NaN untuk bahasa yang bukan kandidat
+            - axes: dictionary {nama sumbu: tuple label} sesuai urutan dimensi
+        """
+        import numpy as np
+        
+        industries = tuple(self.rules_industry)
+        career_goals = tuple(self.rules_career_goal)
+        priorities = tuple(self.rules_beginner_priority)
+        
+        # Mask kandidat per industri (I, L)
+        candidate_mask = np.zeros((len(industries), len(self.languages)), dtype=bool)
+        for i, industry in enumerate(industries):
+            candidate_mask[i, list(self._industry_candidates[industry])] = True
+        
+        def dense(boost, keys):
+            # Boost sparse -> matriks skor (key, bahasa)
+            matrix = np.zeros((len(keys), len(self.languages)))
+            for k, key in enumerate(keys):
+                for lang_id, score in boost[key].items():
+                    matrix[k, lang_id] = score
+            return matrix
+        
+        career = dense(self._career_boost, career_goals)
+        priority = dense(self._priority_boost, priorities)
+        base = np.array(self._base_scores, dtype=np.float64)
+        
+        # Skor mentah (C, P, L), sama untuk setiap industri
+        raw = base + career[:, None, :] + priority[None, :, :]
+        
+        # (I, C, P, L): hanya kandidat industri yang mendapat skor
+        mask = candidate_mask[:, None, None, :]
+        raw = np.where(mask, raw[None, :, :, :], np.nan)
+        
+        # Normalisasi per kombinasi terhadap skor maksimum kandidat
+        max_score = np.where(mask, raw, -np.inf).max(axis=-1, keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = np.where(max_score > 0, raw / max_score * 100, raw)
+        
+        axes = {
+            'industry': industries,
+            'career_goal': career_goals,
+            'priority': priorities,
+            'language': self.languages
+        }
+        return scores, axes
+    
+    def rules_for_language(self, language):
+        """
+        Aturan yang menyebut bahasa tertentu (lookup indeks terbalik)
+        
+        Args:
+            language: Nama bahasa pemrograman
+            
+        Returns:
+            Tuple (rule set, key, skor); kosong jika bahasa tidak dikenal
+        """
+        lang_id = self.language_ids.get(language)
+        if lang_id is None:
+            return ()
+        return self.rule_index[lang_id]
+    
     def get_language_info(self, language, industry):
         """
         Mendapatkan informasi detail tentang bahasa pemrograman
@@ -170,133 +368,14 @@ class ExpertSystem:
             industry: Bidang industri
             
         Returns:
-            Dictionary dengan informasi bahasa
+            Mapping read-only dengan informasi bahasa; berisi key
+            "industry_specific" jika ada use case untuk industri tersebut
         """
-        language_info = {
-            "Python": {
-                "description": "Bahasa pemrograman serbaguna dengan syntax yang mudah dipahami",
-                "use_cases": {
-                    "Web Development": "Django, Flask untuk backend web application",
-                    "Data Science": "NumPy, Pandas, Scikit-learn, TensorFlow",
-                    "Backend Development": "FastAPI, Django REST Framework",
-                    "Game Development": "Pygame untuk game 2D sederhana"
-                },
-                "pros": ["Syntax sederhana", "Banyak library", "Komunitas besar", "Cocok pemula"],
-                "cons": ["Lebih lambat dari compiled language", "Mobile development terbatas"],
-                "avg_salary": "Rp 6-12 juta/bulan (entry-level)",
-                "learning_time": "3-6 bulan untuk dasar",
-                "resources": [
-                    "Codecademy Python Course",
-                    "Python.org Documentation",
-                    "Real Python Tutorials"
-                ]
-            },
-            "JavaScript": {
-                "description": "Bahasa untuk web development, frontend dan backend",
-                "use_cases": {
-                    "Web Development": "React, Vue, Angular untuk frontend; Node.js untuk backend",
-                    "Mobile Development": "React Native untuk cross-platform mobile",
-                    "Backend Development": "Express.js, Nest.js",
-                    "Game Development": "Phaser, Three.js untuk HTML5 games"
-                },
-                "pros": ["Essential untuk web", "Full-stack capability", "Ekosistem npm besar"],
-                "cons": ["Banyak framework berubah cepat", "Async programming butuh pemahaman"],
-                "avg_salary": "Rp 7-13 juta/bulan (entry-level)",
-                "learning_time": "4-7 bulan untuk dasar + framework",
-                "resources": [
-                    "MDN Web Docs",
-                    "JavaScript.info",
-                    "FreeCodeCamp"
-                ]
-            },
-            "PHP": {
-                "description": "Bahasa server-side untuk web development",
-                "use_cases": {
-                    "Web Development": "Laravel, CodeIgniter untuk web backend",
-                    "Backend Development": "WordPress, API development"
-                },
-                "pros": ["Mudah deploy", "Banyak hosting support", "WordPress ecosystem"],
-                "cons": ["Reputasi legacy code", "Kurang populer di startup baru"],
-                "avg_salary": "Rp 5-10 juta/bulan (entry-level)",
-                "learning_time": "3-5 bulan untuk dasar",
-                "resources": [
-                    "PHP.net Documentation",
-                    "Laravel Documentation",
-                    "Laracasts"
-                ]
-            },
-            "Java": {
-                "description": "Bahasa OOP yang mature untuk enterprise dan Android",
-                "use_cases": {
-                    "Mobile Development": "Android native development",
-                    "Backend Development": "Spring Boot untuk enterprise backend"
-                },
-                "pros": ["Mature ecosystem", "Banyak lowongan enterprise", "Strong typing"],
-                "cons": ["Verbose syntax", "Curve belajar lebih curam untuk pemula"],
-                "avg_salary": "Rp 7-14 juta/bulan (entry-level)",
-                "learning_time": "5-8 bulan untuk dasar + framework",
-                "resources": [
-                    "Oracle Java Tutorials",
-                    "Head First Java",
-                    "Udemy Java Courses"
-                ]
-            },
-            "Kotlin": {
-                "description": "Modern language untuk Android development",
-                "use_cases": {
-                    "Mobile Development": "Android native (officially supported)",
-                    "Backend Development": "Ktor framework"
-                },
-                "pros": ["Modern syntax", "Interop dengan Java", "Official Android language"],
-                "cons": ["Lebih niche", "Komunitas lebih kecil dari Java"],
-                "avg_salary": "Rp 7-13 juta/bulan (entry-level)",
-                "learning_time": "4-6 bulan (jika sudah tahu Java)",
-                "resources": [
-                    "Kotlin Official Docs",
-                    "Android Kotlin Fundamentals",
-                    "Kotlin Koans"
-                ]
-            },
-            "C#": {
-                "description": "Bahasa Microsoft untuk game dan enterprise",
-                "use_cases": {
-                    "Game Development": "Unity game engine",
-                    "Backend Development": ".NET Core untuk web services"
-                },
-                "pros": ["Unity ecosystem", "Strong typing", "Good tooling (Visual Studio)"],
-                "cons": ["Lebih terbatas di luar Windows ecosystem", "Unity butuh dedikasi"],
-                "avg_salary": "Rp 7-13 juta/bulan (entry-level)",
-                "learning_time": "5-7 bulan untuk dasar + Unity",
-                "resources": [
-                    "Microsoft C# Documentation",
-                    "Unity Learn Platform",
-                    "C# Programming Yellow Book"
-                ]
-            },
-            "Golang": {
-                "description": "Modern language untuk backend performa tinggi",
-                "use_cases": {
-                    "Backend Development": "Microservices, API, cloud services"
-                },
-                "pros": ["Performa tinggi", "Concurrency built-in", "Compile cepat"],
-                "cons": ["Lebih kompleks untuk pemula", "Lowongan entry-level lebih sedikit"],
-                "avg_salary": "Rp 8-15 juta/bulan (entry-level, tapi sedikit posisi)",
-                "learning_time": "6-9 bulan untuk mahir",
-                "resources": [
-                    "Go by Example",
-                    "Tour of Go",
-                    "Go Official Documentation"
-                ]
-            }
-        }
-        
-        info = language_info.get(language, {})
-        
-        # Tambahkan use case spesifik untuk industri
-        if info and industry in info.get("use_cases", {}):
-            info["industry_specific"] = info["use_cases"][industry]
+        views = self._industry_views.get(language)
+        if views is None:
+            return _EMPTY_INFO
         
-        return info
+        return views.get(industry, self._base_views[language])
     
     def explain_decision(self, language, scores, explanations):
         """
@@ -0,0 +1,326 @@
+"""
+Feedback
+Log feedback pengguna (append-only) dan update model ML secara inkremental
+
+Setiap feedback ("pengguna menerima rekomendasi X") ditambahkan sebagai satu
+baris JSON ke log. Secara berkala, feedback yang belum diterapkan diproses
+sebagai micro-batch dengan MLRecommender.partial_fit(), model baru disimpan
+sebagai snapshot berversi, lalu dipasang di path model sehingga server
+memuatnya lewat hot reload. Posisi log yang sudah diterapkan disimpan di
+header model, sehingga snapshot dan posisi log selalu konsisten.
+
+Contoh:
+    python feedback.py --apply                 # terapkan feedback baru sekali
+    python feedback.py --watch 300             # terapkan setiap 5 menit
+    python feedback.py --list                  # daftar snapshot
+    python feedback.py --rollback 3            # pasang kembali snapshot v3
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+from ml_model import MLRecommender, model_lock
+
+
+FEEDBACK_LOG_PATH = 'data/feedback.jsonl'
+MODEL_PATH = 'models/trained_model.npz'
+SNAPSHOT_DIR = 'models/snapshots'
+
+# Jumlah snapshot terbaru yang disimpan
+KEEP_SNAPSHOTS = 10
+
+INPUT_FIELDS = ('industry', 'career_goal', 'priority')
+
+
+class FeedbackLog:
+    def __init__(self, path=FEEDBACK_LOG_PATH):
+        """
+        Args:
+            path: Path file log JSONL
+        """
+        self.path = path
+
+    def append(self, industry, career_goal, priority, language, accepted=True, **features):
+        """
+        Menambahkan satu feedback ke log
+
+        Satu baris ditulis dengan satu write() pada file O_APPEND, sehingga
+        banyak proses/worker dapat menulis bersamaan tanpa baris bercampur.
+
+        Args:
+            industry, career_goal, priority: Input kuesioner
+            language: Bahasa yang dinilai pengguna
+            accepted: True jika pengguna menerima rekomendasi tersebut
+            **features: (Opsional) fitur tambahan, mis. job_demand='High'
+        """
+        event = {
+            'ts': time.time(),
+            'industry': industry,
+            'career_goal': career_goal,
+            'priority': priority,
+            'language': language,
+            'accepted': bool(accepted),
+            **features
+        }
+        line = (json.dumps(event, ensure_ascii=False) + '\n').encode('utf-8')
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return event
+
+    def size(self):
+        """Ukuran log dalam byte (0 jika belum ada)"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def read(self, offset=0, max_events=None):
+        """
+        Membaca feedback mulai dari posisi byte tertentu
+
+        Baris terakhir yang belum lengkap (masih ditulis) tidak dibaca dan
+        posisinya tidak dilewati. Baris yang bukan JSON valid dilewati.
+
+        Args:
+            offset: Posisi byte awal (hasil read() sebelumnya)
+            max_events: (Opsional) jumlah maksimum feedback yang dibaca
+
+        Returns:
+            (events, new_offset, n_invalid)
+        """
+        events = []
+        n_invalid = 0
+        if not os.path.exists(self.path):
+            return events, offset, n_invalid
+
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                if max_events is not None and len(events) >= max_events:
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    n_invalid += 1
+                    continue
+                if isinstance(event, dict):
+                    events.append(event)
+                else:
+                    n_invalid += 1
+
+        return events, offset, n_invalid
+
+
+def events_to_rows(events, feature_columns):
+    """
+    Mengubah feedback menjadi baris training
+
+    Hanya feedback yang diterima (accepted) dan memiliki input lengkap yang
+    dipakai; Naive Bayes tidak belajar dari contoh negatif.
+
+    Returns:
+        (rows, languages, n_skipped)
+    """
+    rows, languages = [], []
+    n_skipped = 0
+    for event in events:
+        if not event.get('accepted', True) or not event.get('language') or \
+                not all(event.get(field) for field in INPUT_FIELDS):
+            n_skipped += 1
+            continue
+        rows.append({col: event[col] for col in feature_columns if event.get(col)})
+        languages.append(event['language'])
+    return rows, languages, n_skipped
+
+
+def snapshot_path(model_path, version, snapshot_dir=SNAPSHOT_DIR):
+    """Path snapshot versi tertentu, mis. models/snapshots/trained_model-v00003.npz"""
+    stem, ext = os.path.splitext(os.path.basename(model_path))
+    return os.path.join(snapshot_dir, f"{stem}-v{version:05d}{ext}")
+
+
+def list_snapshots(model_path=MODEL_PATH, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Snapshot yang tersedia, terurut dari versi terlama
+
+    Returns:
+        List (version, path)
+    """
+    stem, ext = os.path.splitext(os.path.basename(model_path))
+    prefix = f"{stem}-v"
+    if not os.path.isdir(snapshot_dir):
+        return []
+
+    snapshots = []
+    for name in os.listdir(snapshot_dir):
+        if name.startswith(prefix) and name.endswith(ext):
+            version = name[len(prefix):len(name) - len(ext)]
+            if version.isdigit():
+                snapshots.append((int(version), os.path.join(snapshot_dir, name)))
+    return sorted(snapshots)
+
+
+def apply_feedback(model_path=MODEL_PATH, log_path=FEEDBACK_LOG_PATH, snapshot_dir=SNAPSHOT_DIR,
+                   min_events=1, max_events=None, keep=KEEP_SNAPSHOTS):
+    """
+    Menerapkan feedback yang belum diproses ke model sebagai satu micro-batch
+
+    Dijalankan di bawah model_lock() sehingga aman bersamaan dengan
+    training awal atau updater lain. Model baru disimpan sebagai snapshot
+    lalu dipasang secara atomik di model_path.
+
+    Args:
+        model_path: Path model aktif (harus sudah ada)
+        log_path: Path log feedback
+        snapshot_dir: Direktori snapshot berversi
+        min_events: Jumlah minimum feedback baru sebelum model diperbarui
+        max_events: (Opsional) ukuran maksimum satu micro-batch
+        keep: Jumlah snapshot terbaru yang disimpan
+
+    Returns:
+        Dictionary ringkasan update, atau None jika feedback baru kurang dari min_events
+    """
+    log = FeedbackLog(log_path)
+
+    with model_lock(model_path):
+        ml = MLRecommender()
+        if not ml.load_model(model_path):
+            raise RuntimeError(f"Model tidak dapat dimuat dari {model_path}")
+
+        state = ml.metadata.get('feedback', {})
+        offset = state.get('offset', 0)
+        if offset > log.size():
+            # Log diganti/dipotong: mulai lagi dari awal file baru
+            print(f"⚠️ Log feedback lebih pendek dari posisi tersimpan ({offset} byte), dibaca dari awal")
+            offset = 0
+
+        events, new_offset, n_invalid = log.read(offset, max_events)
+        if len(events) < min_events:
+            return None
+
+        rows, languages, n_skipped = events_to_rows(events, ml.feature_columns)
+        update = ml.partial_fit(rows, languages) if rows else {
+            'n_samples': 0, 'new_categories': {}, 'new_classes': []
+        }
+
+        # Versi baru selalu di atas snapshot yang sudah ada, sehingga update
+        # setelah rollback tidak menimpa snapshot lama
+        existing = [v for v, _ in list_snapshots(model_path, snapshot_dir)]
+        version = max([state.get('version', 0)] + existing) + 1
+        ml.metadata['feedback'] = {
+            'version': version,
+            'offset': new_offset,
+            'events': state.get('events', 0) + len(rows),
+            'updated_at': time.time()
+        }
+
+        os.makedirs(snapshot_dir, exist_ok=True)
+        snapshot = snapshot_path(model_path, version, snapshot_dir)
+        ml.save_model(snapshot)
+        ml.save_model(model_path)
+
+        for _, old_path in list_snapshots(model_path, snapshot_dir)[:-keep or None]:
+            os.remove(old_path)
+
+    return {
+        'version': version,
+        'applied': len(rows),
+        'skipped': n_skipped,
+        'invalid': n_invalid,
+        'offset': new_offset,
+        'snapshot': snapshot,
+        'new_categories': update['new_categories'],
+        'new_classes': update['new_classes']
+    }
+
+
+def rollback(version, model_path=MODEL_PATH, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Memasang kembali snapshot versi tertentu sebagai model aktif
+
+    Posisi log ikut kembali ke posisi snapshot, sehingga feedback setelahnya
+    diterapkan ulang pada update berikutnya (sebagai snapshot versi baru;
+    snapshot yang ada tidak ditimpa). Untuk membuang feedback
+    tersebut, pindahkan atau potong log feedback terlebih dahulu.
+    """
+    source = snapshot_path(model_path, version, snapshot_dir)
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Snapshot v{version} tidak ditemukan: {source}")
+
+    with model_lock(model_path):
+        tmp_path = f"{model_path}.tmp.{os.getpid()}"
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, model_path)
+    return source
+
+
+def print_update(info):
+    if info is None:
+        print("Tidak ada feedback baru")
+        return
+    print(f"✅ Model v{info['version']}: {info['applied']} feedback diterapkan "
+          f"({info['skipped']} dilewati, {info['invalid']} tidak valid)")
+    for col, values in info['new_categories'].items():
+        print(f"   Kategori baru {col}: {', '.join(values)}")
+    if info['new_classes']:
+        print(f"   Bahasa baru: {', '.join(info['new_classes'])}")
+    print(f"   Snapshot: {info['snapshot']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update model ML dari log feedback")
+    parser.add_argument('--model', default=MODEL_PATH, help='Path model aktif')
+    parser.add_argument('--log', default=FEEDBACK_LOG_PATH, help='Path log feedback (JSONL)')
+    parser.add_argument('--snapshots', default=SNAPSHOT_DIR, help='Direktori snapshot berversi')
+    parser.add_argument('--min-events', type=int, default=1,
+                        help='Jumlah minimum feedback baru sebelum model diperbarui')
+    parser.add_argument('--max-events', type=int, help='Ukuran maksimum satu micro-batch')
+    parser.add_argument('--keep', type=int, default=KEEP_SNAPSHOTS, help='Jumlah snapshot yang disimpan')
+
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--apply', action='store_true', help='Terapkan feedback baru sekali')
+    action.add_argument('--watch', type=float, metavar='DETIK', help='Terapkan feedback baru secara berkala')
+    action.add_argument('--list', action='store_true', help='Tampilkan daftar snapshot')
+    action.add_argument('--rollback', type=int, metavar='VERSI', help='Pasang kembali snapshot versi tertentu')
+    args = parser.parse_args()
+
+    def apply():
+        return apply_feedback(args.model, args.log, args.snapshots,
+                              args.min_events, args.max_events, args.keep)
+
+    try:
+        if args.list:
+            for version, path in list_snapshots(args.model, args.snapshots):
+                print(f"v{version}\t{path}")
+        elif args.rollback is not None:
+            print(f"✅ Model aktif dikembalikan ke {rollback(args.rollback, args.model, args.snapshots)}")
+        elif args.watch:
+            print(f"Memantau {args.log} setiap {args.watch:.0f} detik (Ctrl+C untuk berhenti)")
+            while True:
+                print_update(apply())
+                time.sleep(args.watch)
+        else:
+            print_update(apply())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"❌ Update feedback gagal: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
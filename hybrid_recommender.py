@@ -0,0 +1,157 @@
+"""
+Hybrid Recommender
+Engine rekomendasi hybrid (Rule-Based + Machine Learning) tanpa ketergantungan
+Streamlit, sehingga bisa dipakai di aplikasi web, batch job, maupun benchmark
+"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple
+
+from expert_system import ExpertSystem
+from tracing import span
+
+
+# Bobot default: 60% Rule-Based + 40% ML
+RULE_WEIGHT = 0.6
+ML_WEIGHT = 0.4
+
+
+@dataclass(frozen=True)
+class RecommendationResult:
+    """Hasil rekomendasi hybrid untuk satu kombinasi input"""
+    industry: str
+    career_goal: str
+    priority: str
+    candidates: FrozenSet[str]
+    ranked: List[Tuple[str, float]]
+    rule_scores: Dict[str, float]
+    ml_scores: Dict[str, float]
+    explanations: Dict[str, str]
+
+    @property
+    def top_language(self):
+        """Bahasa dengan skor hybrid tertinggi (None jika tidak ada kandidat)"""
+        return self.ranked[0][0] if self.ranked else None
+
+
+def blend_scores(candidates, rule_scores, ml_scores, rule_weight=RULE_WEIGHT, ml_weight=ML_WEIGHT):
+    """
+    Menggabungkan skor rule-based dan ML lalu mengurutkannya
+
+    Args:
+        candidates: Set bahasa kandidat dari expert system
+        rule_scores: Dictionary skor rule-based
+        ml_scores: Dictionary skor ML
+        rule_weight: Bobot skor rule-based
+        ml_weight: Bobot skor ML
+
+    Returns:
+        List of tuples (language, final_score), terurut menurun
+    """
+    final_scores = {}
+    for lang in candidates:
+        rule_score = rule_scores.get(lang, 0)
+        ml_score = ml_scores.get(lang, 0)
+        final_scores[lang] = (rule_score * rule_weight) + (ml_score * ml_weight)
+
+    return sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
+
+
+class HybridRecommender:
+    def __init__(self, expert=None, ml_model=None, ml_loader=None,
+                 rule_weight=RULE_WEIGHT, ml_weight=ML_WEIGHT,
+                 model_path='models/trained_model.npz',
+                 dataset_path='data/industry_data.csv'):
+        """
+        Args:
+            expert: Instance ExpertSystem (default: dibuat baru)
+            ml_model: Instance MLRecommender yang sudah dilatih (opsional)
+            ml_loader: Callable tanpa argumen yang mengembalikan MLRecommender;
+                       dipanggil saat skor ML pertama kali dibutuhkan
+            rule_weight: Bobot skor rule-based
+            ml_weight: Bobot skor ML
+            model_path: Path model untuk loader default
+            dataset_path: Path dataset jika model perlu dilatih
+        """
+        self.expert = expert if expert is not None else ExpertSystem()
+        self.rule_weight = rule_weight
+        self.ml_weight = ml_weight
+        self.model_path = model_path
+        self.dataset_path = dataset_path
+        self._ml_model = ml_model
+        self._ml_loader = ml_loader
+
+    def load_ml_model(self):
+        """
+        Mengembalikan model ML, memuatnya lebih dulu jika belum ada
+
+        Stack ML (numpy/sklearn) baru diimpor di sini, bukan saat modul diimpor.
+        """
+        if self._ml_model is None:
+            if self._ml_loader is not None:
+                self._ml_model = self._ml_loader()
+            else:
+                from ml_model import load_or_train_model
+                self._ml_model = load_or_train_model(self.model_path, self.dataset_path)
+        return self._ml_model
+
+    def infer_rules(self, industry, career_goal, priority):
+        """
+        TAHAP 1: Rule-Based Expert System
+
+        Returns:
+            (candidate_languages, rule_scores, explanations)
+        """
+        return self.expert.infer(industry, career_goal, priority)
+
+    def score_ml(self, industry, career_goal, priority, candidates):
+        """
+        TAHAP 2: Machine Learning Scoring
+
+        Returns:
+            Dictionary {language: probability_score}
+        """
+        return self.load_ml_model().predict_proba(industry, career_goal, priority, candidates)
+
+    def blend(self, candidates, rule_scores, ml_scores):
+        """TAHAP 3: Gabungkan skor dengan bobot recommender ini lalu urutkan"""
+        return blend_scores(candidates, rule_scores, ml_scores, self.rule_weight, self.ml_weight)
+
+    def recommend(self, industry, career_goal, priority):
+        """
+        Menjalankan pipeline hybrid lengkap
+
+        Args:
+            industry: Bidang industri yang diminati
+            career_goal: Tujuan karier
+            priority: Prioritas sebagai pemula
+
+        Returns:
+            RecommendationResult
+        """
+        with span('hybrid.rules'):
+            candidates, rule_scores, explanations = self.infer_rules(industry, career_goal, priority)
+        with span('hybrid.ml'):
+            ml_scores = self.score_ml(industry, career_goal, priority, candidates)
+        with span('hybrid.blend'):
+            ranked = self.blend(candidates, rule_scores, ml_scores)
+
+        return RecommendationResult(
+            industry=industry,
+            career_goal=career_goal,
+            priority=priority,
+            candidates=frozenset(candidates),
+            ranked=ranked,
+            rule_scores=rule_scores,
+            ml_scores={lang: float(score) for lang, score in ml_scores.items()},
+            explanations=explanations
+        )
+
+    def input_space(self):
+        """Seluruh kombinasi (industry, career_goal, priority) yang dikenal rule base"""
+        return [
+            (industry, career_goal, priority)
+            for industry in self.expert.rules_industry
+            for career_goal in self.expert.rules_career_goal
+            for priority in self.expert.rules_beginner_priority
+        ]
@@ -0,0 +1,218 @@
+"""
+Knowledge Base
+Memuat dan memvalidasi knowledge base sistem pakar (rule set dan katalog
+bahasa) dari file JSON deklaratif, sehingga aturan dapat diubah tanpa
+mengubah kode
+
+Validasi dilakukan sebelum knowledge base dikompilasi oleh ExpertSystem;
+semua kesalahan dilaporkan sekaligus. Cek file sebelum deploy dengan:
+
+    python knowledge_base.py data/knowledge_base.json
+"""
+
+import json
+import math
+import os
+import sys
+
+
+KNOWLEDGE_BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'knowledge_base.json')
+
+KB_FORMAT = 'sistem-pakar-kb'
+KB_FORMAT_VERSION = 1
+
+# Field setiap rule set: nama field -> (jenis nilai, wajib)
+RULE_SCHEMA = {
+    'rules_industry': {
+        'languages': ('languages', True),
+        'reasoning': ('text', True)
+    },
+    'rules_career_goal': {
+        'boost': ('languages', True),
+        'score': ('number', True),
+        'reasoning': ('text', True)
+    },
+    'rules_beginner_priority': {
+        'preferred': ('languages', True),
+        'score': ('number', True),
+        'avoid': ('languages', False),
+        'reasoning': ('text', True)
+    },
+    'beginner_complexity': {
+        'languages': ('languages', True),
+        'score': ('number', True),
+        'reasoning': ('text', True)
+    }
+}
+
+# Field katalog bahasa (semua wajib)
+LANGUAGE_SCHEMA = {
+    'description': 'text',
+    'use_cases': 'text_mapping',
+    'pros': 'texts',
+    'cons': 'texts',
+    'avg_salary': 'text',
+    'learning_time': 'text',
+    'resources': 'texts'
+}
+
+
+class KnowledgeBaseError(ValueError):
+    """Knowledge base tidak dapat dibaca atau tidak valid"""
+
+    def __init__(self, source, errors):
+        self.source = source
+        self.errors = list(errors)
+        details = '\n'.join(f"- {error}" for error in self.errors)
+        super().__init__(f"Knowledge base tidak valid ({source}):\n{details}")
+
+
+def _is_text(value):
+    return isinstance(value, str) and value.strip() != ''
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _check_value(kind, value, where, errors):
+    """Memeriksa satu nilai terhadap jenisnya; bahasa yang dirujuk dikembalikan"""
+    if kind == 'text':
+        if not _is_text(value):
+            errors.append(f"{where}: harus berupa teks yang tidak kosong")
+    elif kind == 'number':
+        if not _is_number(value):
+            errors.append(f"{where}: harus berupa angka")
+    elif kind in ('texts', 'languages'):
+        if not isinstance(value, list) or not all(_is_text(item) for item in value):
+            errors.append(f"{where}: harus berupa list teks")
+            return []
+        if kind == 'languages':
+            duplicates = sorted({item for item in value if value.count(item) > 1})
+            if duplicates:
+                errors.append(f"{where}: bahasa disebut lebih dari sekali: {', '.join(duplicates)}")
+            return value
+    elif kind == 'text_mapping':
+        if not isinstance(value, dict) or not all(_is_text(item) for item in value.values()):
+            errors.append(f"{where}: harus berupa objek dengan nilai teks")
+    return []
+
+
+def validate(data):
+    """
+    Memvalidasi struktur knowledge base
+
+    Args:
+        data: Dictionary hasil parsing file knowledge base
+
+    Returns:
+        List pesan kesalahan (kosong jika valid)
+    """
+    if not isinstance(data, dict):
+        return ["root: harus berupa objek JSON"]
+
+    errors = []
+    if data.get('format') != KB_FORMAT:
+        errors.append(f"format: harus '{KB_FORMAT}'")
+    if data.get('version') != KB_FORMAT_VERSION:
+        errors.append(f"version: versi {data.get('version')!r} tidak didukung (harus {KB_FORMAT_VERSION})")
+    if not _is_number(data.get('base_score')):
+        errors.append("base_score: harus berupa angka")
+
+    known = {'format', 'version', 'base_score', 'languages'} | set(RULE_SCHEMA)
+    for key in data:
+        if key not in known:
+            errors.append(f"{key}: key tidak dikenal")
+
+    # Rule set: setiap entri berisi field sesuai skema
+    referenced = []
+    for rule_set, schema in RULE_SCHEMA.items():
+        rules = data.get(rule_set)
+        if not isinstance(rules, dict) or not rules:
+            errors.append(f"{rule_set}: harus berupa objek yang tidak kosong")
+            continue
+
+        for key, rule in rules.items():
+            where = f"{rule_set}.{key}"
+            if not isinstance(rule, dict):
+                errors.append(f"{where}: harus berupa objek")
+                continue
+            for field in rule:
+                if field not in schema:
+                    errors.append(f"{where}.{field}: field tidak dikenal")
+            for field, (kind, required) in schema.items():
+                if field not in rule:
+                    if required:
+                        errors.append(f"{where}.{field}: wajib diisi")
+                    continue
+                langs = _check_value(kind, rule[field], f"{where}.{field}", errors)
+                referenced.extend((f"{where}.{field}", lang) for lang in langs)
+
+        if rule_set == 'rules_industry':
+            for key, rule in rules.items():
+                if isinstance(rule, dict) and rule.get('languages') == []:
+                    errors.append(f"{rule_set}.{key}.languages: minimal satu bahasa kandidat")
+
+    # Katalog bahasa
+    catalog = data.get('languages')
+    if not isinstance(catalog, dict) or not catalog:
+        errors.append("languages: harus berupa objek yang tidak kosong")
+        catalog = {}
+    for name, info in catalog.items():
+        where = f"languages.{name}"
+        if not isinstance(info, dict):
+            errors.append(f"{where}: harus berupa objek")
+            continue
+        for field in info:
+            if field not in LANGUAGE_SCHEMA:
+                errors.append(f"{where}.{field}: field tidak dikenal")
+        for field, kind in LANGUAGE_SCHEMA.items():
+            if field not in info:
+                errors.append(f"{where}.{field}: wajib diisi")
+            else:
+                _check_value(kind, info[field], f"{where}.{field}", errors)
+
+    # Setiap bahasa yang dirujuk aturan harus ada di katalog
+    for where, lang in referenced:
+        if lang not in catalog:
+            errors.append(f"{where}: bahasa '{lang}' tidak ada di katalog languages")
+
+    return errors
+
+
+def load_knowledge_base(path=KNOWLEDGE_BASE_PATH):
+    """
+    Membaca dan memvalidasi file knowledge base
+
+    Returns:
+        Dictionary knowledge base yang valid
+
+    Raises:
+        KnowledgeBaseError: File bukan JSON valid atau isinya tidak valid
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise KnowledgeBaseError(path, [f"JSON tidak valid: {str(e)}"]) from e
+
+    errors = validate(data)
+    if errors:
+        raise KnowledgeBaseError(path, errors)
+    return data
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else KNOWLEDGE_BASE_PATH
+    try:
+        data = load_knowledge_base(path)
+    except (OSError, KnowledgeBaseError) as e:
+        print(f"❌ {str(e)}")
+        sys.exit(1)
+
+    counts = ', '.join(f"{len(data[rule_set])} {rule_set}" for rule_set in RULE_SCHEMA)
+    print(f"✅ Knowledge base valid: {counts}, {len(data['languages'])} bahasa")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Metrics
+Counter dan histogram traffic rekomendasi dalam format teks Prometheus
+
+Metrik dicatat in-memory per proses dan dapat dibaca lewat endpoint
+GET /metrics pada api_server.py, atau ditulis ke file untuk textfile
+collector node_exporter:
+
+    from metrics import registry
+    registry.write_textfile('metrics/spk.prom')
+
+Metrik yang tersedia:
+    spk_requests_total{source,industry,career_goal,priority}
+    spk_top1_total{source,language}
+    spk_cache_lookups_total{source,result}      result: table, hit, miss
+    spk_ml_fallback_total{reason}               skor default 50.0 dari predict_proba
+    spk_request_latency_seconds{source}         histogram end-to-end
+"""
+
+import os
+import threading
+import time
+
+
+# Batas bucket histogram latensi (detik)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=(), lock=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = lock or threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        """Menambah counter untuk kombinasi label tertentu"""
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Nilai counter saat ini (0 jika label belum pernah dicatat)"""
+        key = tuple(labels[name] for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def samples(self):
+        """List (nama, label names, label values, nilai) untuk exposition"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, self.labelnames, key, value) for key, value in items]
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, lock=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series = {}
+        self._lock = lock or threading.Lock()
+
+    def observe(self, value, **labels):
+        """Mencatat satu observasi (mis. latensi dalam detik)"""
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels):
+        """Jumlah observasi untuk kombinasi label tertentu"""
+        key = tuple(labels[name] for name in self.labelnames)
+        series = self._series.get(key)
+        return series[2] if series else 0
+
+    def samples(self):
+        """Bucket kumulatif, _sum, dan _count per kombinasi label"""
+        with self._lock:
+            items = sorted((key, (list(counts), total, n)) for key, (counts, total, n) in self._series.items())
+
+        bucket_names = self.labelnames + ('le',)
+        result = []
+        for key, (counts, total, n) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                result.append((f'{self.name}_bucket', bucket_names, key + (_format_value(bound),), cumulative))
+            result.append((f'{self.name}_sum', self.labelnames, key, total))
+            result.append((f'{self.name}_count', self.labelnames, key, n))
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._last_write = None
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metrik '{metric.name}' sudah terdaftar")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """
+        Semua metrik dalam format teks Prometheus (exposition format 0.0.4)
+
+        Returns:
+            String yang diakhiri newline
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f'# HELP {metric.name} {_escape(metric.documentation)}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            for name, labelnames, labelvalues, value in metric.samples():
+                lines.append(f'{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, filepath):
+        """
+        Menulis metrik ke file secara atomik (tmp + rename) sehingga
+        collector tidak pernah membaca file yang setengah tertulis
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, filepath)
+
+    def write_textfile_if_due(self, filepath, interval):
+        """
+        Menulis file metrik paling sering sekali per `interval` detik
+
+        Returns:
+            True jika file ditulis
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._last_write is not None and now - self._last_write < interval:
+                return False
+            self._last_write = now
+        self.write_textfile(filepath)
+        return True
+
+    def reset(self):
+        """Mengosongkan semua nilai metrik (untuk test)"""
+        for metric in self._metrics.values():
+            metric.reset()
+        with self._lock:
+            self._last_write = None
+
+
+# Registry global untuk seluruh proses
+registry = MetricsRegistry()
+
+REQUESTS = registry.counter(
+    'spk_requests_total', 'Request rekomendasi per kombinasi input',
+    ('source', 'industry', 'career_goal', 'priority')
+)
+TOP1 = registry.counter(
+    'spk_top1_total', 'Bahasa peringkat 1 pada hasil rekomendasi',
+    ('source', 'language')
+)
+CACHE_LOOKUPS = registry.counter(
+    'spk_cache_lookups_total', 'Sumber hasil rekomendasi: tabel jawaban, cache hit, atau cache miss',
+    ('source', 'result')
+)
+ML_FALLBACKS = registry.counter(
+    'spk_ml_fallback_total', 'Prediksi ML yang jatuh ke skor default 50.0',
+    ('reason',)
+)
+LATENCY = registry.histogram(
+    'spk_request_latency_seconds', 'Latensi end-to-end request rekomendasi',
+    ('source',)
+)
+
+
+def record_recommendation(source, result, seconds):
+    """
+    Mencatat satu request rekomendasi yang selesai
+
+    Args:
+        source: Asal request, mis. 'api' atau 'app'
+        result: RecommendationResult
+        seconds: Latensi end-to-end
+    """
+    REQUESTS.inc(source=source, industry=result.industry,
+                 career_goal=result.career_goal, priority=result.priority)
+    if result.ranked:
+        TOP1.inc(source=source, language=result.ranked[0][0])
+    LATENCY.observe(seconds, source=source)
+
+
+def fallback_reason(error):
+    """Label alasan fallback predict_proba dari exception"""
+    return 'unknown_category' if isinstance(error, KeyError) else type(error).__name__
@@ -4,17 +4,39 @@ Menggunakan Naive Bayes untuk scoring bahasa pemrograman
 berdasarkan data industri
 """
 
-import pandas as pd
+import json
+import math
 import numpy as np
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.preprocessing import LabelEncoder
 import pickle
 import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa file lock, rename atomik tetap mencegah file setengah jadi
+    fcntl = None
+
+from dataset_store import ColumnarDataset, is_columnar
+from metrics import ML_FALLBACKS, fallback_reason
+from nb_scorer import NaiveBayesScorer
+from tracing import span
+
+
+# Jumlah baris per blok saat menghitung baris unik dari dataset kolom
+COLUMNAR_BLOCK_ROWS = 1 << 18
+
+# Format model tersimpan: arsip .npz berisi header JSON dan array parameter
+# Naive Bayes, sehingga dapat dimuat dengan NumPy saja (tanpa pickle/sklearn)
+MODEL_FORMAT = 'sistem-pakar-nb'
+MODEL_FORMAT_VERSION = 1
+NB_ARRAYS = ('class_count', 'feature_count', 'class_log_prior', 'feature_log_prob')
 
 
 class MLRecommender:
     def __init__(self):
-        self.model = MultinomialNB(alpha=1.0)
+        # Estimator sklearn dibuat saat train(); scikit-learn dan pandas
+        # hanya diimpor ketika training agar import modul ini tetap ringan
+        self.model = None
         self.encoders = {}
         self.feature_columns = [
             'industry', 'career_goal', 'priority', 
@@ -24,42 +46,44 @@ class MLRecommender:
         self.classes_ = None
         self.is_trained = False
         
-    def train(self, dataset_path='data/industry_data.csv'):
+        # Kategori terurut per kolom fitur (sama dengan LabelEncoder.classes_)
+        # dan parameter Naive Bayes; keduanya cukup untuk prediksi dan disimpan
+        self.vocab = {}
+        self.nb_state = None
+        
+        # Metadata tambahan yang ikut disimpan di header model, mis. posisi
+        # log feedback yang sudah diterapkan (lihat feedback.py)
+        self.metadata = {}
+        
+        # Lookup table kategori -> index, dibangun saat train/load
+        self.category_index = {}
+        self.class_index = {}
+        self._default_codes = []
+        
+        # Scorer NumPy murni yang dipakai saat prediksi
+        self.scorer = None
+        
+    def train(self, dataset_path='data/industry_data.csv', chunksize=None):
         """
         Melatih model dengan dataset industri
         
         Args:
-            dataset_path: Path ke file CSV dataset
+            dataset_path: Path ke file CSV dataset, atau direktori dataset
+                          kolom hasil dataset_store.convert_csv()
+            chunksize: (Opsional) jumlah baris per chunk. Jika diisi, dataset
+                       dibaca bertahap dan model dilatih dengan partial_fit
+                       sehingga memori puncak tidak bergantung ukuran file
             
         Returns:
             Dictionary dengan informasi training
         """
         try:
-            # Load dataset
-            df = pd.read_csv(dataset_path)
-            print(f"Dataset loaded: {len(df)} records")
-            
-            # Encode categorical features
-            X_encoded = []
-            for col in self.feature_columns:
-                if col not in df.columns:
-                    raise ValueError(f"Column {col} not found in dataset")
-                
-                self.encoders[col] = LabelEncoder()
-                encoded = self.encoders[col].fit_transform(df[col])
-                X_encoded.append(encoded)
-            
-            # Prepare training data
-            X = np.array(X_encoded).T
-            y = df['language'].values
-            
-            # Train model
-            self.model.fit(X, y)
-            self.classes_ = self.model.classes_
-            self.is_trained = True
-            
-            # Calculate training accuracy
-            train_accuracy = self.model.score(X, y)
+            if is_columnar(dataset_path):
+                n_samples, train_accuracy = self._train_columnar(dataset_path, chunksize)
+            elif chunksize:
+                n_samples, train_accuracy = self._train_chunked(dataset_path, chunksize)
+            else:
+                n_samples, train_accuracy = self._train_full(dataset_path)
             
             print(f"Model trained successfully!")
             print(f"Training accuracy: {train_accuracy:.2%}")
@@ -68,7 +92,7 @@ class MLRecommender:
             return {
                 'success': True,
                 'accuracy': train_accuracy,
-                'n_samples': len(df),
+                'n_samples': n_samples,
                 'n_classes': len(self.classes_)
             }
             
@@ -76,6 +100,191 @@ class MLRecommender:
             print(f"Error during training: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    def _train_full(self, dataset_path):
+        """
+        Training dengan memuat seluruh dataset ke memori
+        
+        Returns:
+            (n_samples, train_accuracy)
+        """
+        import pandas as pd
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.preprocessing import LabelEncoder
+        
+        # Load dataset: sel kosong/"NA" tetap kategori teks, sama seperti
+        # training per chunk dan dataset kolom
+        df = pd.read_csv(dataset_path, dtype=str, keep_default_na=False)
+        print(f"Dataset loaded: {len(df)} records")
+        
+        for col in self.feature_columns:
+            if col not in df.columns:
+                raise ValueError(f"Column {col} not found in dataset")
+        
+        # Baris duplikat digabung menjadi satu sampel berbobot (jumlah kemunculan)
+        grouped = (
+            df.groupby(self.feature_columns + ['language'], sort=False, dropna=False)
+            .size()
+            .reset_index(name='count')
+        )
+        print(f"Unique feature rows: {len(grouped)}")
+        
+        # Encode categorical features
+        X_encoded = []
+        for col in self.feature_columns:
+            self.encoders[col] = LabelEncoder()
+            encoded = self.encoders[col].fit_transform(grouped[col])
+            X_encoded.append(encoded)
+        
+        # Prepare training data
+        X = np.array(X_encoded).T
+        y = grouped['language'].values
+        weights = grouped['count'].to_numpy()
+        
+        # Train model
+        self.model = MultinomialNB(alpha=1.0)
+        self.model.fit(X, y, sample_weight=weights)
+        self.classes_ = self.model.classes_
+        self.is_trained = True
+        self._build_lookup_tables()
+        
+        # Calculate training accuracy
+        return int(weights.sum()), self._weighted_accuracy(X, y, weights)
+    
+    def _train_chunked(self, dataset_path, chunksize):
+        """
+        Training streaming: CSV dibaca per chunk dengan dtype tetap
+        
+        Pass 1 mengumpulkan vocabulary setiap kolom, pass 2 menghitung
+        jumlah kemunculan setiap kombinasi kode per chunk dan
+        menggabungkannya. Model dilatih sekali dengan partial_fit pada
+        baris unik berbobot, dan akurasi training dihitung dari tabel yang
+        sama. Vocabulary diurutkan seperti LabelEncoder sehingga parameter
+        model identik dengan training penuh.
+        
+        Returns:
+            (n_samples, train_accuracy)
+        """
+        import pandas as pd
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.preprocessing import LabelEncoder
+        
+        columns = self.feature_columns + ['language']
+        header = pd.read_csv(dataset_path, nrows=0).columns
+        for col in columns:
+            if col not in header:
+                raise ValueError(f"Column {col} not found in dataset")
+        
+        def read_chunks(dtype):
+            return pd.read_csv(dataset_path, usecols=columns, dtype=dtype,
+                               keep_default_na=False, chunksize=chunksize)
+        
+        # Pass 1: vocabulary setiap kolom (ukurannya kecil, bukan per baris)
+        vocab = {col: set() for col in columns}
+        n_samples = 0
+        for chunk in read_chunks(dtype=str):
+            for col in columns:
+                vocab[col].update(chunk[col].unique())
+            n_samples += len(chunk)
+        print(f"Dataset scanned: {n_samples} records")
+        
+        for col in self.feature_columns:
+            self.encoders[col] = LabelEncoder()
+            self.encoders[col].classes_ = np.array(sorted(vocab[col]), dtype=object)
+        classes = np.array(sorted(vocab['language']), dtype=object)
+        
+        # Dtype kategori tetap: kode integer langsung dari parser
+        dtypes = {col: pd.CategoricalDtype(self.encoders[col].classes_) for col in self.feature_columns}
+        dtypes['language'] = pd.CategoricalDtype(classes)
+        
+        # Pass 2: jumlah kemunculan per kombinasi kode, digabung antar chunk
+        counts = None
+        for chunk in read_chunks(dtype=dtypes):
+            codes = pd.DataFrame({col: chunk[col].cat.codes for col in columns})
+            chunk_counts = codes.groupby(columns, sort=False).size()
+            counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+        
+        grouped = counts.reset_index(name='count')
+        print(f"Unique feature rows: {len(grouped)}")
+        
+        X = grouped[self.feature_columns].to_numpy()
+        y = classes[grouped['language'].to_numpy()]
+        weights = grouped['count'].to_numpy()
+        
+        self.model = MultinomialNB(alpha=1.0)
+        self.model.partial_fit(X, y, classes=classes, sample_weight=weights)
+        
+        self.classes_ = self.model.classes_
+        self.is_trained = True
+        self._build_lookup_tables()
+        
+        return n_samples, self._weighted_accuracy(X, y, weights)
+    
+    def _train_columnar(self, dataset_path, chunksize=None):
+        """
+        Training dari dataset kolom (kode integer .npy yang di-memory-map)
+        
+        Tidak ada parsing teks: setiap baris dipetakan ke satu kunci integer
+        dari kode ketujuh fitur dan label, lalu kunci unik dihitung per
+        potongan baris. Jika jumlah kombinasi vocabulary melebihi int64,
+        baris kode unik dihitung langsung (np.unique per baris, lebih
+        lambat tetapi tanpa overflow). Vocabulary di vocab.json sudah terurut seperti
+        LabelEncoder sehingga parameter model identik dengan training CSV.
+        
+        Returns:
+            (n_samples, train_accuracy)
+        """
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.preprocessing import LabelEncoder
+        
+        dataset = ColumnarDataset.open(dataset_path)
+        columns = self.feature_columns + ['language']
+        for col in columns:
+            if col not in dataset.vocab:
+                raise ValueError(f"Column {col} not found in dataset")
+        print(f"Dataset mapped: {dataset.n_rows} records")
+        
+        dims = [len(dataset.vocab[col]) for col in columns]
+        arrays = [dataset.codes(col) for col in columns]
+        # Tanpa chunksize tetap diproses per blok agar salinan kode sementara kecil
+        step = chunksize or COLUMNAR_BLOCK_ROWS
+        
+        # Kunci integer tunggal hanya jika seluruh kombinasi kode muat di int64
+        flat = math.prod(dims) <= np.iinfo(np.int64).max
+        axis = None if flat else 0
+        
+        keys = np.empty(0 if flat else (0, len(columns)), dtype=np.int64)
+        counts = np.empty(0, dtype=np.int64)
+        for start in range(0, dataset.n_rows, step):
+            codes = [array[start:start + step].astype(np.int64) for array in arrays]
+            chunk_keys = np.ravel_multi_index(codes, dims) if flat else np.column_stack(codes)
+            chunk_keys, chunk_counts = np.unique(chunk_keys, axis=axis, return_counts=True)
+            keys, inverse = np.unique(np.concatenate([keys, chunk_keys]), axis=axis, return_inverse=True)
+            counts = np.bincount(inverse.ravel(), weights=np.concatenate([counts, chunk_counts])).astype(np.int64)
+        print(f"Unique feature rows: {len(keys)}")
+        
+        for col in self.feature_columns:
+            self.encoders[col] = LabelEncoder()
+            self.encoders[col].classes_ = dataset.vocab[col]
+        classes = dataset.vocab['language']
+        
+        unraveled = np.unravel_index(keys, dims) if flat else keys.T
+        X = np.column_stack(unraveled[:-1])
+        y = classes[unraveled[-1]]
+        
+        self.model = MultinomialNB(alpha=1.0)
+        self.model.partial_fit(X, y, classes=classes, sample_weight=counts)
+        
+        self.classes_ = self.model.classes_
+        self.is_trained = True
+        self._build_lookup_tables()
+        
+        return dataset.n_rows, self._weighted_accuracy(X, y, counts)
+    
+    def _weighted_accuracy(self, X, y, weights):
+        """Akurasi training atas baris unik berbobot (sama dengan akurasi per baris)"""
+        correct = self.model.predict(X) == y
+        return float(weights[correct].sum() / weights.sum())
+    
     def predict_proba(self, industry, career_goal, priority, candidate_languages):
         """
         Memprediksi probabilitas untuk kandidat bahasa
@@ -93,41 +302,28 @@ class MLRecommender:
             raise ValueError("Model belum dilatih! Jalankan train() terlebih dahulu")
         
         try:
-            # Encode input features
-            input_encoded = []
-            
-            # Encode kategori input
-            input_encoded.append(
-                self.encoders['industry'].transform([industry])[0]
-            )
-            input_encoded.append(
-                self.encoders['career_goal'].transform([career_goal])[0]
-            )
-            input_encoded.append(
-                self.encoders['priority'].transform([priority])[0]
-            )
-            
-            # Tambahkan fitur default (rata-rata dari training data)
-            # job_demand, learning_curve, salary_level, community_support
-            # Kita gunakan nilai "Medium"/"Medium"/"Medium"/"High" sebagai default
-            default_features = ['High', 'Easy', 'Medium', 'High']
-            for i, col in enumerate(['job_demand', 'learning_curve', 'salary_level', 'community_support']):
-                try:
-                    encoded_val = self.encoders[col].transform([default_features[i]])[0]
-                    input_encoded.append(encoded_val)
-                except:
-                    # Jika nilai tidak ditemukan, gunakan nilai tengah
-                    input_encoded.append(1)
+            # Encode input features via lookup table (tanpa LabelEncoder)
+            with span('ml.encode'):
+                index = self.category_index
+                input_encoded = [
+                    index['industry'][industry],
+                    index['career_goal'][career_goal],
+                    index['priority'][priority]
+                ]
+                
+                # Tambahkan fitur default (sudah di-encode saat train/load)
+                input_encoded.extend(self._default_codes)
+                X_input = np.array(input_encoded).reshape(1, -1)
             
             # Predict probabilitas untuk semua kelas
-            X_input = np.array(input_encoded).reshape(1, -1)
-            probas = self.model.predict_proba(X_input)[0]
+            with span('ml.predict'):
+                probas = self.scorer.predict_proba(X_input)[0]
             
             # Filter hanya kandidat dari rule-based system
             results = {}
             for lang in candidate_languages:
-                if lang in self.classes_:
-                    idx = list(self.classes_).index(lang)
+                idx = self.class_index.get(lang)
+                if idx is not None:
                     # Convert to percentage (0-100)
                     results[lang] = probas[idx] * 100
                 else:
@@ -138,9 +334,233 @@ class MLRecommender:
             
         except Exception as e:
             print(f"Error during prediction: {str(e)}")
-            # Return default scores jika error
+            # Return default scores jika error (dihitung agar skor terdegradasi terlihat di metrik)
+            ML_FALLBACKS.inc(reason=fallback_reason(e))
             return {lang: 50.0 for lang in candidate_languages}
     
+    def predict_proba_batch(self, data, candidate_languages=None):
+        """
+        Memprediksi probabilitas untuk banyak baris input sekaligus
+        
+        Setiap kolom di-encode sekali secara vektor, lalu scorer dipanggil
+        satu kali untuk seluruh matriks input.
+        
+        Args:
+            data: DataFrame atau dictionary berisi array kolom
+                  'industry', 'career_goal', dan 'priority'
+            candidate_languages: (Opsional) sequence berisi set bahasa
+                  kandidat untuk setiap baris
+            
+        Returns:
+            (scores, candidate_mask)
+            - scores: array (n_rows, n_classes) skor 0-100, kolom sesuai
+              urutan self.classes_. Baris dengan kategori yang tidak dikenal
+              mendapat skor default 50.0 seperti pada predict_proba()
+            - candidate_mask: array boolean (n_rows, n_classes), True jika
+              kelas termasuk kandidat baris tersebut
+        """
+        if not self.is_trained:
+            raise ValueError("Model belum dilatih! Jalankan train() terlebih dahulu")
+        
+        n_rows = len(data['industry'])
+        n_classes = len(self.classes_)
+        X = np.empty((n_rows, len(self.feature_columns)), dtype=np.intp)
+        valid = np.ones(n_rows, dtype=bool)
+        
+        # Encode kategori input: satu operasi per kolom
+        for j, col in enumerate(['industry', 'career_goal', 'priority']):
+            codes, known = self._encode_column(col, data[col])
+            X[:, j] = codes
+            valid &= known
+        
+        # Fitur default sama untuk semua baris
+        X[:, 3:] = self._default_codes
+        
+        scores = np.full((n_rows, n_classes), 50.0)
+        if valid.any():
+            scores[valid] = self.scorer.predict_proba(X[valid]) * 100
+        n_unknown = n_rows - int(valid.sum())
+        if n_unknown:
+            ML_FALLBACKS.inc(n_unknown, reason='unknown_category')
+        
+        # Mask kandidat per baris
+        if candidate_languages is None:
+            candidate_mask = np.ones((n_rows, n_classes), dtype=bool)
+        else:
+            candidate_mask = np.zeros((n_rows, n_classes), dtype=bool)
+            row_masks = {}
+            for row, langs in enumerate(candidate_languages):
+                key = frozenset(langs)
+                if key not in row_masks:
+                    mask = np.zeros(n_classes, dtype=bool)
+                    mask[[self.class_index[lang] for lang in key if lang in self.class_index]] = True
+                    row_masks[key] = mask
+                candidate_mask[row] = row_masks[key]
+        
+        return scores, candidate_mask
+    
+    def _build_lookup_tables(self):
+        """
+        Membangun dictionary kategori -> index untuk setiap kolom fitur
+        dan kelas -> posisi kolom probabilitas
+        
+        Dipanggil setelah train() dan load_model(). Jika estimator sklearn
+        tersedia (setelah training atau dari pickle lama), vocabulary dan
+        parameter Naive Bayes diekspor darinya; jika model dimuat dari .npz,
+        keduanya sudah terisi dari file.
+        """
+        if self.model is not None:
+            self.vocab = {col: encoder.classes_ for col, encoder in self.encoders.items()}
+            self.nb_state = {
+                'alpha': float(self.model.alpha),
+                'class_count': self.model.class_count_,
+                'feature_count': self.model.feature_count_,
+                'class_log_prior': self.model.class_log_prior_,
+                'feature_log_prob': self.model.feature_log_prob_
+            }
+        
+        self.scorer = NaiveBayesScorer(
+            self.classes_, self.nb_state['class_log_prior'], self.nb_state['feature_log_prob']
+        )
+        self.category_index = {
+            col: {cat: i for i, cat in enumerate(classes.tolist())}
+            for col, classes in self.vocab.items()
+        }
+        # Vocabulary terurut + kode asli untuk encode vektor dengan searchsorted;
+        # kategori baru dari partial_fit() ditambahkan di akhir vocabulary
+        self._sorted_vocab = {}
+        for col, classes in self.vocab.items():
+            order = np.argsort(classes, kind='stable')
+            self._sorted_vocab[col] = (classes[order], order)
+        self.class_index = {lang: i for i, lang in enumerate(list(self.classes_))}
+        
+        # Fitur default (job_demand, learning_curve, salary_level, community_support)
+        # Kita gunakan nilai "High"/"Easy"/"Medium"/"High" sebagai default;
+        # jika nilai tidak ditemukan, gunakan nilai tengah (1)
+        default_features = ['High', 'Easy', 'Medium', 'High']
+        self._default_codes = [
+            self.category_index[col].get(default_features[i], 1)
+            for i, col in enumerate(['job_demand', 'learning_curve', 'salary_level', 'community_support'])
+        ]
+    
+    def _encode_column(self, col, values):
+        """
+        Encode satu kolom secara vektor
+        
+        Nilai bukan teks (mis. NaN/None untuk jawaban kosong) tidak dapat
+        dibandingkan dengan vocabulary, sehingga langsung dianggap tidak dikenal.
+        
+        Returns:
+            (codes, known) - kode integer dan mask nilai yang dikenal encoder
+        """
+        classes, order = self._sorted_vocab[col]
+        values = np.asarray(values, dtype=object)
+        is_text = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+        
+        codes = np.zeros(len(values), dtype=np.intp)
+        known = np.zeros(len(values), dtype=bool)
+        text = values[is_text]
+        positions = np.searchsorted(classes, text).clip(0, len(classes) - 1)
+        codes[is_text] = order[positions]
+        known[is_text] = classes[positions] == text
+        return codes, known
+    
+    def partial_fit(self, rows, languages, weights=None):
+        """
+        Memperbarui model secara inkremental tanpa training ulang
+        
+        Menambahkan jumlah kemunculan fitur per kelas ke parameter Naive
+        Bayes lalu menghitung ulang log-probabilitas, dengan aritmetika yang
+        sama seperti MultinomialNB.partial_fit. Berjalan dengan NumPy saja
+        sehingga juga bisa dipakai untuk model yang dimuat dari .npz.
+        
+        Kategori atau bahasa yang belum dikenal ditambahkan di akhir
+        vocabulary (kode lama tidak berubah); bahasa baru mulai dari
+        jumlah kemunculan nol.
+        
+        Args:
+            rows: List dictionary fitur. 'industry', 'career_goal', dan
+                  'priority' wajib ada; fitur lain memakai nilai default
+                  yang sama seperti saat prediksi
+            languages: List bahasa target, satu per baris
+            weights: (Opsional) bobot per baris, default 1
+            
+        Returns:
+            Dictionary {n_samples, new_categories, new_classes}
+        """
+        if not self.is_trained:
+            raise ValueError("Model belum dilatih! Jalankan train() terlebih dahulu")
+        if len(rows) != len(languages):
+            raise ValueError("Jumlah baris dan bahasa target harus sama")
+        
+        required = self.feature_columns[:3]
+        for row in rows:
+            missing = [col for col in required if not row.get(col)]
+            if missing:
+                raise ValueError(f"Fitur wajib tidak ada: {', '.join(missing)}")
+        
+        # Estimator sklearn tidak lagi sesuai setelah update; parameter
+        # Naive Bayes dan vocabulary (sudah diekspor saat train/load)
+        # menjadi sumber kebenaran
+        self.model = None
+        self.encoders = {}
+        
+        # Pertumbuhan vocabulary fitur dan kelas
+        new_categories = {}
+        for col in self.feature_columns:
+            index = self.category_index[col]
+            added = list(dict.fromkeys(row[col] for row in rows if col in row and row[col] not in index))
+            if added:
+                self.vocab[col] = np.concatenate([self.vocab[col], np.array(added, dtype=object)])
+                new_categories[col] = added
+        
+        new_classes = list(dict.fromkeys(lang for lang in languages if lang not in self.class_index))
+        if new_classes:
+            n_features = len(self.feature_columns)
+            self.classes_ = np.concatenate([self.classes_, np.array(new_classes, dtype=object)])
+            self.nb_state['class_count'] = np.concatenate(
+                [self.nb_state['class_count'], np.zeros(len(new_classes))]
+            )
+            self.nb_state['feature_count'] = np.vstack(
+                [self.nb_state['feature_count'], np.zeros((len(new_classes), n_features))]
+            )
+        
+        if new_categories or new_classes:
+            self._build_lookup_tables()
+        
+        # Encode baris dan target
+        defaults = dict(zip(self.feature_columns[3:], self._default_codes))
+        X = np.array([
+            [self.category_index[col][row[col]] if col in row else defaults[col]
+             for col in self.feature_columns]
+            for row in rows
+        ], dtype=np.float64).reshape(len(rows), len(self.feature_columns))
+        w = np.ones(len(rows)) if weights is None else np.asarray(weights, dtype=np.float64)
+        Y = np.zeros((len(rows), len(self.classes_)))
+        Y[np.arange(len(rows)), [self.class_index[lang] for lang in languages]] = w
+        
+        # Update jumlah kemunculan lalu hitung ulang log-probabilitas
+        class_count = self.nb_state['class_count'] + Y.sum(axis=0)
+        feature_count = self.nb_state['feature_count'] + Y.T @ X
+        alpha = self.nb_state['alpha']
+        smoothed_fc = feature_count + alpha
+        with np.errstate(divide='ignore'):
+            class_log_prior = np.log(class_count) - np.log(class_count.sum())
+        
+        self.nb_state.update({
+            'class_count': class_count,
+            'feature_count': feature_count,
+            'class_log_prior': class_log_prior,
+            'feature_log_prob': np.log(smoothed_fc) - np.log(smoothed_fc.sum(axis=1, keepdims=True))
+        })
+        self._build_lookup_tables()
+        
+        return {
+            'n_samples': float(w.sum()),
+            'new_categories': new_categories,
+            'new_classes': new_classes
+        }
+    
     def get_feature_importance(self):
         """
         Mendapatkan informasi tentang fitur yang paling berpengaruh
@@ -160,10 +580,15 @@ class MLRecommender:
             'classes': list(self.classes_)
         }
     
-    def save_model(self, filepath='models/trained_model.pkl'):
+    def save_model(self, filepath='models/trained_model.npz'):
         """
         Menyimpan model yang sudah dilatih
         
+        Format: arsip .npz berisi header JSON (format, versi, kolom fitur,
+        kelas, vocabulary, alpha) dan array parameter Naive Bayes. File
+        ditulis ke path sementara lalu di-rename agar pembaca tidak pernah
+        melihat file setengah jadi.
+        
         Args:
             filepath: Path untuk menyimpan model
         """
@@ -171,37 +596,45 @@ class MLRecommender:
             raise ValueError("Model belum dilatih!")
         
         # Buat direktori jika belum ada
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        # Simpan model dan encoders
-        model_data = {
-            'model': self.model,
-            'encoders': self.encoders,
-            'feature_columns': self.feature_columns,
-            'classes': self.classes_
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        header = {
+            'format': MODEL_FORMAT,
+            'version': MODEL_FORMAT_VERSION,
+            'feature_columns': list(self.feature_columns),
+            'classes': [str(lang) for lang in self.classes_],
+            'vocab': {col: [str(cat) for cat in self.vocab[col]] for col in self.feature_columns},
+            'alpha': self.nb_state['alpha'],
+            'metadata': self.metadata
         }
+        arrays = {name: np.asarray(self.nb_state[name], dtype=np.float64) for name in NB_ARRAYS}
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(model_data, f)
+        tmp_path = f"{filepath}.tmp.{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, header=np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8), **arrays)
+        os.replace(tmp_path, filepath)
         
         print(f"Model saved to {filepath}")
     
-    def load_model(self, filepath='models/trained_model.pkl'):
+    def load_model(self, filepath='models/trained_model.npz'):
         """
         Memuat model yang sudah disimpan
         
+        Hanya format .npz yang diterima dan dimuat dengan NumPy saja
+        (allow_pickle=False), sehingga file model tidak pernah dapat
+        mengeksekusi kode. Model pickle lama harus dikonversi sekali dengan
+        migrate_model() / `python ml_model.py --migrate`.
+        
         Args:
             filepath: Path file model
         """
         try:
-            with open(filepath, 'rb') as f:
-                model_data = pickle.load(f)
+            self._load_npz(filepath)
             
-            self.model = model_data['model']
-            self.encoders = model_data['encoders']
-            self.feature_columns = model_data['feature_columns']
-            self.classes_ = model_data['classes']
             self.is_trained = True
+            self._build_lookup_tables()
             
             print(f"Model loaded from {filepath}")
             return True
@@ -210,6 +643,48 @@ class MLRecommender:
             print(f"Error loading model: {str(e)}")
             return False
     
+    def _load_npz(self, filepath):
+        """Memuat header dan parameter dari arsip .npz"""
+        with open(filepath, 'rb') as f:
+            if f.read(2) != b'PK':
+                raise ValueError(
+                    f"{filepath} bukan arsip .npz; model pickle lama harus dikonversi dengan "
+                    "`python ml_model.py --migrate <file.pkl>`"
+                )
+        
+        with np.load(filepath, allow_pickle=False) as data:
+            header = json.loads(data['header'].tobytes().decode('utf-8'))
+            if header.get('format') != MODEL_FORMAT:
+                raise ValueError(f"Format model tidak dikenal: {header.get('format')}")
+            if header.get('version') != MODEL_FORMAT_VERSION:
+                raise ValueError(f"Versi format model tidak didukung: {header.get('version')}")
+            
+            self.nb_state = {name: data[name] for name in NB_ARRAYS}
+        
+        self.nb_state['alpha'] = header['alpha']
+        self.model = None
+        self.encoders = {}
+        self.feature_columns = header['feature_columns']
+        self.classes_ = np.array(header['classes'], dtype=object)
+        self.vocab = {col: np.array(values, dtype=object) for col, values in header['vocab'].items()}
+        self.metadata = header.get('metadata', {})
+    
+    def _load_pickle(self, filepath):
+        """
+        Memuat model format lama (pickle berisi estimator dan LabelEncoder sklearn)
+        
+        pickle.load dapat mengeksekusi kode arbitrer: hanya dipanggil oleh
+        migrate_model() untuk file yang dipercaya, tidak pernah oleh
+        load_model() atau hot reload.
+        """
+        with open(filepath, 'rb') as f:
+            model_data = pickle.load(f)
+        
+        self.model = model_data['model']
+        self.encoders = model_data['encoders']
+        self.feature_columns = model_data['feature_columns']
+        self.classes_ = model_data['classes']
+    
     def explain_prediction(self, language, probability):
         """
         Menjelaskan prediksi ML
@@ -237,6 +712,98 @@ class MLRecommender:
         return explanation
 
 
+def migrate_model(legacy_path='models/trained_model.pkl', model_path='models/trained_model.npz'):
+    """
+    Mengonversi model pickle lama ke format .npz (migrasi satu kali)
+    
+    File pickle dapat mengeksekusi kode saat dibaca: jalankan hanya untuk
+    file model lama yang dipercaya. Setelah migrasi, load_model() hanya
+    membaca file .npz.
+    
+    Returns:
+        Instance MLRecommender hasil migrasi, atau None jika gagal dimuat
+    """
+    ml = MLRecommender()
+    try:
+        ml._load_pickle(legacy_path)
+        ml.is_trained = True
+        ml._build_lookup_tables()
+    except Exception as e:
+        print(f"Error migrating model: {str(e)}")
+        return None
+    
+    with model_lock(model_path):
+        ml.save_model(model_path)
+    return ml
+
+
+@contextmanager
+def model_lock(model_path):
+    """
+    Lock eksklusif antar proses untuk membuat model di model_path
+    
+    Memakai flock pada file <model_path>.lock, sehingga hanya satu worker
+    yang melatih model sementara worker lain menunggu lalu memakai hasilnya.
+    Lock otomatis dilepas jika proses pemegangnya mati.
+    """
+    directory = os.path.dirname(model_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    with open(f"{model_path}.lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_or_train_model(model_path='models/trained_model.npz', dataset_path='data/industry_data.csv'):
+    """
+    Memuat model tersimpan, atau melatih dan menyimpannya jika belum ada
+    Model pickle lama tidak dimuat otomatis; konversi dengan migrate_model()
+    
+    Training hanya dilakukan jika file model tidak ada. File model yang ada
+    tetapi tidak dapat dimuat menghasilkan RuntimeError, bukan training
+    ulang yang menimpanya.
+    
+    Aman dipanggil bersamaan oleh banyak proses: pembuatan model dilindungi
+    model_lock(), dan model ditulis ke file sementara lalu di-rename. Worker
+    yang menunggu lock memuat model yang sudah dibuat worker lain.
+    
+    Args:
+        model_path: Path file model
+        dataset_path: Path dataset untuk training jika model belum ada
+        
+    Returns:
+        Instance MLRecommender yang siap dipakai
+    """
+    def load_existing():
+        # Model yang ada tetapi gagal dimuat (rusak/format salah) tidak
+        # ditimpa dengan training ulang; error diteruskan ke pemanggil
+        ml = MLRecommender()
+        if not ml.load_model(model_path):
+            raise RuntimeError(f"Gagal memuat model dari {model_path}")
+        return ml
+    
+    if os.path.exists(model_path):
+        return load_existing()
+    
+    with model_lock(model_path):
+        # Periksa ulang: model mungkin sudah dibuat selagi menunggu lock
+        if os.path.exists(model_path):
+            return load_existing()
+        
+        ml = MLRecommender()
+        result = ml.train(dataset_path)
+        if not result['success']:
+            raise RuntimeError(f"Gagal melatih model: {result['error']}")
+        ml.save_model(model_path)
+        return ml
+
+
 def train_and_save_model():
     """
     Utility function untuk training model
@@ -250,7 +817,8 @@ def train_and_save_model():
     result = ml.train('data/industry_data.csv')
     
     if result['success']:
-        ml.save_model('models/trained_model.pkl')
+        with model_lock('models/trained_model.npz'):
+            ml.save_model('models/trained_model.npz')
         print("\n✅ Model training completed!")
         print(f"   Accuracy: {result['accuracy']:.2%}")
         print(f"   Samples: {result['n_samples']}")
@@ -263,5 +831,16 @@ def train_and_save_model():
 
 
 if __name__ == "__main__":
-    # Test training
-    train_and_save_model()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Training / migrasi model ML")
+    parser.add_argument('--migrate', nargs='?', const='models/trained_model.pkl', metavar='PKL',
+                        help='Konversi model pickle lama ke models/trained_model.npz')
+    args = parser.parse_args()
+    
+    if args.migrate:
+        if migrate_model(args.migrate, 'models/trained_model.npz') is None:
+            raise SystemExit(1)
+    else:
+        # Test training
+        train_and_save_model()
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+Model Registry
+Memegang versi model ML yang aktif dan memuat ulang model di background
+ketika file model berubah, tanpa restart server. Registry yang sama dipakai
+untuk knowledge base sistem pakar (loader=ExpertSystem).
+
+Perubahan dideteksi dengan stempel (mtime, size) yang murah; isi file
+di-hash sebelum memuat ulang sehingga file yang hanya di-touch tidak memicu
+reload. Stempel dan hash diambil sebelum memuat dan diperiksa ulang
+sesudahnya, sehingga model tidak pernah dicatat dengan hash file yang
+menggantikannya selama dimuat. Versi baru dipasang dengan satu penggantian referensi: request yang
+sudah memegang versi lama tetap selesai dengan model lama.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from answer_table import artifact_stamp, file_digest
+
+
+# Jumlah percobaan memuat jika file terus diganti selama dimuat
+MAX_LOAD_ATTEMPTS = 5
+
+
+@dataclass(frozen=True)
+class ModelVersion:
+    """Satu versi model yang sudah dimuat"""
+    model: Any
+    digest: Optional[str]
+    stamp: tuple
+    loaded_at: float
+
+    @property
+    def version(self):
+        """Versi singkat (16 karakter pertama hash isi file)"""
+        return self.digest[:16] if self.digest else None
+
+
+class ModelRegistry:
+    def __init__(self, model_path, loader, background=True):
+        """
+        Args:
+            model_path: Path file model yang dipantau
+            loader: Callable(model_path) yang mengembalikan model siap pakai
+            background: Jika True, reload dijalankan di thread terpisah;
+                        jika False, reload dijalankan langsung saat check()
+        """
+        self.model_path = model_path
+        self._loader = loader
+        self._background = background
+        self._lock = threading.Lock()
+        self._current = None
+        self._pending = None
+        self._failed_stamp = None
+        self.reloads = 0
+        self.last_error = None
+
+    def current(self, load=True):
+        """
+        Versi model aktif
+
+        Memeriksa perubahan file dan, jika ada, memulai reload tanpa
+        menunggu hasilnya. Versi yang dikembalikan tetap valid walaupun
+        registry kemudian beralih ke versi baru.
+
+        Args:
+            load: Jika True, model dimuat (sinkron) bila belum pernah dimuat;
+                  jika False, mengembalikan None pada kondisi tersebut
+
+        Returns:
+            ModelVersion, atau None jika load=False dan model belum dimuat
+        """
+        active = self._current
+        if active is None:
+            if not load:
+                return None
+            with self._lock:
+                if self._current is None:
+                    self._current = self._load()
+                return self._current
+
+        self.check()
+        return active
+
+    def check(self):
+        """
+        Memulai reload jika file model berubah sejak versi aktif dimuat
+
+        Returns:
+            True jika reload dimulai
+        """
+        active = self._current
+        if active is None:
+            return False
+
+        stamp = artifact_stamp(self.model_path)
+        _, mtime_ns, _ = stamp[0]
+        if mtime_ns is None or stamp == active.stamp or stamp == self._failed_stamp:
+            return False
+
+        with self._lock:
+            if self._pending is not None:
+                return False
+            if self._background:
+                self._pending = threading.Thread(
+                    target=self._reload, args=(stamp,), name='model-reload', daemon=True
+                )
+                self._pending.start()
+                return True
+            self._pending = True
+
+        self._reload(stamp)
+        return True
+
+    def wait(self, timeout=None):
+        """Menunggu reload yang sedang berjalan selesai (untuk script dan test)"""
+        pending = self._pending
+        if isinstance(pending, threading.Thread):
+            pending.join(timeout)
+
+    def status(self):
+        """
+        Ringkasan status untuk halaman admin
+
+        Returns:
+            Dictionary {version, loaded_at, reloads, loading, last_error}
+        """
+        active = self._current
+        return {
+            'version': active.version if active else None,
+            'loaded_at': active.loaded_at if active else None,
+            'reloads': self.reloads,
+            'loading': self._pending is not None,
+            'last_error': self.last_error
+        }
+
+    def _load(self):
+        """
+        Memuat model beserta hash dan stempel file yang dimuat
+
+        Hash dan stempel diambil sebelum memuat lalu dibandingkan dengan
+        kondisi file sesudahnya. Jika file diganti selama dimuat (retrain
+        atau update feedback), model yang dimuat mungkin berasal dari file
+        lama sehingga pemuatan diulang.
+
+        Raises:
+            RuntimeError: File masih berubah setelah MAX_LOAD_ATTEMPTS percobaan
+        """
+        for _ in range(MAX_LOAD_ATTEMPTS):
+            stamp = artifact_stamp(self.model_path)
+            digest = file_digest(self.model_path)
+            model = self._loader(self.model_path)
+            if artifact_stamp(self.model_path) == stamp and file_digest(self.model_path) == digest:
+                return ModelVersion(model=model, digest=digest, stamp=stamp, loaded_at=time.time())
+            print(f"{self.model_path} berubah selama dimuat, memuat ulang")
+
+        raise RuntimeError(f"{self.model_path} terus berubah selama dimuat ({MAX_LOAD_ATTEMPTS} percobaan)")
+
+    def _reload(self, stamp):
+        try:
+            active = self._current
+            if file_digest(self.model_path) == active.digest:
+                # Isi file sama (mis. hanya di-touch): cukup perbarui stempel
+                new_version = ModelVersion(active.model, active.digest, stamp, active.loaded_at)
+            else:
+                new_version = self._load()
+                self.reloads += 1
+
+            with self._lock:
+                self._current = new_version
+            self._failed_stamp = None
+            self.last_error = None
+
+        except Exception as e:
+            # Versi lama tetap aktif; file yang sama tidak dicoba ulang
+            print(f"Error reloading model: {str(e)}")
+            self._failed_stamp = stamp
+            self.last_error = str(e)
+
+        finally:
+            with self._lock:
+                self._pending = None
@@ -0,0 +1,54 @@
+"""
+Naive Bayes Scorer
+Scorer Multinomial Naive Bayes berbasis NumPy murni dari tabel log-probabilitas
+yang sudah dipelajari, sehingga scoring tidak perlu mengimpor scikit-learn
+"""
+
+import numpy as np
+
+
+class NaiveBayesScorer:
+    def __init__(self, classes, class_log_prior, feature_log_prob):
+        """
+        Args:
+            classes: Array label kelas (urutan kolom output)
+            class_log_prior: Array (n_classes,) log P(kelas)
+            feature_log_prob: Array (n_classes, n_features) log P(fitur | kelas)
+        """
+        self.classes_ = np.asarray(classes)
+        self.class_log_prior_ = np.asarray(class_log_prior, dtype=np.float64)
+        self.feature_log_prob_ = np.asarray(feature_log_prob, dtype=np.float64)
+
+    @classmethod
+    def from_estimator(cls, model):
+        """
+        Mengekspor parameter dari MultinomialNB yang sudah dilatih
+
+        Args:
+            model: Instance sklearn MultinomialNB yang sudah di-fit
+        """
+        return cls(model.classes_, model.class_log_prior_, model.feature_log_prob_)
+
+    def joint_log_likelihood(self, X):
+        """log P(kelas) + sum_j x_j * log P(fitur_j | kelas) untuk setiap baris"""
+        X = np.asarray(X, dtype=np.float64)
+        return X @ self.feature_log_prob_.T + self.class_log_prior_
+
+    def predict_log_proba(self, X):
+        """Log-probabilitas posterior, dinormalisasi dengan log-sum-exp"""
+        jll = self.joint_log_likelihood(X)
+        max_jll = jll.max(axis=1, keepdims=True)
+        log_prob_x = max_jll + np.log(np.exp(jll - max_jll).sum(axis=1, keepdims=True))
+        return jll - log_prob_x
+
+    def predict_proba(self, X):
+        """
+        Probabilitas posterior, setara dengan MultinomialNB.predict_proba
+
+        Args:
+            X: Array (n_rows, n_features) fitur yang sudah di-encode
+
+        Returns:
+            Array (n_rows, n_classes)
+        """
+        return np.exp(self.predict_log_proba(X))
@@ -0,0 +1,108 @@
+"""
+Result Cache
+Cache LRU dengan TTL untuk hasil rekomendasi hybrid per kombinasi input
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    def __init__(self, max_size=128, ttl=3600, clock=time.monotonic):
+        """
+        Args:
+            max_size: Jumlah entri maksimum sebelum entri terlama dibuang
+            ttl: Umur maksimum entri dalam detik (None = tidak kedaluwarsa)
+            clock: Fungsi waktu (bisa diganti untuk testing)
+        """
+        if max_size < 1:
+            raise ValueError("max_size minimal 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """
+        Mengambil hasil dari cache
+
+        Returns:
+            Nilai tersimpan, atau None jika tidak ada / sudah kedaluwarsa
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = item
+            if self.ttl is not None and self._clock() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def record_miss(self):
+        """Mencatat miss tanpa lookup (mis. kunci belum dapat dibentuk karena model belum dimuat)"""
+        with self._lock:
+            self.misses += 1
+
+    def put(self, key, value):
+        """Menyimpan hasil; membuang entri yang paling lama tidak dipakai jika penuh"""
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Mengambil hasil dari cache atau menghitungnya dengan compute()
+
+        Args:
+            key: Kunci cache
+            compute: Callable tanpa argumen yang menghasilkan nilai
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Mengosongkan cache (statistik tetap dipertahankan)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Statistik cache untuk monitoring
+
+        Returns:
+            Dictionary hits, misses, evictions, expirations, size, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
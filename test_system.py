@@ -11,6 +11,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from expert_system import ExpertSystem
 from ml_model import MLRecommender
+from answer_table import AnswerTable, compute_fingerprint
+from hybrid_recommender import HybridRecommender, blend_scores
+from result_cache import ResultCache
 
 
 def test_expert_system():
@@ -153,6 +156,18 @@ def test_hybrid_system():
         print(f"      ML Score: {ml_s:.1f}")
         print(f"      Final: {score:.1f}")
     
+    # Engine headless harus memberi hasil yang sama
+    result = HybridRecommender(expert=expert, ml_model=ml).recommend(industry, career, priority)
+    assert result.ranked == ranked
+    assert result.top_language == ranked[0][0]
+    
+    # Bobot dapat dikonfigurasi
+    rule_only = HybridRecommender(expert=expert, ml_model=ml, rule_weight=1.0, ml_weight=0.0)
+    rule_ranked = rule_only.recommend(industry, career, priority).ranked
+    assert dict(rule_ranked) == rule_scores
+    assert [score for _, score in rule_ranked] == sorted(rule_scores.values(), reverse=True)
+    print("\n✅ HybridRecommender konsisten dengan perhitungan manual")
+    
     return True
 
 
@@ -179,6 +194,13 @@ def test_language_info():
         else:
             print(f"   ⚠️ No info available")
     
+    # Katalog dibagi bersama: view industri tidak boleh mengubah data dasar
+    ds_info = expert.get_language_info("Python", "Data Science")
+    assert ds_info["industry_specific"] == ds_info["use_cases"]["Data Science"]
+    assert "industry_specific" not in expert.get_language_info("Python", "General")
+    assert expert.get_language_info("Python", "General") is ExpertSystem().get_language_info("Python", "General")
+    print("\n✅ View industri tidak memodifikasi katalog bersama")
+    
     return True
 
 
@@ -221,6 +243,1128 @@ def test_dataset():
         return False
 
 
+def test_compiled_rules():
+    """Test kompilasi knowledge base (indeks bahasa + vektor skor)"""
+    print("\n" + "="*60)
+    print("TEST 6: COMPILED RULE ENGINE")
+    print("="*60)
+    
+    expert = ExpertSystem()
+    
+    print(f"\n📚 Bahasa terindeks: {len(expert.languages)}")
+    
+    checked = 0
+    for industry, rule in expert.rules_industry.items():
+        for career_goal, career in expert.rules_career_goal.items():
+            for priority, prio in expert.rules_beginner_priority.items():
+                candidates, scores, _ = expert.infer(industry, career_goal, priority)
+                
+                # Hitung ulang skor secara langsung dari rule set
+                expected = {}
+                for lang in rule["languages"]:
+                    expected[lang] = 10
+                    if lang in career["boost"]:
+                        expected[lang] += career["score"]
+                    if lang in prio["preferred"]:
+                        expected[lang] += prio["score"]
+                    for data in expert.beginner_complexity.values():
+                        if lang in data["languages"]:
+                            expected[lang] += data["score"]
+                max_score = max(expected.values())
+                expected = {lang: (s / max_score) * 100 for lang, s in expected.items()}
+                
+                assert candidates == set(rule["languages"])
+                assert scores == expected
+                checked += 1
+    
+    print(f"✅ {checked} kombinasi input identik dengan evaluasi rule langsung")
+    
+    return True
+
+
+def test_answer_table():
+    """Test tabel jawaban untuk seluruh kombinasi input"""
+    print("\n" + "="*60)
+    print("TEST 7: PRECOMPUTED ANSWER TABLE")
+    print("="*60)
+    
+    import tempfile
+    
+    expert = ExpertSystem()
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'model.npz')
+        table_path = os.path.join(tmp, 'answer_table.json')
+        ml.save_model(model_path)
+        
+        recommender = HybridRecommender(expert=expert, ml_model=ml)
+        fingerprint = compute_fingerprint(recommender, 'data/industry_data.csv', model_path)
+        AnswerTable.build(recommender, fingerprint).save(table_path)
+        table = AnswerTable.load(table_path, fingerprint)
+        assert table is not None
+        
+        # Setiap entri harus sama dengan pipeline hybrid langsung
+        n_entries = 0
+        for industry in expert.rules_industry:
+            for career_goal in expert.rules_career_goal:
+                for priority in expert.rules_beginner_priority:
+                    candidates, rule_scores, explanations = expert.infer(industry, career_goal, priority)
+                    ml_scores = ml.predict_proba(industry, career_goal, priority, candidates)
+                    entry = table.lookup(industry, career_goal, priority)
+                    
+                    assert entry.candidates == candidates
+                    assert entry.rule_scores == rule_scores
+                    assert entry.ml_scores == ml_scores
+                    assert entry.explanations == explanations
+                    assert sorted(entry.ranked) == sorted(blend_scores(candidates, rule_scores, ml_scores))
+                    n_entries += 1
+        print(f"\n✅ {n_entries} entri identik dengan pipeline hybrid")
+        
+        # Perubahan rule set harus membuat tabel tidak valid
+        expert.rules_career_goal["Magang"]["score"] = 30
+        expert.compile_rules()
+        stale = compute_fingerprint(recommender, 'data/industry_data.csv', model_path)
+        assert AnswerTable.load(table_path, stale) is None
+        print("✅ Tabel otomatis tidak valid setelah rule set berubah")
+    
+    return True
+
+
+def test_ml_batch():
+    """Test batch inference MLRecommender"""
+    print("\n" + "="*60)
+    print("TEST 8: ML BATCH INFERENCE")
+    print("="*60)
+    
+    import numpy as np
+    import pandas as pd
+    from metrics import ML_FALLBACKS
+    
+    expert = ExpertSystem()
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    
+    df = pd.read_csv('data/industry_data.csv')[['industry', 'career_goal', 'priority']]
+    df.loc[0, 'industry'] = "Quantum Computing"  # kategori tidak dikenal
+    candidates = [expert.infer(*row)[0] for row in df.itertuples(index=False)]
+    
+    scores, mask = ml.predict_proba_batch(df, candidates)
+    print(f"\n✅ Output batch: {scores.shape}")
+    
+    classes = list(ml.classes_)
+    for i, row in enumerate(df.itertuples(index=False)):
+        single = ml.predict_proba(*row, candidates[i])
+        for lang, score in single.items():
+            assert abs(scores[i, classes.index(lang)] - score) < 1e-9
+            assert mask[i, classes.index(lang)]
+        assert mask[i].sum() == len(single)
+    
+    print(f"✅ {len(df)} baris identik dengan predict_proba per baris")
+    
+    # Jawaban kosong (NaN/None) mendapat skor default dan tercatat sebagai fallback
+    missing = df.iloc[1:5].reset_index(drop=True)
+    missing.loc[1, 'industry'] = np.nan
+    missing.loc[2, 'career_goal'] = None
+    missing.loc[3, 'priority'] = pd.NA
+    fallbacks = ML_FALLBACKS.value(reason='unknown_category')
+    scores, _ = ml.predict_proba_batch(missing)
+    assert (scores[1:] == 50.0).all()
+    assert not (scores[0] == 50.0).all()
+    assert ML_FALLBACKS.value(reason='unknown_category') == fallbacks + 3
+    print("✅ Jawaban kosong (NaN/None/NA) -> skor default 50.0")
+    
+    return True
+
+
+def test_nb_scorer():
+    """Test scorer NumPy terhadap MultinomialNB.predict_proba"""
+    print("\n" + "="*60)
+    print("TEST 9: NUMPY NAIVE BAYES SCORER")
+    print("="*60)
+    
+    import itertools
+    import numpy as np
+    
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    
+    # Seluruh kombinasi nilai fitur yang mungkin
+    vocab_sizes = [len(ml.category_index[col]) for col in ml.feature_columns]
+    X = np.array(list(itertools.product(*[range(n) for n in vocab_sizes])))
+    
+    expected = ml.model.predict_proba(X)
+    actual = ml.scorer.predict_proba(X)
+    
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected, rtol=1e-12, atol=1e-15)
+    assert list(ml.scorer.classes_) == list(ml.model.classes_)
+    
+    print(f"\n✅ {len(X)} kombinasi fitur setara dengan sklearn")
+    print(f"   Selisih maksimum: {np.abs(actual - expected).max():.2e}")
+    
+    return True
+
+
+def test_result_cache():
+    """Test cache LRU + TTL untuk hasil rekomendasi"""
+    print("\n" + "="*60)
+    print("TEST 10: RESULT CACHE")
+    print("="*60)
+    
+    now = [0.0]
+    cache = ResultCache(max_size=2, ttl=60, clock=lambda: now[0])
+    
+    key_a = ("Web Development", "Kerja cepat", "Banyak lowongan", "model-v1", "rules-v1")
+    key_b = ("Data Science", "Magang", "Mudah dipelajari", "model-v1", "rules-v1")
+    key_c = ("Game Development", "Startup", "Gaji tinggi", "model-v1", "rules-v1")
+    
+    calls = []
+    cache.get_or_compute(key_a, lambda: calls.append("a") or "hasil-a")
+    assert cache.get_or_compute(key_a, lambda: calls.append("a") or "hasil-a") == "hasil-a"
+    assert calls == ["a"]
+    
+    # LRU: key_b paling lama tidak dipakai -> dibuang saat key_c masuk
+    cache.put(key_b, "hasil-b")
+    cache.get(key_a)
+    cache.put(key_c, "hasil-c")
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == "hasil-a"
+    
+    # TTL: entri kedaluwarsa setelah 60 detik
+    now[0] = 61.0
+    assert cache.get(key_c) is None
+    
+    # Miss tanpa lookup (model belum dimuat) tetap tercatat
+    cache.record_miss()
+    
+    stats = cache.stats()
+    print(f"\n📊 Stats: {stats}")
+    assert stats['hits'] == 3
+    assert stats['misses'] == 4
+    assert stats['evictions'] == 1
+    assert stats['expirations'] == 1
+    print("✅ LRU eviction, TTL, dan counter berjalan benar")
+    
+    return True
+
+
+def test_api_server():
+    """Test endpoint HTTP JSON (ASGI) tanpa menjalankan server"""
+    print("\n" + "="*60)
+    print("TEST 11: JSON API SERVER")
+    print("="*60)
+    
+    import asyncio
+    import json
+    from api_server import RecommendationService, create_app
+    
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    recommender = HybridRecommender(ml_model=ml)
+    app = create_app(lambda: RecommendationService(recommender))
+    
+    def call(method, path, query=b'', body=b''):
+        messages = []
+        
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        
+        async def send(message):
+            messages.append(message)
+        
+        scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query}
+        asyncio.run(app(scope, receive, send))
+        return messages[0]['status'], json.loads(messages[1]['body'])
+    
+    status, payload = call('GET', '/recommend',
+                           b'industry=Backend+Development&career_goal=Startup&priority=Gaji+tinggi')
+    expected = recommender.recommend("Backend Development", "Startup", "Gaji tinggi")
+    assert status == 200
+    assert [r['language'] for r in payload['recommendations']] == [lang for lang, _ in expected.ranked]
+    print(f"\n✅ GET /recommend -> {payload['recommendations'][0]['language']}")
+    
+    body = json.dumps({"industry": "Data Science", "career_goal": "Magang",
+                       "priority": "Mudah dipelajari"}).encode()
+    status, payload = call('POST', '/recommend', body=body)
+    assert status == 200 and payload['recommendations'][0]['language'] == "Python"
+    print("✅ POST /recommend")
+    
+    status, payload = call('GET', '/recommend', b'industry=Web+Development')
+    assert status == 400
+    assert call('GET', '/unknown')[0] == 404
+    for industry in (["Data Science"], {"name": "Data Science"}, 1):
+        body = json.dumps({"industry": industry, "career_goal": "Magang",
+                           "priority": "Mudah dipelajari"}).encode()
+        assert call('POST', '/recommend', body=body)[0] == 400
+    assert call('GET', '/recommend', b'\xff\xfe')[0] == 400
+    print(f"✅ Input tidak valid -> 400 ({payload['error']})")
+    
+    # Request yang lambat tidak memblokir event loop worker
+    import time
+    
+    class SlowService(RecommendationService):
+        def handle(self, method, path, query_string=b'', body=b''):
+            if path == '/slow':
+                time.sleep(0.3)
+            return super().handle(method, path, query_string, body)
+    
+    slow_app = create_app(lambda: SlowService(recommender))
+    finished = []
+    
+    async def request(path):
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        
+        async def send(message):
+            if message['type'] == 'http.response.body':
+                finished.append(path)
+        
+        await slow_app({'type': 'http', 'method': 'GET', 'path': path, 'query_string': b''}, receive, send)
+    
+    async def concurrent():
+        slow = asyncio.ensure_future(request('/slow'))
+        await asyncio.sleep(0.05)
+        await request('/health')
+        await slow
+    
+    slow_app.get_service()
+    asyncio.run(concurrent())
+    assert finished == ['/health', '/slow'], finished
+    print("✅ Request lambat tidak memblokir /health")
+    
+    return True
+
+
+def test_bulk_recommend():
+    """Test rekomendasi massal multi-proses dari file CSV"""
+    print("\n" + "="*60)
+    print("TEST 12: BULK RECOMMENDATION")
+    print("="*60)
+    
+    import tempfile
+    import pandas as pd
+    from bulk_recommend import bulk_recommend
+    
+    recommender = HybridRecommender(model_path='models/trained_model.npz')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, 'students.csv')
+        output_path = os.path.join(tmp, 'recommendations.csv')
+        
+        students = pd.read_csv('data/industry_data.csv')[['industry', 'career_goal', 'priority']]
+        students.insert(0, 'student_id', range(len(students)))
+        students.to_csv(input_path, index=False)
+        
+        n_rows = bulk_recommend(input_path, output_path, workers=2, chunk_size=10)
+        output = pd.read_csv(output_path, dtype=str, keep_default_na=False)
+        
+        assert n_rows == len(students) == len(output)
+        assert list(output['student_id']) == [str(i) for i in range(len(students))]
+        
+        for row in output.itertuples(index=False):
+            result = recommender.recommend(row.industry, row.career_goal, row.priority)
+            assert row.ranking.split(';') == [lang for lang, _ in result.ranked]
+        
+        print(f"\n✅ {n_rows} baris, urutan dan ranking sama dengan pipeline hybrid")
+    
+    return True
+
+
+def test_chunked_training():
+    """Test training streaming per chunk (partial_fit) vs training penuh"""
+    print("\n" + "="*60)
+    print("TEST 13: CHUNKED TRAINING")
+    print("="*60)
+    
+    import numpy as np
+    
+    full = MLRecommender()
+    full_result = full.train('data/industry_data.csv')
+    
+    chunked = MLRecommender()
+    chunked_result = chunked.train('data/industry_data.csv', chunksize=8)
+    
+    assert chunked_result['success']
+    assert chunked_result['n_samples'] == full_result['n_samples']
+    assert chunked_result['accuracy'] == full_result['accuracy']
+    assert np.array_equal(chunked.model.feature_count_, full.model.feature_count_)
+    assert np.array_equal(chunked.model.feature_log_prob_, full.model.feature_log_prob_)
+    assert np.array_equal(chunked.model.class_log_prior_, full.model.class_log_prior_)
+    for col in full.feature_columns:
+        assert list(chunked.encoders[col].classes_) == list(full.encoders[col].classes_)
+    
+    
+    # Sel kosong dan "NA" diperlakukan sama pada kedua jalur (kategori teks)
+    import tempfile
+    import pandas as pd
+    
+    df = pd.read_csv('data/industry_data.csv', dtype=str, keep_default_na=False)
+    df.loc[0, 'job_demand'] = ''
+    df.loc[1, 'salary_level'] = 'NA'
+    with tempfile.TemporaryDirectory() as tmp:
+        blank_path = os.path.join(tmp, 'blank.csv')
+        df.to_csv(blank_path, index=False)
+        full_blank = MLRecommender()
+        assert full_blank.train(blank_path)['success']
+        chunked_blank = MLRecommender()
+        assert chunked_blank.train(blank_path, chunksize=8)['success']
+    
+    assert '' in full_blank.category_index['job_demand']
+    assert 'NA' in full_blank.category_index['salary_level']
+    assert np.array_equal(chunked_blank.model.feature_count_, full_blank.model.feature_count_)
+    assert np.array_equal(chunked_blank.model.feature_log_prob_, full_blank.model.feature_log_prob_)
+    for col in full.feature_columns:
+        assert list(chunked_blank.encoders[col].classes_) == list(full_blank.encoders[col].classes_)
+    
+    print(f"\n✅ Parameter model identik (chunk 8 baris, {chunked_result['n_samples']} records, termasuk sel kosong)")
+    
+    return True
+
+
+def test_columnar_dataset():
+    """Test dataset kolom biner (memory-mapped) sebagai input training"""
+    print("\n" + "="*60)
+    print("TEST 14: COLUMNAR DATASET")
+    print("="*60)
+    
+    import tempfile
+    import numpy as np
+    import pandas as pd
+    from dataset_store import ColumnarDataset, convert_csv, is_columnar
+    
+    df = pd.read_csv('data/industry_data.csv')
+    full = MLRecommender()
+    full_result = full.train('data/industry_data.csv')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cols_path = os.path.join(tmp, 'industry_data.cols')
+        convert_csv('data/industry_data.csv', cols_path, chunksize=10)
+    
+        assert is_columnar(cols_path)
+        assert not is_columnar('data/industry_data.csv')
+    
+        dataset = ColumnarDataset.open(cols_path)
+        assert dataset.n_rows == len(df)
+        assert isinstance(dataset.codes('language'), np.memmap)
+        assert dataset.codes('industry').dtype == np.int8
+        for col in df.columns:
+            assert list(dataset.decode(col)) == list(df[col])
+    
+        for chunksize in (None, 7):
+            columnar = MLRecommender()
+            result = columnar.train(cols_path, chunksize=chunksize)
+    
+            assert result['success']
+            assert result['n_samples'] == full_result['n_samples']
+            assert result['accuracy'] == full_result['accuracy']
+            assert np.array_equal(columnar.model.feature_count_, full.model.feature_count_)
+            assert np.array_equal(columnar.model.class_log_prior_, full.model.class_log_prior_)
+            for col in full.feature_columns:
+                assert list(columnar.encoders[col].classes_) == list(full.encoders[col].classes_)
+        
+        # Vocabulary besar: jumlah kombinasi kode melebihi int64 (250^8 > 2^63)
+        wide_csv = os.path.join(tmp, 'wide.csv')
+        pd.DataFrame({
+            col: [f"{col}-{i % 250:03d}" for i in range(300)] for col in df.columns
+        }).to_csv(wide_csv, index=False)
+        wide_cols = os.path.join(tmp, 'wide.cols')
+        convert_csv(wide_csv, wide_cols, chunksize=100)
+        
+        wide_full = MLRecommender()
+        assert wide_full.train(wide_csv)['success']
+        for chunksize in (None, 70):
+            wide = MLRecommender()
+            result = wide.train(wide_cols, chunksize=chunksize)
+            assert result['success'] and result['n_samples'] == 300
+            assert np.array_equal(wide.model.class_count_, wide_full.model.class_count_)
+            assert np.array_equal(wide.model.feature_count_, wide_full.model.feature_count_)
+    
+    print(f"\n✅ Training dari dataset kolom identik dengan CSV ({dataset.n_rows} records)")
+    
+    return True
+
+
+def test_model_format():
+    """Test format model .npz (tanpa pickle) dan migrasi dari pickle lama"""
+    print("\n" + "="*60)
+    print("TEST 15: MODEL FORMAT")
+    print("="*60)
+    
+    import pickle
+    import subprocess
+    import tempfile
+    import numpy as np
+    from ml_model import migrate_model
+    
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    
+    inputs = {
+        'industry': ['Web Development', 'Data Science', 'Game Development'],
+        'career_goal': ['Kerja cepat', 'Magang', 'Startup'],
+        'priority': ['Banyak lowongan', 'Mudah dipelajari', 'Gaji tinggi']
+    }
+    expected, _ = ml.predict_proba_batch(inputs)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'model.npz')
+        ml.save_model(model_path)
+        
+        loaded = MLRecommender()
+        assert loaded.load_model(model_path)
+        assert loaded.model is None
+        assert list(loaded.classes_) == list(ml.classes_)
+        assert np.array_equal(loaded.predict_proba_batch(inputs)[0], expected)
+        for name in ('class_count', 'feature_count', 'feature_log_prob'):
+            assert np.array_equal(loaded.nb_state[name], ml.nb_state[name])
+        
+        # Dapat dimuat dengan NumPy saja (tanpa sklearn/pandas)
+        code = (
+            "import sys; from ml_model import MLRecommender; "
+            f"assert MLRecommender().load_model({model_path!r}); "
+            "assert 'sklearn' not in sys.modules and 'pandas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True)
+        
+        # Model pickle lama hanya dibaca lewat migrasi eksplisit
+        legacy_path = os.path.join(tmp, 'trained_model.pkl')
+        with open(legacy_path, 'wb') as f:
+            pickle.dump({
+                'model': ml.model,
+                'encoders': ml.encoders,
+                'feature_columns': ml.feature_columns,
+                'classes': ml.classes_
+            }, f)
+        assert not MLRecommender().load_model(legacy_path)
+        
+        migrated_path = os.path.join(tmp, 'trained_model.npz')
+        migrated = migrate_model(legacy_path, migrated_path)
+        assert np.array_equal(migrated.predict_proba_batch(inputs)[0], expected)
+        assert MLRecommender().load_model(migrated_path)
+        
+        # Pickle berbahaya dengan ekstensi .npz tidak pernah di-unpickle
+        marker = os.path.join(tmp, 'executed')
+        
+        class Payload:
+            def __reduce__(self):
+                return (open, (marker, 'w'))
+        
+        evil_path = os.path.join(tmp, 'evil.npz')
+        with open(evil_path, 'wb') as f:
+            pickle.dump(Payload(), f)
+        assert not MLRecommender().load_model(evil_path)
+        assert not os.path.exists(marker)
+        
+        # File bukan model ditolak tanpa mengeksekusi apa pun
+        bogus_path = os.path.join(tmp, 'bogus.npz')
+        np.savez(bogus_path, header=np.frombuffer(b'{"format": "other"}', dtype=np.uint8))
+        assert not MLRecommender().load_model(bogus_path)
+    
+    print("\n✅ Format .npz identik dengan model terlatih; pickle hanya dibaca lewat migrasi")
+    
+    return True
+
+
+def test_model_registry():
+    """Test hot reload model: versi baru dimuat di background lalu ditukar"""
+    print("\n" + "="*60)
+    print("TEST 16: MODEL REGISTRY (HOT RELOAD)")
+    print("="*60)
+    
+    import tempfile
+    import pandas as pd
+    from answer_table import artifact_stamp, file_digest
+    from model_registry import ModelRegistry
+    
+    def loader(path):
+        ml = MLRecommender()
+        if not ml.load_model(path):
+            raise RuntimeError(f"Gagal memuat {path}")
+        return ml
+    
+    candidates = {"Python", "JavaScript", "PHP"}
+    args = ("Web Development", "Kerja cepat", "Banyak lowongan", candidates)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'model.npz')
+        ml_v1 = MLRecommender()
+        ml_v1.train('data/industry_data.csv')
+        ml_v1.save_model(model_path)
+        
+        registry = ModelRegistry(model_path, loader)
+        assert registry.current(load=False) is None
+        v1 = registry.current()
+        assert v1.version is not None
+        
+        # File hanya di-touch: tidak ada reload
+        os.utime(model_path, ns=(v1.stamp[0][1] + 10**9,) * 2)
+        assert registry.check()
+        registry.wait(10)
+        assert registry.reloads == 0
+        assert registry.current().model is v1.model
+        
+        # Retrain dengan dataset berbeda lalu ganti file
+        subset_path = os.path.join(tmp, 'subset.csv')
+        pd.read_csv('data/industry_data.csv').iloc[::2].to_csv(subset_path, index=False)
+        ml_v2 = MLRecommender()
+        ml_v2.train(subset_path)
+        ml_v2.save_model(model_path)
+        
+        in_flight = registry.current()
+        registry.wait(10)
+        v2 = registry.current()
+        
+        assert registry.reloads == 1
+        assert v2.version != v1.version
+        assert v2.model.predict_proba(*args) == ml_v2.predict_proba(*args)
+        # Request yang sudah memegang versi lama tetap memakai model lama
+        assert in_flight.model.predict_proba(*args) == ml_v1.predict_proba(*args)
+        
+        # File rusak: versi aktif dipertahankan dan error dicatat
+        with open(model_path, 'wb') as f:
+            f.write(b'PK-not-a-model')
+        registry.check()
+        registry.wait(10)
+        assert registry.current() is v2
+        assert registry.status()['last_error']
+        assert not registry.check()
+        
+        # File diganti selama dimuat: model dan hash harus dari file yang sama
+        ml_v1.save_model(model_path)
+        replaced = []
+        
+        def racing_loader(path):
+            ml = loader(path)
+            if not replaced:
+                replaced.append(True)
+                ml_v2.save_model(path)
+            return ml
+        
+        racing = ModelRegistry(model_path, racing_loader).current()
+        assert racing.digest == file_digest(model_path)
+        assert racing.model.predict_proba(*args) == ml_v2.predict_proba(*args)
+        assert racing.stamp == artifact_stamp(model_path)
+    
+    print(f"\n✅ Reload {v1.version} -> {v2.version} tanpa restart")
+    
+    return True
+
+
+def _concurrent_load_worker(args):
+    """Worker untuk test_concurrent_training (dijalankan di proses terpisah)"""
+    model_path, marker_path = args
+    import time
+    from ml_model import load_or_train_model
+    
+    original_train = MLRecommender.train
+    
+    def counting_train(self, *train_args, **train_kwargs):
+        with open(marker_path, 'a') as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.5)  # perlebar jendela balapan antar worker
+        return original_train(self, *train_args, **train_kwargs)
+    
+    MLRecommender.train = counting_train
+    ml = load_or_train_model(model_path, 'data/industry_data.csv')
+    return ml.predict_proba("Web Development", "Kerja cepat", "Banyak lowongan", {"Python", "JavaScript"})
+
+
+def test_concurrent_training():
+    """Test beberapa proses start bersamaan tanpa model: hanya satu yang melatih"""
+    print("\n" + "="*60)
+    print("TEST 17: CONCURRENT FIRST-BOOT TRAINING")
+    print("="*60)
+    
+    import multiprocessing
+    import tempfile
+    
+    n_workers = 4
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'models', 'trained_model.npz')
+        marker_path = os.path.join(tmp, 'trained.txt')
+        
+        with multiprocessing.get_context('spawn').Pool(n_workers) as pool:
+            results = pool.map(_concurrent_load_worker, [(model_path, marker_path)] * n_workers)
+        
+        with open(marker_path) as f:
+            trainers = f.read().split()
+        
+        assert len(trainers) == 1
+        assert all(result == results[0] for result in results)
+        assert os.path.exists(model_path)
+        assert not [name for name in os.listdir(os.path.dirname(model_path)) if '.tmp.' in name]
+        
+        # Model rusak: error diteruskan, file tidak ditimpa training ulang
+        from ml_model import load_or_train_model
+        with open(model_path, 'wb') as f:
+            f.write(b'PK-rusak')
+        try:
+            load_or_train_model(model_path, 'data/industry_data.csv')
+            assert False, "model rusak harus menghasilkan error"
+        except RuntimeError:
+            pass
+        with open(model_path, 'rb') as f:
+            assert f.read() == b'PK-rusak'
+    
+    print(f"\n✅ {n_workers} proses, training hanya dijalankan 1 kali; model rusak tidak ditimpa")
+    
+    return True
+
+
+def test_infer_all():
+    """Test evaluasi seluruh rule base sebagai tensor NumPy"""
+    print("\n" + "="*60)
+    print("TEST 18: VECTORIZED RULE EVALUATION")
+    print("="*60)
+    
+    import numpy as np
+    
+    expert = ExpertSystem()
+    scores, axes = expert.infer_all()
+    
+    assert list(axes) == ['industry', 'career_goal', 'priority', 'language']
+    assert scores.shape == tuple(len(labels) for labels in axes.values())
+    
+    # Setiap sel harus sama persis dengan infer() untuk kombinasi tersebut
+    for i, industry in enumerate(axes['industry']):
+        for c, career_goal in enumerate(axes['career_goal']):
+            for p, priority in enumerate(axes['priority']):
+                candidates, rule_scores, _ = expert.infer(industry, career_goal, priority)
+                cell = scores[i, c, p]
+                assert {axes['language'][l] for l in np.flatnonzero(~np.isnan(cell))} == candidates
+                for lang, score in rule_scores.items():
+                    assert cell[axes['language'].index(lang)] == score
+    
+    assert np.nanmax(scores, axis=-1).max() == 100
+    
+    print(f"\n✅ Tensor {scores.shape} identik dengan infer() per kombinasi")
+    
+    return True
+
+
+def test_tracing():
+    """Test span tracing: no-op saat nonaktif, histogram per tahap saat aktif"""
+    print("\n" + "="*60)
+    print("TEST 19: TRACING")
+    print("="*60)
+    
+    import json
+    import tracing
+    from tracing import Tracer
+    
+    # Nonaktif: span bersama tanpa pencatatan
+    disabled = Tracer(enabled=False)
+    with disabled.span('stage'):
+        pass
+    assert disabled.span('a') is disabled.span('b')
+    assert disabled.stats() == {}
+    
+    # Aktif dengan jam palsu: durasi 1..100 ms
+    now = [0.0]
+    traced = Tracer(enabled=True, clock=lambda: now[0])
+    for ms in range(1, 101):
+        with traced.span('stage'):
+            now[0] += ms / 1000
+    
+    stats = traced.stats()['stage']
+    assert stats['count'] == 100
+    assert round(stats['p50_ms'], 6) == 50
+    assert round(stats['p95_ms'], 6) == 95
+    assert round(stats['p99_ms'], 6) == 99
+    assert round(stats['max_ms'], 6) == 100
+    assert json.loads(traced.to_json())['stages']['stage']['count'] == 100
+    
+    # Pipeline hybrid mencatat setiap tahap pada tracer global
+    ml = MLRecommender()
+    ml.train('data/industry_data.csv')
+    recommender = HybridRecommender(ml_model=ml)
+    
+    previous = tracing.tracer.enabled
+    tracing.tracer.enabled = True
+    tracing.tracer.reset()
+    try:
+        for combo in recommender.input_space():
+            recommender.recommend(*combo)
+        stages = tracing.tracer.stats()
+    finally:
+        tracing.tracer.enabled = previous
+        tracing.tracer.reset()
+    
+    n_inputs = len(recommender.input_space())
+    for stage in ('hybrid.rules', 'hybrid.ml', 'hybrid.blend', 'ml.encode', 'ml.predict'):
+        assert stages[stage]['count'] == n_inputs
+    
+    print(f"\n✅ {len(stages)} tahap tercatat untuk {n_inputs} rekomendasi")
+    for stage, summary in stages.items():
+        print(f"   {stage}: p50 {summary['p50_ms']:.4f} ms, p99 {summary['p99_ms']:.4f} ms")
+    
+    return True
+
+
+def test_metrics():
+    """Test metrik Prometheus: counter, histogram, fallback ML, dan endpoint /metrics"""
+    print("\n" + "="*60)
+    print("TEST 20: PROMETHEUS METRICS")
+    print("="*60)
+    
+    import os
+    import tempfile
+    import metrics
+    from api_server import RecommendationService
+    from metrics import MetricsRegistry
+    
+    # Format exposition
+    local = MetricsRegistry()
+    requests = local.counter('demo_requests_total', 'Demo', ('path',))
+    latency = local.histogram('demo_latency_seconds', 'Demo', buckets=(0.1, 1.0))
+    requests.inc(path='/a "b"')
+    requests.inc(2, path='/a "b"')
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value)
+    
+    text = local.render()
+    assert '# TYPE demo_requests_total counter' in text
+    assert 'demo_requests_total{path="/a \\"b\\""} 3' in text
+    assert 'demo_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'demo_latency_seconds_count 3' in text
+    print("\n✅ Format teks Prometheus valid")
+    
+    metrics.registry.reset()
+    try:
+        # Fallback predict_proba tidak lagi diam-diam
+        ml = MLRecommender()
+        ml.train('data/industry_data.csv')
+        scores = ml.predict_proba("Quantum Computing", "Startup", "Gaji tinggi", {"Python", "Golang"})
+        assert scores == {"Python": 50.0, "Golang": 50.0}
+        ml.predict_proba_batch({
+            'industry': ["Quantum Computing", "Data Science"],
+            'career_goal': ["Startup", "Magang"],
+            'priority': ["Gaji tinggi", "Mudah dipelajari"]
+        })
+        assert metrics.ML_FALLBACKS.value(reason='unknown_category') == 2
+        print("✅ Fallback skor 50.0 tercatat di spk_ml_fallback_total")
+        
+        # Traffic API: tabel/cache, top-1, latensi, dan endpoint /metrics
+        service = RecommendationService(HybridRecommender(ml_model=ml))
+        query = b'industry=Backend+Development&career_goal=Startup&priority=Gaji+tinggi'
+        for _ in range(3):
+            assert service.handle('GET', '/recommend', query)[0] == 200
+        
+        top1 = service.recommender.recommend("Backend Development", "Startup", "Gaji tinggi").ranked[0][0]
+        assert metrics.REQUESTS.value(source='api', industry="Backend Development",
+                                      career_goal="Startup", priority="Gaji tinggi") == 3
+        assert metrics.TOP1.value(source='api', language=top1) == 3
+        assert metrics.CACHE_LOOKUPS.value(source='api', result='miss') == 1
+        assert metrics.CACHE_LOOKUPS.value(source='api', result='hit') == 2
+        assert metrics.LATENCY.count(source='api') == 3
+        
+        status, text = service.handle('GET', '/metrics')
+        assert status == 200 and isinstance(text, str)
+        assert f'spk_top1_total{{source="api",language="{top1}"}} 3' in text
+        print(f"✅ GET /metrics ({len(text.splitlines())} baris), top-1: {top1}")
+        
+        # Dump ke file
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'spk.prom')
+            assert metrics.registry.write_textfile_if_due(path, interval=60)
+            assert not metrics.registry.write_textfile_if_due(path, interval=60)
+            with open(path, 'r', encoding='utf-8') as f:
+                assert f.read() == metrics.registry.render()
+        print("✅ Metrik ditulis ke file textfile collector")
+    finally:
+        metrics.registry.reset()
+    
+    return True
+
+
+def test_feedback_updates():
+    """Test update model inkremental dari log feedback dan snapshot berversi"""
+    print("\n" + "="*60)
+    print("TEST 21: FEEDBACK ONLINE UPDATE")
+    print("="*60)
+    
+    import copy
+    import os
+    import tempfile
+    import numpy as np
+    from api_server import RecommendationService, load_ml_model
+    from feedback import FeedbackLog, apply_feedback, list_snapshots, rollback, snapshot_path
+    from model_registry import ModelRegistry
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = os.path.join(tmpdir, 'model.npz')
+        log_path = os.path.join(tmpdir, 'feedback.jsonl')
+        snapshot_dir = os.path.join(tmpdir, 'snapshots')
+        
+        ml = MLRecommender()
+        ml.train('data/industry_data.csv')
+        ml.save_model(model_path)
+        
+        # partial_fit NumPy sama dengan MultinomialNB.partial_fit
+        estimator = copy.deepcopy(ml.model)
+        row = {'industry': "Data Science", 'career_goal': "Magang", 'priority': "Gaji tinggi"}
+        X = [[ml.category_index[col][row[col]] for col in ml.feature_columns[:3]] + list(ml._default_codes)]
+        estimator.partial_fit(X, ["Golang"], sample_weight=[3])
+        ml.partial_fit([row], ["Golang"], weights=[3])
+        assert np.allclose(ml.nb_state['feature_log_prob'], estimator.feature_log_prob_)
+        assert np.allclose(ml.nb_state['class_log_prior'], estimator.class_log_prior_)
+        print("\n✅ partial_fit identik dengan MultinomialNB.partial_fit")
+        
+        # Micro-batch: feedback ditolak dilewati, kategori & bahasa baru ditambahkan
+        log = FeedbackLog(log_path)
+        log.append("Data Science", "Magang", "Gaji tinggi", "Golang")
+        log.append("Data Science", "Magang", "Gaji tinggi", "PHP", accepted=False)
+        log.append("Cloud Engineering", "Startup", "Gaji tinggi", "Rust")
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write('{"industry": "Data Sci')  # baris yang masih ditulis
+        
+        info = apply_feedback(model_path, log_path, snapshot_dir)
+        assert info['version'] == 1 and info['applied'] == 2 and info['skipped'] == 1
+        assert info['new_categories'] == {'industry': ["Cloud Engineering"]}
+        assert info['new_classes'] == ["Rust"]
+        assert apply_feedback(model_path, log_path, snapshot_dir) is None
+        
+        updated = MLRecommender()
+        assert updated.load_model(model_path)
+        assert updated.metadata['feedback']['events'] == 2
+        scores = updated.predict_proba("Cloud Engineering", "Startup", "Gaji tinggi", {"Rust", "Python"})
+        assert 0 < scores["Rust"] < 100
+        old_codes = {cat: i for i, cat in enumerate(ml.vocab['industry'])}
+        assert all(updated.category_index['industry'][cat] == i for cat, i in old_codes.items())
+        print(f"✅ Model v1: 2 feedback, kategori & bahasa baru (Rust {scores['Rust']:.1f}%)")
+        
+        # Baris yang tadi belum lengkap diterapkan setelah selesai ditulis
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write('ence", "career_goal": "Magang", "priority": "Gaji tinggi", "language": "Python"}\n')
+        info = apply_feedback(model_path, log_path, snapshot_dir)
+        assert info['version'] == 2 and info['applied'] == 1
+        assert [version for version, _ in list_snapshots(model_path, snapshot_dir)] == [1, 2]
+        
+        rollback(1, model_path, snapshot_dir)
+        restored = MLRecommender()
+        assert restored.load_model(model_path)
+        assert restored.metadata['feedback']['version'] == 1
+        
+        # Update setelah rollback menjadi v3; snapshot v2 tidak ditimpa
+        with open(snapshot_path(model_path, 2, snapshot_dir), 'rb') as f:
+            v2_bytes = f.read()
+        info = apply_feedback(model_path, log_path, snapshot_dir)
+        assert info['version'] == 3 and info['applied'] == 1
+        assert [version for version, _ in list_snapshots(model_path, snapshot_dir)] == [1, 2, 3]
+        with open(snapshot_path(model_path, 2, snapshot_dir), 'rb') as f:
+            assert f.read() == v2_bytes
+        print("✅ Snapshot v1, v2, rollback ke v1, lalu update menjadi v3")
+        
+        # Feedback lewat API dicatat ke log
+        service = RecommendationService(HybridRecommender(ml_model=ml), feedback_log=log)
+        status, _ = service.handle('POST', '/feedback', body=b'{"industry": "Data Science", '
+                                   b'"career_goal": "Magang", "priority": "Gaji tinggi", "language": "Python"}')
+        assert status == 202
+        assert service.handle('POST', '/feedback', body=b'{"industry": "Data Science", '
+                              b'"career_goal": "Magang", "priority": "Gaji tinggi"}')[0] == 400
+        for accepted in (b'"no"', b'0', b'null'):
+            assert service.handle('POST', '/feedback', body=b'{"industry": "Data Science", '
+                                  b'"career_goal": "Magang", "priority": "Gaji tinggi", '
+                                  b'"language": "PHP", "accepted": ' + accepted + b'}')[0] == 400
+        events, _, _ = log.read()
+        assert len(events) == 5 and events[-1]['language'] == "Python"
+        print("✅ POST /feedback -> 202")
+        
+        # Model hasil update feedback dipakai API tanpa restart
+        models = ModelRegistry(model_path, loader=load_ml_model, background=False)
+        service = RecommendationService(HybridRecommender(ml_model=models.current().model),
+                                        feedback_log=log, model_registry=models)
+        query = b'industry=Backend+Development&career_goal=Startup&priority=Gaji+tinggi'
+        
+        def ml_scores():
+            _, payload = service.handle('GET', '/recommend', query)
+            return {r['language']: r['ml_score'] for r in payload['recommendations']}
+        
+        before = ml_scores()
+        assert ml_scores() == before  # hit cache
+        body = (b'{"industry": "Backend Development", "career_goal": "Startup", '
+                b'"priority": "Gaji tinggi", "language": "Golang"}')
+        for _ in range(20):
+            assert service.handle('POST', '/feedback', body=body)[0] == 202
+        apply_feedback(model_path, log_path, snapshot_dir)
+        assert models.check()
+        after = ml_scores()
+        assert models.reloads == 1
+        assert after["Golang"] > before["Golang"]
+        print(f"✅ API memakai model baru: Golang {before['Golang']:.1f} -> {after['Golang']:.1f}")
+    
+    return True
+
+
+def test_knowledge_base():
+    """Test knowledge base dari file: validasi, kompilasi, dan reload saat berubah"""
+    print("\n" + "="*60)
+    print("TEST 22: KNOWLEDGE BASE")
+    print("="*60)
+    
+    import copy
+    import json
+    import tempfile
+    from api_server import RecommendationService
+    from knowledge_base import KNOWLEDGE_BASE_PATH, KnowledgeBaseError, load_knowledge_base, validate
+    from model_registry import ModelRegistry
+    
+    data = load_knowledge_base()
+    expert = ExpertSystem()
+    from_dict = ExpertSystem(knowledge_base=copy.deepcopy(data))
+    assert from_dict.rules_version == expert.rules_version
+    assert from_dict.infer("Web Development", "Startup", "Gaji tinggi") == \
+        expert.infer("Web Development", "Startup", "Gaji tinggi")
+    print(f"\n✅ {KNOWLEDGE_BASE_PATH} valid (rule set {expert.rules_version})")
+    
+    # Kesalahan dilaporkan sekaligus
+    broken = copy.deepcopy(data)
+    broken['rules_industry']["Web Development"]['languages'].append("Rust")
+    del broken['rules_career_goal']["Startup"]['score']
+    broken['rules_beginner_priority']["Gaji tinggi"]['prefered'] = ["Python"]
+    broken['languages']["Python"]['pros'] = "Syntax sederhana"
+    errors = validate(broken)
+    assert len(errors) == 4, errors
+    assert any("'Rust' tidak ada di katalog" in error for error in errors)
+    try:
+        ExpertSystem(knowledge_base=broken)
+        assert False, "knowledge base tidak valid harus ditolak"
+    except KnowledgeBaseError as e:
+        assert e.errors == errors
+    print(f"✅ {len(errors)} kesalahan terdeteksi sekaligus")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        kb_path = os.path.join(tmpdir, 'knowledge_base.json')
+        
+        def write(kb, mtime):
+            with open(kb_path, 'w', encoding='utf-8') as f:
+                json.dump(kb, f, ensure_ascii=False)
+            os.utime(kb_path, (mtime, mtime))
+        
+        write(data, 1_000_000)
+        rules = ModelRegistry(kb_path, loader=ExpertSystem, background=False)
+        ml = MLRecommender()
+        ml.train('data/industry_data.csv')
+        service = RecommendationService(HybridRecommender(expert=rules.current().model, ml_model=ml),
+                                        rules_registry=rules)
+        query = b'industry=Data+Science&career_goal=Magang&priority=Mudah+dipelajari'
+        _, before = service.handle('GET', '/recommend', query)
+        assert [r['language'] for r in before['recommendations']] == ["Python"]
+        
+        # Rule set diubah: dipakai tanpa restart, cache rule lama dikosongkan
+        updated = copy.deepcopy(data)
+        updated['rules_industry']["Data Science"]['languages'].append("Golang")
+        write(updated, 1_000_010)
+        assert rules.check()
+        _, after = service.handle('GET', '/recommend', query)
+        assert {r['language'] for r in after['recommendations']} == {"Python", "Golang"}
+        assert rules.reloads == 1
+        
+        # File tidak valid: ditolak, versi sebelumnya tetap aktif
+        write(broken, 1_000_020)
+        assert rules.check()
+        active = rules.current().model
+        assert rules.status()['last_error'] and 'Rust' in rules.status()['last_error']
+        assert service.handle('GET', '/recommend', query)[1] == after
+        assert active.rules_version == service.recommender.expert.rules_version
+        print("✅ Reload saat file berubah; file tidak valid ditolak")
+    
+    return True
+
+
+def test_rule_index():
+    """Test indeks terbalik bahasa -> aturan pada knowledge base"""
+    print("\n" + "="*60)
+    print("TEST 23: INVERTED RULE INDEX")
+    print("="*60)
+    
+    import copy
+    from knowledge_base import KnowledgeBaseError, load_knowledge_base, validate
+    
+    expert = ExpertSystem()
+    fields = {
+        'rules_industry': 'languages',
+        'rules_career_goal': 'boost',
+        'rules_beginner_priority': 'preferred',
+        'beginner_complexity': 'languages'
+    }
+    
+    # Indeks harus sama dengan menelusuri seluruh rule set
+    for lang in expert.languages:
+        expected = {
+            (rule_set, key)
+            for rule_set, field in fields.items()
+            for key, rule in getattr(expert, rule_set).items()
+            if lang in rule[field]
+        }
+        assert {(rule_set, key) for rule_set, key, _ in expert.rules_for_language(lang)} == expected
+    assert expert.rules_for_language("COBOL") == ()
+    
+    entries = expert.rules_for_language("Python")
+    print(f"\n✅ Python disebut {len(entries)} aturan, mis. {entries[0][0]}.{entries[0][1]}")
+    
+    # Bahasa yang disebut dua kali dalam satu aturan ditolak saat validasi
+    data = load_knowledge_base()
+    duplicated = copy.deepcopy(data)
+    duplicated['rules_career_goal']["Startup"]['boost'].append(
+        duplicated['rules_career_goal']["Startup"]['boost'][0])
+    duplicated['beginner_complexity']["Sangat Cocok"]['languages'] *= 2
+    errors = validate(duplicated)
+    assert len(errors) == 2, errors
+    assert all("disebut lebih dari sekali" in error for error in errors)
+    assert "rules_career_goal.Startup.boost" in errors[0]
+    try:
+        ExpertSystem(knowledge_base=duplicated)
+        assert False, "bahasa duplikat harus ditolak"
+    except KnowledgeBaseError as e:
+        assert e.errors == errors
+    print(f"✅ Bahasa duplikat dalam satu aturan ditolak ({errors[0]})")
+    
+    return True
+
+
+def test_weighted_training():
+    """Test training pada baris unik berbobot sama dengan training per baris"""
+    print("\n" + "="*60)
+    print("TEST 24: WEIGHTED TRAINING")
+    print("="*60)
+    
+    import numpy as np
+    import pandas as pd
+    from sklearn.naive_bayes import MultinomialNB
+    
+    dataset_path = 'data/industry_data.csv'
+    df = pd.read_csv(dataset_path)
+    
+    # Referensi: setiap baris dataset sebagai satu sampel
+    ml = MLRecommender()
+    result = ml.train(dataset_path)
+    X_raw = np.column_stack([ml.encoders[col].transform(df[col]) for col in ml.feature_columns])
+    y_raw = df['language'].values
+    reference = MultinomialNB(alpha=1.0).fit(X_raw, y_raw)
+    
+    for chunksize in (None, 7):
+        weighted = ml if chunksize is None else MLRecommender()
+        if chunksize is not None:
+            result = weighted.train(dataset_path, chunksize=chunksize)
+        model = weighted.model
+        assert result['n_samples'] == len(df)
+        assert list(model.classes_) == list(reference.classes_)
+        for attr in ('class_count_', 'feature_count_', 'feature_log_prob_', 'class_log_prior_'):
+            assert np.allclose(getattr(model, attr), getattr(reference, attr)), attr
+        assert np.array_equal(model.predict_proba(X_raw), reference.predict_proba(X_raw))
+        assert result['accuracy'] == reference.score(X_raw, y_raw)
+    
+    print(f"\n✅ {len(df)} baris: parameter dan predict_proba identik dengan training per baris")
+    
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n" + "="*60)
@@ -232,7 +1376,26 @@ def run_all_tests():
         ("ML Model", test_ml_model),
         ("Hybrid System", test_hybrid_system),
         ("Language Info", test_language_info),
-        ("Dataset", test_dataset)
+        ("Dataset", test_dataset),
+        ("Compiled Rules", test_compiled_rules),
+        ("Answer Table", test_answer_table),
+        ("ML Batch", test_ml_batch),
+        ("NB Scorer", test_nb_scorer),
+        ("Result Cache", test_result_cache),
+        ("API Server", test_api_server),
+        ("Bulk Recommend", test_bulk_recommend),
+        ("Chunked Training", test_chunked_training),
+        ("Columnar Dataset", test_columnar_dataset),
+        ("Model Format", test_model_format),
+        ("Model Registry", test_model_registry),
+        ("Concurrent Training", test_concurrent_training),
+        ("Vectorized Rules", test_infer_all),
+        ("Tracing", test_tracing),
+        ("Prometheus Metrics", test_metrics),
+        ("Feedback Updates", test_feedback_updates),
+        ("Knowledge Base", test_knowledge_base),
+        ("Rule Index", test_rule_index),
+        ("Weighted Training", test_weighted_training)
     ]
     
     results = []
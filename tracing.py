@@ -0,0 +1,174 @@
+"""
+Tracing
+Instrumentasi latensi per tahap pipeline dengan span context manager
+
+Saat nonaktif, span() mengembalikan satu objek no-op bersama sehingga biaya
+di hot path hanya satu pemeriksaan flag. Saat aktif, durasi setiap span
+dicatat ke histogram in-memory per nama tahap (p50/p95/p99) yang dapat
+dibaca dari tab Admin atau di-dump sebagai JSON.
+
+Aktifkan dengan environment variable TRACING=1, atau saat runtime:
+
+    from tracing import tracer
+    tracer.enabled = True
+
+    with tracer.span('hybrid.rules'):
+        ...
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+
+
+# Jumlah sampel terbaru yang disimpan per tahap untuk perhitungan persentil
+MAX_SAMPLES = int(os.environ.get('TRACING_MAX_SAMPLES', 10_000))
+
+
+class _NoopSpan:
+    """Span kosong yang dipakai saat tracing nonaktif"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'start')
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.tracer.clock()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.record(self.name, self.tracer.clock() - self.start)
+        return False
+
+
+class Histogram:
+    def __init__(self, max_samples=MAX_SAMPLES):
+        """
+        Args:
+            max_samples: Jumlah sampel terbaru yang disimpan untuk persentil;
+                         count/total/max tetap dihitung atas semua sampel
+        """
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q, ordered=None):
+        """Persentil nearest-rank (0 < q <= 100) atas sampel tersimpan"""
+        ordered = ordered if ordered is not None else sorted(self.samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self):
+        """Statistik dalam milidetik"""
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else None,
+            'p50_ms': _ms(self.percentile(50, ordered)),
+            'p95_ms': _ms(self.percentile(95, ordered)),
+            'p99_ms': _ms(self.percentile(99, ordered)),
+            'max_ms': self.max * 1000,
+            'total_ms': self.total * 1000
+        }
+
+
+def _ms(seconds):
+    return seconds * 1000 if seconds is not None else None
+
+
+class Tracer:
+    def __init__(self, enabled=False, max_samples=MAX_SAMPLES, clock=time.perf_counter):
+        """
+        Args:
+            enabled: Aktifkan pencatatan span
+            max_samples: Jumlah sampel per tahap untuk persentil
+            clock: Sumber waktu (detik), bisa diganti untuk test
+        """
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self.clock = clock
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def span(self, name):
+        """
+        Context manager yang mengukur durasi blok kode
+
+        Args:
+            name: Nama tahap, mis. 'hybrid.rules' atau 'ui.display_results'
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        """Mencatat satu durasi (detik) untuk tahap `name`"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self.max_samples)
+            histogram.add(seconds)
+
+    def stats(self):
+        """
+        Ringkasan semua tahap, terurut per nama
+
+        Returns:
+            Dictionary {nama tahap: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms, total_ms}}
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            return {name: histogram.summary() for name, histogram in histograms}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def to_json(self):
+        """Statistik sebagai string JSON"""
+        return json.dumps({
+            'enabled': self.enabled,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'stages': self.stats()
+        }, indent=2)
+
+    def dump(self, filepath):
+        """Menyimpan statistik ke file JSON"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+
+
+# Tracer global untuk seluruh proses
+tracer = Tracer(enabled=os.environ.get('TRACING', '0') == '1')
+
+
+def span(name):
+    """Shortcut untuk tracer.span(name) pada tracer global"""
+    return tracer.span(name)
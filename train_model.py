@@ -29,7 +29,7 @@ def main():
     print("\n" + "="*60)
     print("TRAINING SELESAI!")
     print("="*60)
-    print("\n✅ Model berhasil disimpan di models/trained_model.pkl")
+    print("\n✅ Model berhasil disimpan di models/trained_model.npz")
     print("🚀 Anda sekarang dapat menjalankan aplikasi dengan:")
     print("   streamlit run app.py\n")
 
@@ -3,7 +3,6 @@ Utility Functions
 Helper functions untuk visualisasi dan formatting
 """
 
-import pandas as pd
 import streamlit as st
 
 
@@ -64,6 +63,8 @@ def create_score_dataframe(ranked_languages):
     Returns:
         pandas DataFrame
     """
+    import pandas as pd
+    
     df = pd.DataFrame(ranked_languages, columns=['Bahasa', 'Skor'])
     df['Emoji'] = df['Bahasa'].apply(get_language_emoji)
     return df
@@ -144,6 +145,8 @@ def display_comparison_table(ranked_languages, expert_system):
             'Gaji Entry': info.get('avg_salary', 'N/A') if info else 'N/A'
         })
     
+    import pandas as pd
+    
     df = pd.DataFrame(comparison_data)
     st.table(df)
 
@@ -0,0 +1,68 @@
+"""
+Script warmup sebelum server melayani traffic
+Menyiapkan model ML (training hanya jika belum ada, dilindungi file lock)
+dan tabel jawaban, sehingga request pertama tidak menunggu training
+
+Contoh (entrypoint container):
+    python warmup.py && streamlit run app.py
+"""
+
+import argparse
+import sys
+import time
+
+from answer_table import AnswerTable, compute_fingerprint
+from hybrid_recommender import HybridRecommender
+from ml_model import load_or_train_model
+
+
+def warmup(model_path='models/trained_model.npz', dataset_path='data/industry_data.csv',
+           table_path='models/answer_table.json'):
+    """
+    Memastikan model dan tabel jawaban tersedia dan valid
+
+    Aman dijalankan bersamaan oleh beberapa container/worker: hanya satu
+    proses yang melatih model, proses lain menunggu lalu memakai hasilnya.
+
+    Returns:
+        Dictionary {model_version, table_rebuilt, seconds}
+    """
+    start = time.perf_counter()
+
+    ml = load_or_train_model(model_path, dataset_path)
+    recommender = HybridRecommender(ml_model=ml, model_path=model_path, dataset_path=dataset_path)
+
+    fingerprint = compute_fingerprint(recommender, dataset_path, model_path)
+    table = AnswerTable.load(table_path, fingerprint)
+    table_rebuilt = table is None
+    if table_rebuilt:
+        table = AnswerTable.build(recommender, fingerprint)
+        table.save(table_path)
+
+    return {
+        'model_version': fingerprint['model'][:16],
+        'table_rebuilt': table_rebuilt,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Menyiapkan model dan tabel jawaban sebelum serving")
+    parser.add_argument('--model', default='models/trained_model.npz', help='Path model')
+    parser.add_argument('--dataset', default='data/industry_data.csv', help='Dataset jika model perlu dilatih')
+    parser.add_argument('--table', default='models/answer_table.json', help='Path tabel jawaban')
+    args = parser.parse_args()
+
+    try:
+        info = warmup(args.model, args.dataset, args.table)
+    except Exception as e:
+        print(f"❌ Warmup gagal: {str(e)}")
+        sys.exit(1)
+
+    print(f"✅ Model {info['model_version']} siap")
+    print(f"   Tabel jawaban: {'dibangun ulang' if info['table_rebuilt'] else 'valid'}")
+    print(f"   Waktu: {info['seconds']:.2f} detik")
+
+
+if __name__ == "__main__":
+    main()